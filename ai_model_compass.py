@@ -3,14 +3,16 @@
 AI Model Compass v0.9.0
 Discover, download, and run local AI — tailored to your hardware.
 """
-import sys, os, subprocess, json, platform, shutil, time, traceback, math, re
+import sys, os, subprocess, json, platform, shutil, time, traceback, math, re, atexit, functools, shlex, bisect, string, heapq, itertools
+import importlib.util, contextlib
 from pathlib import Path
 
 def _bootstrap():
     if sys.version_info < (3, 8): print("Python 3.8+ required"); sys.exit(1)
-    for imp, pip in {"PyQt6":"PyQt6","psutil":"psutil","requests":"requests","huggingface_hub":"huggingface_hub"}.items():
-        try: __import__(imp)
-        except ImportError:
+    for imp, pip in {"PyQt6":"PyQt6","psutil":"psutil","requests":"requests","huggingface_hub":"huggingface_hub",
+                     "pynvml":"nvidia-ml-py","orjson":"orjson"}.items():
+        # find_spec locates the package without executing its (heavy) top-level code
+        if importlib.util.find_spec(imp) is None:
             print(f"Installing {pip}...")
             for f in [[], ["--user"], ["--break-system-packages"]]:
                 try: subprocess.check_call([sys.executable,"-m","pip","install",pip,"-q"]+f,stdout=subprocess.DEVNULL,stderr=subprocess.DEVNULL); break
@@ -21,9 +23,30 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 import psutil, requests
-from huggingface_hub import hf_hub_download
+def _hf_accel_env():
+    """Pick the download accelerator flag for the installed huggingface_hub (inherited by the download child).
+    Pre-1.0 releases use hf_transfer when it is installed; newer ones download through hf_xet and only warn about
+    HF_HUB_ENABLE_HF_TRANSFER, so they get HF_XET_HIGH_PERFORMANCE instead."""
+    try: from importlib.metadata import version; major = int(version("huggingface_hub").split(".")[0])
+    except Exception: return
+    if major >= 1: os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+    elif importlib.util.find_spec("hf_transfer"): os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+_hf_accel_env()
+from huggingface_hub import HfApi
 import html as html_mod
 import time as _t
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+try:
+    import orjson
+    _loads = orjson.loads
+    def _dumps(o): return orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    _loads = json.loads
+    def _dumps(o): return json.dumps(o, indent=2, ensure_ascii=False)
+# CREATE_NO_WINDOW only exists on Windows; resolve once instead of per call site
+_SUBPROC_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+_POPEN_KW = dict(stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, creationflags=_SUBPROC_FLAGS)
 
 VERSION = "0.9.0"
 APP = "AI Model Compass"
@@ -35,10 +58,31 @@ MODELS_CACHE = CFG_DIR / "models.json"
 MODELS_URL = "https://raw.githubusercontent.com/SysAdminDoc/AI-Model-Compass/main/models.json"
 MODELS_BUNDLED = Path(__file__).parent / "models.json"
 
+# Write-behind: each path keeps only its latest serializer; the file is written once per burst.
+_pending_writes = {}
+def _write_later(path, produce, delay=500):
+    first = path not in _pending_writes
+    _pending_writes[path] = produce
+    if not first: return
+    if QCoreApplication.instance(): QTimer.singleShot(delay, _flush_writes)
+    else: _flush_writes()
+def _flush_writes():
+    while _pending_writes:
+        path, produce = _pending_writes.popitem()
+        try: path.write_text(produce(), encoding="utf-8")
+        except Exception as e: print(f"[{APP}] could not save {path}: {e}", file=sys.stderr)  # no caller left to tell
+atexit.register(_flush_writes)
+
+_cfg = None
 def _load_cfg():
-    try: return json.loads(CFG_FILE.read_text())
-    except: return {}
-def _save_cfg(c): CFG_FILE.write_text(json.dumps(c, indent=2))
+    global _cfg
+    if _cfg is None:
+        try: _cfg = _loads(CFG_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError): _cfg = {}
+    return dict(_cfg)
+def _save_cfg(c):
+    global _cfg
+    _cfg = dict(c); _write_later(CFG_FILE, lambda: _dumps(_cfg))
 
 def _crash(et, ev, tb):
     msg = "".join(traceback.format_exception(et, ev, tb))
@@ -55,37 +99,59 @@ FAV_FILE = CFG_DIR / "favorites.json"
 
 class FavoritesManager:
     _data = None
+    _fav_set = set(); _notes = {}  # hashed snapshots of _data for per-card lookups
+    _version = 0  # bumped on every fav/note change so views can skip rebuilding when nothing changed
     @classmethod
     def _load(cls):
         if cls._data is None:
-            try: cls._data = json.loads(FAV_FILE.read_text())
-            except: cls._data = {}
+            try: cls._data = _loads(FAV_FILE.read_text(encoding="utf-8"))
+            except (OSError, ValueError): cls._data = {}
+            cls._fav_set = {k for k, v in cls._data.items() if v.get("fav")}
+            cls._notes = {k: v["note"] for k, v in cls._data.items() if v.get("note")}
         return cls._data
     @classmethod
-    def _save(cls): FAV_FILE.write_text(json.dumps(cls._data or {}, indent=2))
+    def _save(cls): _write_later(FAV_FILE, lambda: _dumps(cls._data or {}))
     @classmethod
-    def is_fav(cls, name): return cls._load().get(name, {}).get("fav", False)
+    def is_fav(cls, name): cls._load(); return name in cls._fav_set
     @classmethod
     def toggle_fav(cls, name):
         d = cls._load()
         if name not in d: d[name] = {}
-        d[name]["fav"] = not d[name].get("fav", False)
-        cls._save(); return d[name]["fav"]
+        now = d[name]["fav"] = not d[name].get("fav", False)
+        if now: cls._fav_set.add(name)
+        else: cls._fav_set.discard(name)
+        cls._version += 1; cls._save(); return now
     @classmethod
-    def get_note(cls, name): return cls._load().get(name, {}).get("note", "")
+    def get_note(cls, name): cls._load(); return cls._notes.get(name, "")
     @classmethod
     def set_note(cls, name, note):
         d = cls._load()
         if name not in d: d[name] = {}
-        d[name]["note"] = note; cls._save()
+        d[name]["note"] = note
+        if note: cls._notes[name] = note
+        else: cls._notes.pop(name, None)
+        cls._version += 1; cls._save()
     @classmethod
-    def all_favs(cls): return {k: v for k, v in cls._load().items() if v.get("fav")}
+    def all_favs(cls): d = cls._load(); return {k: d[k] for k in d if k in cls._fav_set}
     @classmethod
-    def all_notes(cls): return {k: v.get("note","") for k, v in cls._load().items() if v.get("note")}
+    def all_notes(cls): cls._load(); return dict(cls._notes)
+
+_esc = functools.lru_cache(maxsize=64)(html_mod.escape)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # HARDWARE DETECTION + SPEED ESTIMATION
 # ═══════════════════════════════════════════════════════════════════════════════
+@functools.lru_cache(maxsize=512)
+def _estimate_toks(mem_bw, vram_gb, ram_gb, model_gb, active_gb):
+    """Bandwidth-bound tok/s estimate. Keyed on the hardware figures it reads, so a
+    hardware refresh naturally misses the cache instead of needing a clear."""
+    if model_gb <= 0: return 0
+    compute_gb = active_gb if active_gb is not None else model_gb
+    raw = mem_bw / (compute_gb * 1.15)
+    if vram_gb == 0 or model_gb > vram_gb * 0.95:
+        raw = min(raw, ram_gb * 0.8)
+    return max(1, round(raw))
+
 class HardwareInfo:
     GPU_BW = {
         "4090":1008,"4080 super":736,"4080":717,"4070 ti super":672,"4070 ti":504,
@@ -99,27 +165,52 @@ class HardwareInfo:
         "7900 xtx":960,"7900 xt":800,"7800 xt":624,"7700 xt":432,"7600":288,
         "6950 xt":576,"6900 xt":512,"6800 xt":512,"6700 xt":384,"6600 xt":256,
     }
-
-    def __init__(self):
-        self.cpu_name = "Unknown CPU"; self.cpu_cores = psutil.cpu_count(logical=False) or 1
-        self.cpu_threads = psutil.cpu_count(logical=True) or 1
+    # One alternation, longest keys first, so "3080 ti" wins over "3080" at the same position
+    _BW_RE = re.compile("|".join(re.escape(k) for k in sorted(GPU_BW, key=len, reverse=True)))
+    NVSMI_PATHS = ["nvidia-smi", r"C:\Windows\System32\nvidia-smi.exe",
+                   r"C:\Program Files\NVIDIA Corporation\NVSMI\nvidia-smi.exe"]
+    try: NVSMI_TIMEOUT = float(os.environ.get("AI_COMPASS_NVSMI_TIMEOUT", "3"))
+    except ValueError: NVSMI_TIMEOUT = 3.0
+    _GPU_CACHE_TTL = 30.0
+    _gpu_cache = None  # (monotonic timestamp, [{"name":..., "vram_gb":...}]) from the last nvidia-smi success
+    # Core counts never change at runtime — query once per process
+    _PHYSICAL = psutil.cpu_count(logical=False) or 1
+    _LOGICAL = psutil.cpu_count(logical=True) or 1
+    _MIN_INTERVAL = 2.0
+    _CPUINFO_RE = re.compile(rb"^model name\s*:\s*(.+)$", re.M)
+    _last_refresh = 0.0
+
+    def __init__(self, detect=True):
+        self.cpu_name = "Unknown CPU"; self.cpu_cores = self._PHYSICAL
+        self.cpu_threads = self._LOGICAL
         self.ram_gb = round(psutil.virtual_memory().total / (1024**3), 1)
         self.gpu_name = "No dedicated GPU"; self.vram_gb = 0.0
         self.gpu_vendor = "none"; self.mem_bw = 0
         self.gpu_count = 1; self.gpus = []  # Multi-GPU: list of {"name":..., "vram_gb":...}
         self.multi_gpu = False; self.total_vram_gb = 0.0
         self.os_name = f"{platform.system()} {platform.release()}"
+        self._max_gb = None  # max_model_gb() memo; reset whenever detection rewrites vram/ram
+        if detect: self._detect_all()
+
+    def _detect_all(self):
+        """Slow part of construction (registry/NVML/subprocess probes). Safe to run on a worker thread."""
         self._detect_cpu(); self._detect_gpu(); self._estimate_bw()
-        self._aggregate_gpus()
+        self._aggregate_gpus(); self._last_refresh = time.monotonic(); self._max_gb = None
 
     def refresh(self):
-        """Re-detect all hardware (e.g., after eGPU connect, driver update)."""
+        """Re-detect GPUs (e.g., after eGPU connect, driver update).
+        CPU name and RAM total are static and keep their startup values; calls closer
+        together than _MIN_INTERVAL seconds are ignored. Returns False when rate-limited."""
+        now = time.monotonic()
+        if now - self._last_refresh < self._MIN_INTERVAL: return False
+        self._last_refresh = now
+        HardwareInfo._gpu_cache = None  # an explicit refresh always re-runs nvidia-smi; the TTL is for implicit probes
         self.gpu_name = "No dedicated GPU"; self.vram_gb = 0.0
         self.gpu_vendor = "none"; self.mem_bw = 0
         self.gpu_count = 1; self.gpus = []
         self.multi_gpu = False; self.total_vram_gb = 0.0
-        self.ram_gb = round(psutil.virtual_memory().total / (1024**3), 1)
-        self._detect_gpu(); self._estimate_bw(); self._aggregate_gpus()
+        self._detect_gpu(); self._estimate_bw(); self._aggregate_gpus(); self._max_gb = None
+        return True
 
     def _aggregate_gpus(self):
         """Aggregate multi-GPU VRAM for tiled fit calculations."""
@@ -135,87 +226,140 @@ class HardwareInfo:
     def _detect_cpu(self):
         if sys.platform == "win32":
             try:
-                out = subprocess.check_output("wmic cpu get name", shell=True, text=True, stderr=subprocess.DEVNULL)
-                for ln in out.strip().splitlines():
-                    ln = ln.strip()
-                    if ln and ln.lower() != "name": self.cpu_name = ln; return
-            except: pass
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0") as k:
+                    nm = str(winreg.QueryValueEx(k, "ProcessorNameString")[0]).strip()
+                if nm: self.cpu_name = nm
+            except Exception: self.cpu_name = platform.processor() or "Unknown CPU"
         else:
             try:
-                with open("/proc/cpuinfo") as f:
-                    for ln in f:
-                        if "model name" in ln: self.cpu_name = ln.split(":")[1].strip(); return
-            except: self.cpu_name = platform.processor() or "Unknown"
+                m = self._CPUINFO_RE.search(Path("/proc/cpuinfo").read_bytes())
+                self.cpu_name = m.group(1).decode(errors="replace").strip() if m else (platform.processor() or "Unknown CPU")
+            except OSError: self.cpu_name = platform.processor() or "Unknown"
+
+    def _detect_gpu_nvml(self):
+        """Query NVIDIA GPUs through NVML bindings — no process spawn, no CSV parsing."""
+        try: import pynvml
+        except ImportError: return False
+        try: pynvml.nvmlInit()
+        except Exception: return False
+        try:
+            gpus = []
+            for i in range(pynvml.nvmlDeviceGetCount()):
+                h = pynvml.nvmlDeviceGetHandleByIndex(i)
+                gname = pynvml.nvmlDeviceGetName(h)
+                if isinstance(gname, bytes): gname = gname.decode(errors="replace")
+                gvram = round(pynvml.nvmlDeviceGetMemoryInfo(h).total / (1024**3), 1)
+                gpus.append({"name": gname.strip(), "vram_gb": gvram})
+        except Exception: return False
+        finally:
+            try: pynvml.nvmlShutdown()
+            except Exception: pass
+        if not gpus: return False
+        self.gpus = gpus
+        best = max(gpus, key=lambda g: g["vram_gb"])
+        self.gpu_name = best["name"]; self.vram_gb = best["vram_gb"]; self.gpu_vendor = "nvidia"
+        return True
+
+    def _detect_gpu_smi(self):
+        """nvidia-smi fallback. Bounded by NVSMI_TIMEOUT; successful results are cached for _GPU_CACHE_TTL s."""
+        cached = HardwareInfo._gpu_cache
+        if cached and time.monotonic() - cached[0] < self._GPU_CACHE_TTL:
+            gpus = cached[1]
+        else:
+            gpus = []
+            for p in self.NVSMI_PATHS:
+                try:
+                    # subprocess.run kills the child itself when the timeout expires
+                    res = subprocess.run([p,"--query-gpu=name,memory.total","--format=csv,noheader,nounits"],
+                        capture_output=True, text=True, timeout=self.NVSMI_TIMEOUT,
+                        creationflags=_SUBPROC_FLAGS)
+                except subprocess.TimeoutExpired: break  # hung driver — other paths are the same binary
+                except Exception: continue
+                if res.returncode != 0: continue
+                for ln in res.stdout.splitlines():
+                    parts = ln.split(",")
+                    if len(parts) < 2: continue
+                    try: gpus.append({"name": parts[0].strip(), "vram_gb": round(int(parts[1].strip())/1024, 1)})
+                    except ValueError: continue
+                if gpus: HardwareInfo._gpu_cache = (time.monotonic(), gpus); break
+        if not gpus: return False
+        # Multi-GPU: primary GPU is the one with most VRAM
+        self.gpus = [dict(g) for g in gpus]
+        best = max(self.gpus, key=lambda g: g["vram_gb"])
+        self.gpu_name = best["name"]; self.vram_gb = best["vram_gb"]; self.gpu_vendor = "nvidia"
+        return True
 
     def _detect_gpu(self):
-        for p in ["nvidia-smi", r"C:\Windows\System32\nvidia-smi.exe",
-                   r"C:\Program Files\NVIDIA Corporation\NVSMI\nvidia-smi.exe"]:
-            try:
-                out = subprocess.check_output([p,"--query-gpu=name,memory.total","--format=csv,noheader,nounits"],
-                    text=True, stderr=subprocess.DEVNULL, timeout=5)
-                gpu_lines = [ln.strip() for ln in out.strip().splitlines() if ln.strip()]
-                if gpu_lines:
-                    # Capture all GPUs for multi-GPU support
-                    self.gpus = []
-                    for ln in gpu_lines:
-                        parts = ln.split(",")
-                        if len(parts) >= 2:
-                            gname = parts[0].strip()
-                            gvram = round(int(parts[1].strip())/1024, 1)
-                            self.gpus.append({"name": gname, "vram_gb": gvram})
-                    if self.gpus:
-                        # Primary GPU is the one with most VRAM
-                        best = max(self.gpus, key=lambda g: g["vram_gb"])
-                        self.gpu_name = best["name"]; self.vram_gb = best["vram_gb"]
-                        self.gpu_vendor = "nvidia"; return
-            except: continue
-        if sys.platform == "win32":
-            try:
-                out = subprocess.check_output("wmic path win32_VideoController get name,adapterram /format:csv",
-                    shell=True, text=True, stderr=subprocess.DEVNULL, timeout=5)
-                bn, bv, bven = "", 0, "none"
-                for line in out.strip().splitlines():
-                    parts = [p.strip() for p in line.split(",")]
-                    if len(parts)<3 or parts[1]=="AdapterRAM": continue
-                    try: vr = round(int(parts[1])/(1024**3),1)
-                    except: vr = 0
-                    nm = parts[2]; nl = nm.lower(); ven = "none"
-                    if any(k in nl for k in ["nvidia","geforce","rtx","gtx","quadro"]): ven = "nvidia"
-                    elif any(k in nl for k in ["amd","radeon","rx "]): ven = "amd"
-                    elif "arc" in nl: ven = "intel"
-                    if ven != "none" and vr >= bv: bn, bv, bven = nm, vr, ven
-                    if ven != "none" and vr > 0:
-                        self.gpus.append({"name": nm, "vram_gb": vr})
-                if bn: self.gpu_name = bn; self.vram_gb = bv; self.gpu_vendor = bven
-            except: pass
+        if self._detect_gpu_nvml(): return
+        # Fallback: nvidia-smi (NVML missing or driver without the shared library)
+        if self._detect_gpu_smi(): return
+        if sys.platform == "win32": self._detect_gpu_win()
+
+    # Display adapter device class: one numbered subkey per adapter, holding DriverDesc + memory size
+    _DISPLAY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+
+    def _detect_gpu_win(self):
+        """Vendor-neutral Windows fallback: read adapters straight from the registry (no WMIC process)."""
+        try:
+            import winreg
+            cls_key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, self._DISPLAY_CLASS_KEY)
+        except Exception: return
+        bn, bv, bven = "", 0, "none"
+        with cls_key:
+            i = 0
+            while True:
+                try: sub = winreg.EnumKey(cls_key, i)
+                except OSError: break
+                i += 1
+                if not sub.isdigit(): continue  # skips "Properties"
+                try:
+                    with winreg.OpenKey(cls_key, sub) as k:
+                        nm = str(winreg.QueryValueEx(k, "DriverDesc")[0]).strip()
+                        vb = 0
+                        # qwMemorySize is the 64-bit value (correct above 4 GB); MemorySize is the legacy 32-bit one
+                        for val in ("HardwareInformation.qwMemorySize", "HardwareInformation.MemorySize"):
+                            try: raw = winreg.QueryValueEx(k, val)[0]
+                            except OSError: continue
+                            vb = int.from_bytes(raw[:8], "little") if isinstance(raw, bytes) else int(raw); break
+                except OSError: continue
+                vr = round(vb/(1024**3),1); nl = nm.lower(); ven = "none"
+                if any(k in nl for k in ["nvidia","geforce","rtx","gtx","quadro"]): ven = "nvidia"
+                elif any(k in nl for k in ["amd","radeon","rx "]): ven = "amd"
+                elif "arc" in nl: ven = "intel"
+                if ven != "none" and vr >= bv: bn, bv, bven = nm, vr, ven
+                if ven != "none" and vr > 0:
+                    self.gpus.append({"name": nm, "vram_gb": vr})
+        if bn: self.gpu_name = bn; self.vram_gb = bv; self.gpu_vendor = bven
 
     def _estimate_bw(self):
-        gl = self.gpu_name.lower()
-        for key, bw in self.GPU_BW.items():
-            if key in gl: self.mem_bw = bw; return
+        m = self._BW_RE.search(self.gpu_name.lower())
+        if m: self.mem_bw = self.GPU_BW[m.group(0)]; return
         if self.gpu_vendor == "nvidia": self.mem_bw = 300
         elif self.gpu_vendor == "amd": self.mem_bw = 400
         else: self.mem_bw = 50
 
+    # VRAM lower bounds (GB) and the tier each bound starts
+    _TIER_CUTS = (4, 6, 8, 12, 16, 24)
+    _TIER_NAMES = ("cpu_only", "low", "low_mid", "mid", "mid_high", "high", "ultra")
     @property
-    def tier(self):
-        v = self.vram_gb
-        if v >= 24: return "ultra"
-        if v >= 16: return "high"
-        if v >= 12: return "mid_high"
-        if v >= 8: return "mid"
-        if v >= 6: return "low_mid"
-        if v >= 4: return "low"
-        return "cpu_only"
+    def tier(self): return self._TIER_NAMES[bisect.bisect_right(self._TIER_CUTS, self.vram_gb)]
 
     TIER_LABELS = {"ultra":"Ultra (24 GB+)","high":"High (16 GB)","mid_high":"Mid-High (12 GB)",
                    "mid":"Mid (8 GB)","low_mid":"Low-Mid (6 GB)","low":"Low (4 GB)","cpu_only":"CPU Only"}
     @property
     def tier_label(self): return self.TIER_LABELS.get(self.tier, "Unknown")
 
+    # HTML-safe names for rich-text labels; memoised on the string, so a refresh that renames the GPU just misses
+    @property
+    def gpu_name_html(self): return _esc(self.gpu_name)
+    @property
+    def cpu_name_html(self): return _esc(self.cpu_name)
+
     def max_model_gb(self):
-        if self.vram_gb > 0: return round(self.vram_gb * 0.82, 1)
-        return round(self.ram_gb * 0.55, 1)
+        if self._max_gb is None:
+            self._max_gb = round(self.vram_gb * 0.82, 1) if self.vram_gb > 0 else round(self.ram_gb * 0.55, 1)
+        return self._max_gb
 
     def max_model_gb_multi(self):
         """Max model size using all GPUs combined (tiled/tensor-parallel)."""
@@ -224,12 +368,7 @@ class HardwareInfo:
         return self.max_model_gb()
 
     def estimate_toks(self, model_gb, active_gb=None):
-        if model_gb <= 0: return 0
-        compute_gb = active_gb if active_gb is not None else model_gb
-        raw = self.mem_bw / (compute_gb * 1.15)
-        if self.vram_gb == 0 or model_gb > self.vram_gb * 0.95:
-            raw = min(raw, self.ram_gb * 0.8)
-        return max(1, round(raw))
+        return _estimate_toks(self.mem_bw, self.vram_gb, self.ram_gb, model_gb, active_gb)
 
     def speed_label(self, toks):
         if toks >= 40: return "Blazing fast", "gn"
@@ -263,6 +402,21 @@ class HardwareInfo:
 # ═══════════════════════════════════════════════════════════════════════════════
 # SOFTWARE DETECTION + VERSIONS
 # ═══════════════════════════════════════════════════════════════════════════════
+_OLLAMA_LIST_CACHE = [0.0, None]  # [monotonic stamp, (status, names)]
+@functools.lru_cache(maxsize=1)
+def _ollama_session():
+    """Keep-alive session for the local Ollama API; status checks reuse one connection."""
+    return requests.Session()
+def _ollama_tags(max_age=2.0):
+    """("ok"|"bad"|"down", [model names]) from /api/tags; answers within max_age seconds are reused."""
+    stamp, hit = _OLLAMA_LIST_CACHE
+    if hit and _t.monotonic() - stamp < max_age: return hit
+    try:
+        resp = _ollama_session().get("http://localhost:11434/api/tags", timeout=3)
+        hit = ("ok", [m["name"] for m in resp.json().get("models", [])]) if resp.ok else ("bad", [])
+    except Exception: hit = ("down", [])
+    _OLLAMA_LIST_CACHE[:] = [_t.monotonic(), hit]; return hit
+
 class SoftwareDetector:
     TOOLS = {
         "ollama": {"name":"Ollama","cmd":"ollama --version",
@@ -298,34 +452,62 @@ class SoftwareDetector:
             "desc":"llama.cpp HTTP server with OpenAI-compatible API.","icon":"🦙","winget":None},
     }
 
-    def __init__(self):
+    _BY_NAME = None
+
+    def __init__(self, detect=True):
         self.found = {}; self.versions = {}
+        if detect: self._detect_all()
+
+    def _detect_all(self):
+        """Probe every tool (subprocess calls, path checks). Safe to run on a worker thread."""
+        found = {}; versions = {}
         u = os.environ.get("USERNAME", os.environ.get("USER", "user"))
+        # Command probes run concurrently: startup waits for the slowest one, not the sum of all
+        cmds = {k: info["cmd"] for k, info in self.TOOLS.items() if info.get("cmd")}
+        probed = {}
+        if cmds:
+            with ThreadPoolExecutor(max_workers=len(cmds)) as ex:
+                futs = {ex.submit(self._probe, c): k for k, c in cmds.items()}
+                for f in as_completed(futs): probed[futs[f]] = f.result()
         for key, info in self.TOOLS.items():
             path = None
-            if info.get("cmd"):
-                try:
-                    out = subprocess.check_output(info["cmd"], shell=True, text=True, stderr=subprocess.DEVNULL, timeout=5)
-                    path = shutil.which(info["cmd"].split()[0]) or "PATH"
-                    vm = re.search(r'(\d+\.\d+[\.\d]*)', out)
-                    if vm: self.versions[key] = vm.group(1)
-                except: pass
+            if probed.get(key):
+                path, ver = probed[key]
+                if ver: versions[key] = ver
             if not path and sys.platform == "win32":
                 for p in info.get("win", []):
                     exp = p.replace("{u}", u)
                     if Path(exp).exists(): path = exp; break
-            self.found[key] = path
+            found[key] = path
+        self.found, self.versions = found, versions  # swapped in whole: readers never see a half-filled map
+
+    @staticmethod
+    def _probe(cmd):
+        """Run a tool's probe command. Returns (path, version) on success, None otherwise."""
+        try: out = subprocess.check_output(shlex.split(cmd), text=True, stderr=subprocess.DEVNULL, timeout=5,
+                                           creationflags=_SUBPROC_FLAGS)
+        except (OSError, ValueError, subprocess.SubprocessError): return None
+        vm = re.search(r'(\d+\.\d+[\.\d]*)', out)
+        return shutil.which(cmd.split()[0]) or "PATH", vm.group(1) if vm else ""
 
+    @classmethod
+    def key_for(cls, name):
+        """Detector key for a display name; the inverted TOOLS map is built once."""
+        if cls._BY_NAME is None: cls._BY_NAME = {inf["name"]: k for k, inf in cls.TOOLS.items()}
+        return cls._BY_NAME.get(name)
     def is_installed(self, k): return self.found.get(k) is not None
     def get_path(self, k): return self.found.get(k)
     def get_version(self, k): return self.versions.get(k, "")
+    def state(self):
+        """Hashable (key, installed, version) snapshot; keys render caches for the software cards."""
+        return tuple((k, self.found.get(k) is not None, self.versions.get(k, "")) for k in self.TOOLS)
 
     def integrate_ollama(self, gguf_path, model_name):
         mf = Path(gguf_path).parent / f"{model_name}.Modelfile"
         mf.write_text(f'FROM "{gguf_path}"\n')
         try:
             subprocess.Popen(["ollama", "create", model_name, "-f", str(mf)],
-                             creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=="win32" else 0)
+                             creationflags=_SUBPROC_FLAGS)
             return True, f"Registered as 'ollama run {model_name}'"
         except Exception as e: return False, str(e)
 
@@ -334,10 +516,10 @@ class SoftwareDetector:
         try:
             subprocess.check_output(["ollama", "cp", old_name, new_name],
                 stderr=subprocess.DEVNULL, timeout=30,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=="win32" else 0)
+                creationflags=_SUBPROC_FLAGS)
             subprocess.check_output(["ollama", "rm", old_name],
                 stderr=subprocess.DEVNULL, timeout=30,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=="win32" else 0)
+                creationflags=_SUBPROC_FLAGS)
             return True, f"Renamed '{old_name}' → '{new_name}'"
         except FileNotFoundError: return False, "Ollama not installed"
         except subprocess.CalledProcessError as e: return False, f"Rename failed: {e}"
@@ -345,12 +527,7 @@ class SoftwareDetector:
 
     def ollama_list(self):
         """List locally available Ollama models."""
-        try:
-            resp = requests.get("http://localhost:11434/api/tags", timeout=3)
-            if resp.ok:
-                return [m["name"] for m in resp.json().get("models", [])]
-        except: pass
-        return []
+        return _ollama_tags()[1]
 
     def integrate_lmstudio(self, gguf_path):
         u = os.environ.get("USERNAME", os.environ.get("USER", "user"))
@@ -383,71 +560,95 @@ THEMES = {
         "gn":"#4ade80","og":"#facc15","rd":"#ef4444","pu":"#a78bfa","pk":"#f472b6","tl":"#2dd4bf"},
 }
 current_theme = "Obsidian"
-def T(): return THEMES[current_theme]
+THEME = THEMES[current_theme]  # active palette; rebound by _set_theme, read directly in paint paths
+def T(): return THEME
+def _set_theme(n):
+    global current_theme, THEME
+    current_theme = n; THEME = THEMES[n]
+_qcolor = functools.lru_cache(maxsize=128)(QColor)  # hex -> shared QColor; callers only read it (pens/brushes/setForeground copy)
+
+_QSS_CACHE = {}
+_HTML_PRELUDE_CACHE = {}
+def _theme_key(t): return tuple(t.values())
 
 def _qss(t):
+    k = _theme_key(t); css = _QSS_CACHE.get(k)
+    if css is None: css = _QSS_CACHE[k] = _build_qss(t)
+    return css
+
+def _build_qss(t):
+    bg0, bg1, bg2, bg3, bg4, bd, bd2, tx, tx2, tx3, ac, ac2, ac3, acs, rd = (t[k] for k in ("bg0", "bg1", "bg2", "bg3", "bg4", "bd", "bd2", "tx", "tx2", "tx3", "ac", "ac2", "ac3", "acs", "rd"))
     return f"""
 * {{ font-family:'Segoe UI Variable','Segoe UI','SF Pro Display',system-ui,sans-serif; }}
-QMainWindow,QDialog,QWidget {{ background:{t['bg0']}; color:{t['tx']}; font-size:13px; }}
-QFrame {{ color:{t['tx']}; }} QLabel {{ color:{t['tx']}; }}
-QTabWidget::pane {{ border:1px solid {t['bd']}; background:{t['bg0']}; border-radius:6px; }}
-QTabBar {{ background:{t['bg1']}; }}
-QTabBar::tab {{ background:{t['bg1']}; color:{t['tx2']}; padding:10px 18px; border:none; border-bottom:2px solid transparent; font-weight:600; min-width:60px; }}
-QTabBar::tab:selected {{ color:{t['tx']}; border-bottom-color:{t['ac']}; background:{t['bg2']}; }}
-QTabBar::tab:hover:!selected {{ color:{t['tx']}; background:{t['bg2']}; }}
-QPushButton {{ background:{t['ac']}; color:{t['bg0']}; border:none; padding:9px 20px; border-radius:8px; font-weight:bold; }}
-QPushButton:hover {{ background:{t['ac2']}; }} QPushButton:pressed {{ background:{t['ac3']}; }}
-QPushButton:disabled {{ background:{t['bg3']}; color:{t['tx3']}; }}
-QPushButton[class="ghost"] {{ background:transparent; color:{t['ac']}; border:1px solid {t['bd']}; }}
-QPushButton[class="ghost"]:hover {{ background:{t['acs']}; border-color:{t['ac']}; }}
-QPushButton[class="sec"] {{ background:{t['bg3']}; color:{t['tx']}; border:1px solid {t['bd']}; }}
-QPushButton[class="sec"]:hover {{ background:{t['bg4']}; }}
-QPushButton[class="danger"] {{ background:{t['rd']}; color:#fff; }}
+QMainWindow,QDialog,QWidget {{ background:{bg0}; color:{tx}; font-size:13px; }}
+QFrame {{ color:{tx}; }} QLabel {{ color:{tx}; }}
+QTabWidget::pane {{ border:1px solid {bd}; background:{bg0}; border-radius:6px; }}
+QTabBar {{ background:{bg1}; }}
+QTabBar::tab {{ background:{bg1}; color:{tx2}; padding:10px 18px; border:none; border-bottom:2px solid transparent; font-weight:600; min-width:60px; }}
+QTabBar::tab:selected {{ color:{tx}; border-bottom-color:{ac}; background:{bg2}; }}
+QTabBar::tab:hover:!selected {{ color:{tx}; background:{bg2}; }}
+QPushButton {{ background:{ac}; color:{bg0}; border:none; padding:9px 20px; border-radius:8px; font-weight:bold; }}
+QPushButton:hover {{ background:{ac2}; }} QPushButton:pressed {{ background:{ac3}; }}
+QPushButton:disabled {{ background:{bg3}; color:{tx3}; }}
+QPushButton[class="ghost"] {{ background:transparent; color:{ac}; border:1px solid {bd}; }}
+QPushButton[class="ghost"]:hover {{ background:{acs}; border-color:{ac}; }}
+QPushButton[class="sec"] {{ background:{bg3}; color:{tx}; border:1px solid {bd}; }}
+QPushButton[class="sec"]:hover {{ background:{bg4}; }}
+QPushButton[class="danger"] {{ background:{rd}; color:#fff; }}
 QPushButton[class="danger"]:hover {{ background:#dc2626; }}
-QLineEdit {{ background:{t['bg1']}; color:{t['tx']}; border:1px solid {t['bd']}; border-radius:8px; padding:9px 12px; selection-background-color:{t['ac']}; }}
-QLineEdit:focus {{ border-color:{t['ac']}; }}
-QComboBox {{ background:{t['bg1']}; color:{t['tx']}; border:1px solid {t['bd']}; border-radius:8px; padding:8px 12px; min-width:120px; }}
+QPushButton[class="uc"] {{ background:{bg1}; border:2px solid {bd}; border-radius:12px; font-size:13px; font-weight:bold; color:{tx}; }}
+QPushButton[class="uc"]:checked {{ border-color:{ac}; background:{acs}; }}
+QPushButton[class="uc"]:hover {{ border-color:{ac2}; }}
+QLineEdit {{ background:{bg1}; color:{tx}; border:1px solid {bd}; border-radius:8px; padding:9px 12px; selection-background-color:{ac}; }}
+QLineEdit:focus {{ border-color:{ac}; }}
+QComboBox {{ background:{bg1}; color:{tx}; border:1px solid {bd}; border-radius:8px; padding:8px 12px; min-width:120px; }}
 QComboBox::drop-down {{ border:none; width:26px; }}
-QComboBox::down-arrow {{ image:none; border-left:5px solid transparent; border-right:5px solid transparent; border-top:6px solid {t['tx2']}; }}
-QComboBox QAbstractItemView {{ background:{t['bg2']}; color:{t['tx']}; border:1px solid {t['bd']}; selection-background-color:{t['ac']}; selection-color:{t['bg0']}; outline:none; }}
-QScrollBar:vertical {{ background:{t['bg0']}; width:8px; border:none; }} QScrollBar::handle:vertical {{ background:{t['bd']}; border-radius:4px; min-height:40px; }}
-QScrollBar::handle:vertical:hover {{ background:{t['bd2']}; }} QScrollBar::add-line:vertical,QScrollBar::sub-line:vertical {{ height:0; }}
-QScrollBar:horizontal {{ background:{t['bg0']}; height:8px; }} QScrollBar::handle:horizontal {{ background:{t['bd']}; border-radius:4px; }}
+QComboBox::down-arrow {{ image:none; border-left:5px solid transparent; border-right:5px solid transparent; border-top:6px solid {tx2}; }}
+QComboBox QAbstractItemView {{ background:{bg2}; color:{tx}; border:1px solid {bd}; selection-background-color:{ac}; selection-color:{bg0}; outline:none; }}
+QScrollBar:vertical {{ background:{bg0}; width:8px; border:none; }} QScrollBar::handle:vertical {{ background:{bd}; border-radius:4px; min-height:40px; }}
+QScrollBar::handle:vertical:hover {{ background:{bd2}; }} QScrollBar::add-line:vertical,QScrollBar::sub-line:vertical {{ height:0; }}
+QScrollBar:horizontal {{ background:{bg0}; height:8px; }} QScrollBar::handle:horizontal {{ background:{bd}; border-radius:4px; }}
 QScrollBar::add-line:horizontal,QScrollBar::sub-line:horizontal {{ width:0; }}
-QGroupBox {{ border:1px solid {t['bd']}; border-radius:10px; margin-top:14px; padding:18px 14px 14px; font-weight:bold; }}
-QGroupBox::title {{ subcontrol-origin:margin; left:16px; padding:0 8px; color:{t['ac']}; }}
-QToolTip {{ background:{t['bg2']}; color:{t['tx']}; border:1px solid {t['bd']}; padding:8px; border-radius:6px; }}
-QSlider::groove:horizontal {{ background:{t['bg3']}; height:6px; border-radius:3px; }}
-QSlider::handle:horizontal {{ background:{t['ac']}; width:20px; height:20px; margin:-7px 0; border-radius:10px; border:2px solid {t['bg0']}; }}
-QSlider::sub-page:horizontal {{ background:{t['ac']}; border-radius:3px; }}
-QCheckBox {{ spacing:8px; }} QCheckBox::indicator {{ width:20px; height:20px; border-radius:5px; border:2px solid {t['bd']}; background:{t['bg1']}; }}
-QCheckBox::indicator:checked {{ background:{t['ac']}; border-color:{t['ac']}; }}
-QHeaderView::section {{ background:{t['bg1']}; color:{t['tx']}; border:none; border-bottom:1px solid {t['bd']}; padding:10px; font-weight:600; }}
-QTableWidget {{ background:{t['bg0']}; alternate-background-color:{t['bg1']}; color:{t['tx']}; border:1px solid {t['bd']}; gridline-color:{t['bd']}; border-radius:8px; }}
-QTableWidget::item:selected {{ background:{t['acs']}; }}
-QTextBrowser {{ background:{t['bg1']}; color:{t['tx']}; border:1px solid {t['bd']}; border-radius:10px; padding:14px; }}
-QProgressBar {{ background:{t['bg3']}; border:none; border-radius:6px; text-align:center; color:{t['tx']}; font-weight:bold; font-size:11px; min-height:22px; }}
-QProgressBar::chunk {{ background:{t['ac']}; border-radius:6px; }}
+QGroupBox {{ border:1px solid {bd}; border-radius:10px; margin-top:14px; padding:18px 14px 14px; font-weight:bold; }}
+QGroupBox::title {{ subcontrol-origin:margin; left:16px; padding:0 8px; color:{ac}; }}
+QToolTip {{ background:{bg2}; color:{tx}; border:1px solid {bd}; padding:8px; border-radius:6px; }}
+QSlider::groove:horizontal {{ background:{bg3}; height:6px; border-radius:3px; }}
+QSlider::handle:horizontal {{ background:{ac}; width:20px; height:20px; margin:-7px 0; border-radius:10px; border:2px solid {bg0}; }}
+QSlider::sub-page:horizontal {{ background:{ac}; border-radius:3px; }}
+QCheckBox {{ spacing:8px; }} QCheckBox::indicator {{ width:20px; height:20px; border-radius:5px; border:2px solid {bd}; background:{bg1}; }}
+QCheckBox::indicator:checked {{ background:{ac}; border-color:{ac}; }}
+QHeaderView::section {{ background:{bg1}; color:{tx}; border:none; border-bottom:1px solid {bd}; padding:10px; font-weight:600; }}
+QTableView {{ background:{bg0}; alternate-background-color:{bg1}; color:{tx}; border:1px solid {bd}; gridline-color:{bd}; border-radius:8px; }}
+QTableView::item:selected {{ background:{acs}; }}
+QTextBrowser {{ background:{bg1}; color:{tx}; border:1px solid {bd}; border-radius:10px; padding:14px; }}
+QProgressBar {{ background:{bg3}; border:none; border-radius:6px; text-align:center; color:{tx}; font-weight:bold; font-size:11px; min-height:22px; }}
+QProgressBar::chunk {{ background:{ac}; border-radius:6px; }}
 QListWidget {{ background:transparent; border:none; outline:none; }}
 QListWidget::item {{ padding:11px 14px; border-radius:8px; }}
-QListWidget::item:selected {{ background:{t['bg2']}; color:{t['ac']}; font-weight:bold; }}
-QListWidget::item:hover:!selected {{ background:{t['bg4']}; }}
+QListWidget::item:selected {{ background:{bg2}; color:{ac}; font-weight:bold; }}
+QListWidget::item:hover:!selected {{ background:{bg4}; }}
 """
 
 def _html(body, t):
+    k = _theme_key(t); pre = _HTML_PRELUDE_CACHE.get(k)
+    if pre is None: pre = _HTML_PRELUDE_CACHE[k] = _html_prelude(t)
+    return pre + body + "</body></html>"
+
+def _html_prelude(t):
+    bg1, bg2, bd, tx, tx2, ac, gn, og, rd, pu, tl = (t[k] for k in ("bg1", "bg2", "bd", "tx", "tx2", "ac", "gn", "og", "rd", "pu", "tl"))
     return f"""<html><head><style>
-body {{ font-family:'Segoe UI Variable','Segoe UI',sans-serif; color:{t['tx']}; background:{t['bg1']}; line-height:1.75; padding:10px; }}
-h1 {{ color:{t['ac']}; font-size:22px; border-bottom:2px solid {t['bd']}; padding-bottom:8px; }}
-h2 {{ color:{t['pu']}; font-size:17px; margin-top:20px; }} h3 {{ color:{t['tl']}; font-size:15px; }}
-code {{ background:{t['bg2']}; color:{t['og']}; padding:2px 7px; border-radius:5px; font-family:'Cascadia Code','Consolas',monospace; font-size:12px; }}
-.c {{ background:{t['bg2']}; border:1px solid {t['bd']}; border-radius:10px; padding:14px; margin:10px 0; }}
-.hl {{ background:{t['bg2']}; border-left:3px solid {t['ac']}; padding:10px 14px; margin:10px 0; border-radius:0 8px 8px 0; }}
-.g {{ color:{t['gn']}; }} .o {{ color:{t['og']}; }} .r {{ color:{t['rd']}; }} .d {{ color:{t['tx2']}; }}
+body {{ font-family:'Segoe UI Variable','Segoe UI',sans-serif; color:{tx}; background:{bg1}; line-height:1.75; padding:10px; }}
+h1 {{ color:{ac}; font-size:22px; border-bottom:2px solid {bd}; padding-bottom:8px; }}
+h2 {{ color:{pu}; font-size:17px; margin-top:20px; }} h3 {{ color:{tl}; font-size:15px; }}
+code {{ background:{bg2}; color:{og}; padding:2px 7px; border-radius:5px; font-family:'Cascadia Code','Consolas',monospace; font-size:12px; }}
+.c {{ background:{bg2}; border:1px solid {bd}; border-radius:10px; padding:14px; margin:10px 0; }}
+.hl {{ background:{bg2}; border-left:3px solid {ac}; padding:10px 14px; margin:10px 0; border-radius:0 8px 8px 0; }}
+.g {{ color:{gn}; }} .o {{ color:{og}; }} .r {{ color:{rd}; }} .d {{ color:{tx2}; }}
 table {{ border-collapse:collapse; width:100%; margin:10px 0; }}
-th {{ background:{t['bg2']}; color:{t['ac']}; text-align:left; padding:9px 10px; border-bottom:2px solid {t['bd']}; font-size:12px; }}
-td {{ padding:8px 10px; border-bottom:1px solid {t['bd']}; font-size:12px; }}
-tr:hover td {{ background:{t['bg2']}; }}
-</style></head><body>{body}</body></html>"""
+th {{ background:{bg2}; color:{ac}; text-align:left; padding:9px 10px; border-bottom:2px solid {bd}; font-size:12px; }}
+td {{ padding:8px 10px; border-bottom:1px solid {bd}; font-size:12px; }}
+tr:hover td {{ background:{bg2}; }}
+</style></head><body>"""
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TOAST NOTIFICATION SYSTEM
@@ -487,15 +688,22 @@ def toast(msg, color=None, dur=3500): ToastManager.inst().show(msg, color, dur)
 # ═══════════════════════════════════════════════════════════════════════════════
 # EDUCATIONAL CONTENT
 # ═══════════════════════════════════════════════════════════════════════════════
-def _topics(t):
-    return {
-    "🧠 What is AI?": _html("<h1>🧠 What is Artificial Intelligence?</h1><p>AI refers to systems that perform tasks requiring human intelligence — language, images, decisions, creativity.</p><h2>Types</h2><div class='c'><h3>🗣️ LLMs</h3><p>Text AI for chat, writing, coding, reasoning. <span class='d'>Qwen3, DeepSeek, Llama 4, Mistral</span></p></div><div class='c'><h3>🎨 Image Gen</h3><p>Create images from text. <span class='d'>Stable Diffusion, Flux, SD3.5</span></p></div><div class='c'><h3>🔊 Voice</h3><p>TTS, STT, voice conversion. <span class='d'>Kokoro, Whisper, RVC</span></p></div><div class='c'><h3>👁️ Vision-Language</h3><p>Understand text+images. <span class='d'>Qwen3-VL, InternVL3</span></p></div><h2>Why Local?</h2><div class='hl'><p><span class='g'>✓ Privacy</span> — data stays on your PC<br><span class='g'>✓ Free</span> — no subscriptions<br><span class='g'>✓ Uncensored</span> — no filters<br><span class='g'>✓ Offline</span> — works without internet<br><span class='g'>✓ Customizable</span> — fine-tune for you</p></div><h2>Key Concepts</h2><p><b>Parameters</b> — model neurons. 7B = smaller/faster; 70B = smarter/heavier.</p><p><b>Context</b> — text the model sees at once. 128K tokens ≈ 96K words.</p><p><b>Inference</b> — generating output. 20+ tok/s = conversational speed.</p>", t),
-    "📦 What is GGUF?": _html("<h1>📦 What is GGUF?</h1><p><b>GPT-Generated Unified Format</b> — the standard for running AI locally. One file, all hardware.</p><div class='hl'>A 70B model at FP16 = ~140 GB. GGUF compresses it to ~40 GB in a single file.</div><h2>What's Inside</h2><div class='c'><p>📄 Metadata — architecture, context, quant type<br>🧮 Quantized weights — compressed parameters<br>📚 Tokenizer — vocabulary<br>All in <b>one file</b>.</p></div><h2>GGUF vs Others</h2><table><tr><th>Feature</th><th>GGUF</th><th>GPTQ/AWQ/EXL2</th></tr><tr><td>CPU</td><td><span class='g'>✓ Full</span></td><td><span class='r'>✗ GPU only</span></td></tr><tr><td>Mixed CPU+GPU</td><td><span class='g'>✓ Any split</span></td><td><span class='r'>✗</span></td></tr><tr><td>Hardware</td><td><span class='g'>Everything</span></td><td><span class='o'>NVIDIA mostly</span></td></tr><tr><td>Software</td><td><span class='g'>20+ tools</span></td><td><span class='o'>3-4 tools</span></td></tr></table><div class='hl'>💡 For local AI: <b>GGUF is the format you want.</b></div>", t),
-    "🔢 Quantization": _html("<h1>🔢 Quantization</h1><p>Reducing weight precision to shrink models. 16-bit → 4-bit = ~3.3x smaller, ~99% quality.</p><h2>⭐ Q4_K_M — The Default</h2><div class='hl'><p><span class='g'>~99% quality</span> · <span class='g'>3.3x smaller</span> · <span class='g'>Runs on 8GB VRAM</span> · <span class='g'>Best balance of everything</span></p></div><h2>Reference Table</h2><table><tr><th>Type</th><th>Bits</th><th>~7B Size</th><th>Quality</th></tr><tr><td>Q8_0</td><td>8.50</td><td>6.7 GB</td><td><span class='g'>99.96%</span></td></tr><tr><td>Q6_K</td><td>6.57</td><td>5.15 GB</td><td><span class='g'>99.9%</span></td></tr><tr><td>Q5_K_M</td><td>5.67</td><td>4.45 GB</td><td><span class='g'>99.5%</span></td></tr><tr style='background:#1e3a5f33'><td><b>Q4_K_M</b></td><td><b>4.83</b></td><td><b>3.80 GB</b></td><td><span class='g'><b>⭐ 99%</b></span></td></tr><tr><td>Q3_K_M</td><td>3.89</td><td>3.07 GB</td><td><span class='o'>95.5%</span></td></tr><tr><td>Q2_K</td><td>3.00</td><td>2.63 GB</td><td><span class='r'>85%</span></td></tr></table><div class='hl'>🔑 <b>Bigger model at lower quant beats smaller model at higher quant.</b> 70B@Q4 > 13B@FP16.</div>", t),
-    "💻 Hardware Guide": _html("<h1>💻 What Can You Run?</h1><p>VRAM is the bottleneck. Check 🎯 Recommend for personalized picks.</p><table><tr><th>VRAM</th><th>GPUs</th><th>Models</th></tr><tr><td>4 GB</td><td>GTX 1650</td><td>3B, SD 1.5</td></tr><tr><td>6 GB</td><td>RTX 2060</td><td>7B, SDXL tight</td></tr><tr><td>8 GB</td><td>RTX 4060</td><td>8B (Q5), 13B (Q3), Flux quant</td></tr><tr><td>12 GB</td><td>RTX 4070</td><td>13B (Q4), Flux fp8</td></tr><tr><td>16 GB</td><td>RTX 4070 Ti</td><td>30B (Q4), Flux fp16</td></tr><tr><td>24 GB</td><td>RTX 4090</td><td>70B (Q4+offload), everything</td></tr></table><h2>CPU Only</h2><div class='c'>16GB RAM → 7B (~5-8 tok/s) | 32GB → 13B | 64GB → 34B</div><h2>Formula</h2><div class='hl'><code>VRAM ≈ (Params × Bits / 8) + ~1.5 GB</code></div>", t),
-    "⚡ Speed Deep Dive": _html("<h1>⚡ Speed Deep Dive</h1><h2>Memory Bandwidth = Speed</h2><div class='hl'>Inference speed = <code>Bandwidth / Model Size</code>.<br>RTX 4090 (1 TB/s) with 8GB model = ~125 tok/s theoretical.</div><h2>GPU Bandwidth</h2><table><tr><th>GPU</th><th>BW (GB/s)</th><th>~8B Model</th></tr><tr><td>RTX 4090</td><td>1008</td><td><span class='g'>~100+ tok/s</span></td></tr><tr><td>RTX 4070</td><td>504</td><td><span class='g'>~55 tok/s</span></td></tr><tr><td>RTX 3060</td><td>360</td><td><span class='g'>~35 tok/s</span></td></tr><tr><td>RX 7800 XT</td><td>624</td><td><span class='g'>~60 tok/s</span></td></tr></table><h2>Offloading</h2><div class='c'>When VRAM is insufficient, layers offload to RAM. Speed drops to DDR bandwidth (~50 GB/s). Mix: best of both.</div>", t),
-    "🔧 Advanced Config": _html("<h1>🔧 Advanced Settings</h1><h2>GPU Layer Offloading</h2><div class='c'><code>--n-gpu-layers 35</code> — controls how many layers go to GPU vs CPU.<br>Higher = more VRAM used but faster. Start max, reduce if OOM.</div><h2>Context Size</h2><div class='c'><code>--ctx-size 8192</code> — how much text the model sees.<br>Higher = more VRAM for KV cache. 8K is usually fine.</div><h2>Threads</h2><div class='c'><code>--threads 8</code> — CPU threads for CPU layers.<br>Set to physical cores (not hyperthreads).</div><h2>Flash Attention</h2><div class='hl'>Enable with <code>--flash-attn</code>. Reduces VRAM usage for KV cache by ~50%.</div>", t),
-    }
+TOPICS = {
+    "🧠 What is AI?": "<h1>🧠 What is Artificial Intelligence?</h1><p>AI refers to systems that perform tasks requiring human intelligence — language, images, decisions, creativity.</p><h2>Types</h2><div class='c'><h3>🗣️ LLMs</h3><p>Text AI for chat, writing, coding, reasoning. <span class='d'>Qwen3, DeepSeek, Llama 4, Mistral</span></p></div><div class='c'><h3>🎨 Image Gen</h3><p>Create images from text. <span class='d'>Stable Diffusion, Flux, SD3.5</span></p></div><div class='c'><h3>🔊 Voice</h3><p>TTS, STT, voice conversion. <span class='d'>Kokoro, Whisper, RVC</span></p></div><div class='c'><h3>👁️ Vision-Language</h3><p>Understand text+images. <span class='d'>Qwen3-VL, InternVL3</span></p></div><h2>Why Local?</h2><div class='hl'><p><span class='g'>✓ Privacy</span> — data stays on your PC<br><span class='g'>✓ Free</span> — no subscriptions<br><span class='g'>✓ Uncensored</span> — no filters<br><span class='g'>✓ Offline</span> — works without internet<br><span class='g'>✓ Customizable</span> — fine-tune for you</p></div><h2>Key Concepts</h2><p><b>Parameters</b> — model neurons. 7B = smaller/faster; 70B = smarter/heavier.</p><p><b>Context</b> — text the model sees at once. 128K tokens ≈ 96K words.</p><p><b>Inference</b> — generating output. 20+ tok/s = conversational speed.</p>",
+    "📦 What is GGUF?": "<h1>📦 What is GGUF?</h1><p><b>GPT-Generated Unified Format</b> — the standard for running AI locally. One file, all hardware.</p><div class='hl'>A 70B model at FP16 = ~140 GB. GGUF compresses it to ~40 GB in a single file.</div><h2>What's Inside</h2><div class='c'><p>📄 Metadata — architecture, context, quant type<br>🧮 Quantized weights — compressed parameters<br>📚 Tokenizer — vocabulary<br>All in <b>one file</b>.</p></div><h2>GGUF vs Others</h2><table><tr><th>Feature</th><th>GGUF</th><th>GPTQ/AWQ/EXL2</th></tr><tr><td>CPU</td><td><span class='g'>✓ Full</span></td><td><span class='r'>✗ GPU only</span></td></tr><tr><td>Mixed CPU+GPU</td><td><span class='g'>✓ Any split</span></td><td><span class='r'>✗</span></td></tr><tr><td>Hardware</td><td><span class='g'>Everything</span></td><td><span class='o'>NVIDIA mostly</span></td></tr><tr><td>Software</td><td><span class='g'>20+ tools</span></td><td><span class='o'>3-4 tools</span></td></tr></table><div class='hl'>💡 For local AI: <b>GGUF is the format you want.</b></div>",
+    "🔢 Quantization": "<h1>🔢 Quantization</h1><p>Reducing weight precision to shrink models. 16-bit → 4-bit = ~3.3x smaller, ~99% quality.</p><h2>⭐ Q4_K_M — The Default</h2><div class='hl'><p><span class='g'>~99% quality</span> · <span class='g'>3.3x smaller</span> · <span class='g'>Runs on 8GB VRAM</span> · <span class='g'>Best balance of everything</span></p></div><h2>Reference Table</h2><table><tr><th>Type</th><th>Bits</th><th>~7B Size</th><th>Quality</th></tr><tr><td>Q8_0</td><td>8.50</td><td>6.7 GB</td><td><span class='g'>99.96%</span></td></tr><tr><td>Q6_K</td><td>6.57</td><td>5.15 GB</td><td><span class='g'>99.9%</span></td></tr><tr><td>Q5_K_M</td><td>5.67</td><td>4.45 GB</td><td><span class='g'>99.5%</span></td></tr><tr style='background:#1e3a5f33'><td><b>Q4_K_M</b></td><td><b>4.83</b></td><td><b>3.80 GB</b></td><td><span class='g'><b>⭐ 99%</b></span></td></tr><tr><td>Q3_K_M</td><td>3.89</td><td>3.07 GB</td><td><span class='o'>95.5%</span></td></tr><tr><td>Q2_K</td><td>3.00</td><td>2.63 GB</td><td><span class='r'>85%</span></td></tr></table><div class='hl'>🔑 <b>Bigger model at lower quant beats smaller model at higher quant.</b> 70B@Q4 > 13B@FP16.</div>",
+    "💻 Hardware Guide": "<h1>💻 What Can You Run?</h1><p>VRAM is the bottleneck. Check 🎯 Recommend for personalized picks.</p><table><tr><th>VRAM</th><th>GPUs</th><th>Models</th></tr><tr><td>4 GB</td><td>GTX 1650</td><td>3B, SD 1.5</td></tr><tr><td>6 GB</td><td>RTX 2060</td><td>7B, SDXL tight</td></tr><tr><td>8 GB</td><td>RTX 4060</td><td>8B (Q5), 13B (Q3), Flux quant</td></tr><tr><td>12 GB</td><td>RTX 4070</td><td>13B (Q4), Flux fp8</td></tr><tr><td>16 GB</td><td>RTX 4070 Ti</td><td>30B (Q4), Flux fp16</td></tr><tr><td>24 GB</td><td>RTX 4090</td><td>70B (Q4+offload), everything</td></tr></table><h2>CPU Only</h2><div class='c'>16GB RAM → 7B (~5-8 tok/s) | 32GB → 13B | 64GB → 34B</div><h2>Formula</h2><div class='hl'><code>VRAM ≈ (Params × Bits / 8) + ~1.5 GB</code></div>",
+    "⚡ Speed Deep Dive": "<h1>⚡ Speed Deep Dive</h1><h2>Memory Bandwidth = Speed</h2><div class='hl'>Inference speed = <code>Bandwidth / Model Size</code>.<br>RTX 4090 (1 TB/s) with 8GB model = ~125 tok/s theoretical.</div><h2>GPU Bandwidth</h2><table><tr><th>GPU</th><th>BW (GB/s)</th><th>~8B Model</th></tr><tr><td>RTX 4090</td><td>1008</td><td><span class='g'>~100+ tok/s</span></td></tr><tr><td>RTX 4070</td><td>504</td><td><span class='g'>~55 tok/s</span></td></tr><tr><td>RTX 3060</td><td>360</td><td><span class='g'>~35 tok/s</span></td></tr><tr><td>RX 7800 XT</td><td>624</td><td><span class='g'>~60 tok/s</span></td></tr></table><h2>Offloading</h2><div class='c'>When VRAM is insufficient, layers offload to RAM. Speed drops to DDR bandwidth (~50 GB/s). Mix: best of both.</div>",
+    "🔧 Advanced Config": "<h1>🔧 Advanced Settings</h1><h2>GPU Layer Offloading</h2><div class='c'><code>--n-gpu-layers 35</code> — controls how many layers go to GPU vs CPU.<br>Higher = more VRAM used but faster. Start max, reduce if OOM.</div><h2>Context Size</h2><div class='c'><code>--ctx-size 8192</code> — how much text the model sees.<br>Higher = more VRAM for KV cache. 8K is usually fine.</div><h2>Threads</h2><div class='c'><code>--threads 8</code> — CPU threads for CPU layers.<br>Set to physical cores (not hyperthreads).</div><h2>Flash Attention</h2><div class='hl'>Enable with <code>--flash-attn</code>. Reduces VRAM usage for KV cache by ~50%.</div>",
+}
+
+@functools.lru_cache(maxsize=64)
+def _topic_html(name, theme):
+    return _html(TOPICS[name], THEMES[theme])
+
+def _topics(theme):
+    """Topic name -> zero-arg builder; each page is rendered (and memoized) only when opened."""
+    return {name: functools.partial(_topic_html, name, theme) for name in TOPICS}
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MODEL DATABASE
@@ -509,13 +717,24 @@ USE_CASES = {
     "🤖 Agents": {"cats":["Agents","Coding"],"desc":"Autonomous tools, automation"},
     "👁️ Vision": {"cats":["Vision"],"desc":"Image understanding + text"},
 }
-CATEGORIES = sorted(set(c for uc in USE_CASES.values() for c in uc["cats"]))
+USE_CASES = {k: {**v, "cats": frozenset(v["cats"])} for k, v in USE_CASES.items()}
+CATEGORIES = tuple(sorted(frozenset().union(*(uc["cats"] for uc in USE_CASES.values()))))
+# First-run wizard tiles -> categories (tiles without an entry fall back to "best overall")
+WIZARD_CATS = {"Chat & Writing": frozenset(("General Purpose","Small / Efficient")), "Coding": frozenset(("Coding",)),
+               "Roleplay": frozenset(("Roleplay","Uncensored")), "Uncensored": frozenset(("Uncensored",)),
+               "Research": frozenset(("General Purpose","Long Context")), "AI Agents": frozenset(("Agents","Coding"))}
+
+@functools.lru_cache(maxsize=64)
+def _cats_for(sel, table="uc"):
+    """Category union for a frozenset of selected use cases (USE_CASES names, or wizard tiles with table="wiz")."""
+    if table == "uc": return frozenset().union(*(USE_CASES[n]["cats"] for n in sel))
+    return frozenset().union(*(WIZARD_CATS.get(n, ()) for n in sel))
 
 def _load_models():
     """Load model database from cache, then bundled file, in that priority order."""
     for src in (MODELS_CACHE, MODELS_BUNDLED):
         try:
-            data = json.loads(src.read_text(encoding="utf-8"))
+            data = _loads(src.read_text(encoding="utf-8"))
             if isinstance(data, list) and data:
                 return data
         except Exception:
@@ -524,6 +743,61 @@ def _load_models():
 
 MODEL_DB = _load_models()
 
+# Catalog indexes, rebuilt by _index_models() whenever MODEL_DB is replaced:
+# parallel gb/score columns, name -> row, category -> rows, and rows ranked by score (desc, stable).
+_DB_GB = []; _DB_SC = []; _IDX_BY_NAME = {}; _BY_CAT = {}; _SC_RANK = []
+_DESC_HTML = {}  # model name -> HTML-escaped description, built once per catalog
+_DB_SEARCH = []  # per row: lowercased name/desc/category/tags joined by newlines (never in a query)
+_DB_NLOW = []  # per row: lowercased name (sort key)
+_BY_CAT_SC = {}  # category -> rows ranked by score (desc), for merge-based top-K selection
+# Sort keys by name; Python's sort is stable, so ties keep DB order like the old in-place list sorts
+_SORT_KEYS = {"sc": lambda i: -_DB_SC[i], "sc_asc": lambda i: _DB_SC[i], "name": lambda i: _DB_NLOW[i],
+              "gb": lambda i: _DB_GB[i], "gb_desc": lambda i: -_DB_GB[i]}
+@functools.lru_cache(maxsize=8)
+def _sort_rows(key):
+    """(row order, per-row rank) for a _SORT_KEYS key over the current MODEL_DB; cleared by _index_models."""
+    order = sorted(range(len(_DB_GB)), key=_SORT_KEYS[key]); rank = [0] * len(order)
+    for r, i in enumerate(order): rank[i] = r
+    return order, rank
+
+@functools.lru_cache(maxsize=8)
+def _fit_mask(max_gb):
+    """Per-row 'fits in max_gb' flags for the current MODEL_DB; cleared by _index_models."""
+    return [gb <= max_gb for gb in _DB_GB]
+
+def _index_models(db):
+    global _DB_GB, _DB_SC, _IDX_BY_NAME, _BY_CAT, _SC_RANK, _DESC_HTML, _DB_SEARCH, _DB_NLOW, _BY_CAT_SC
+    _DB_GB = [m.get("gb",0) for m in db]; _DB_SC = [m.get("sc",0) for m in db]
+    _IDX_BY_NAME = {m["n"]: i for i, m in enumerate(db)}
+    _BY_CAT = {}
+    for i, m in enumerate(db): _BY_CAT.setdefault(m.get("cat",""), []).append(i)
+    _DB_NLOW = [m["n"].lower() for m in db]
+    _sort_rows.cache_clear(); _SC_RANK = _sort_rows("sc")[1]
+    _BY_CAT_SC = {c: sorted(rows, key=_SC_RANK.__getitem__) for c, rows in _BY_CAT.items()}
+    _DESC_HTML = {m["n"]: html_mod.escape(m.get("d","")) for m in db}
+    _DB_SEARCH = ["\n".join([m["n"], m.get("d",""), m.get("cat",""), *m.get("tags",[])]).lower() for m in db]
+    _fit_mask.cache_clear()
+_index_models(MODEL_DB)
+
+def _model_by_name(name):
+    i = _IDX_BY_NAME.get(name)
+    return None if i is None else MODEL_DB[i]
+
+def _select_models(max_gb=None, cats=None, by_score=False, q=None, sort=None, limit=None):
+    """MODEL_DB entries within max_gb and/or in one of cats (None = no constraint), optionally
+    matching lowercase substring q. DB order by default; by_score=True returns highest score first,
+    sort=<_SORT_KEYS key> any other precomputed order. limit stops after that many matches."""
+    if by_score: sort = "sc"
+    if cats is None: rows = _sort_rows(sort)[0] if sort else range(len(MODEL_DB))
+    elif sort == "sc":  # each row has one category, so merging the pre-ranked buckets never repeats a row
+        rows = heapq.merge(*(_BY_CAT_SC.get(c, ()) for c in cats), key=_SC_RANK.__getitem__)
+    else:
+        rows = {i for c in cats for i in _BY_CAT.get(c, ())}
+        rows = sorted(rows, key=_sort_rows(sort)[1].__getitem__) if sort else sorted(rows)
+    if q: rows = (i for i in rows if q in _DB_SEARCH[i])
+    if max_gb is not None: fit = _fit_mask(max_gb); rows = (i for i in rows if fit[i])
+    return [MODEL_DB[i] for i in itertools.islice(rows, limit)]
+
 QUANT_QUALITY = {"Q8_0": 4, "Q6_K": 3, "Q5_K_M": 2, "Q4_K_M": 1, "Q3_K_M": 0, "Q2_K": -1}
 
 def _parse_active_gb(p_str, total_gb):
@@ -555,7 +829,7 @@ class ModelUpdateWorker(QThread):
             if resp.status_code != 200:
                 return
             remote_text = resp.text.strip()
-            remote_data = json.loads(remote_text)
+            remote_data = _loads(remote_text)
             if not isinstance(remote_data, list) or not remote_data:
                 return
             local_text = MODELS_CACHE.read_text(encoding="utf-8").strip() if MODELS_CACHE.exists() else ""
@@ -568,27 +842,66 @@ class ModelUpdateWorker(QThread):
 # ═══════════════════════════════════════════════════════════════════════════════
 # WORKER THREADS
 # ═══════════════════════════════════════════════════════════════════════════════
+@functools.lru_cache(maxsize=1)
 def _winget_available():
     if sys.platform != "win32": return False
-    try: subprocess.check_output(["winget","--version"],stderr=subprocess.DEVNULL,timeout=5); return True
+    try: subprocess.check_output(["winget","--version"],stderr=subprocess.DEVNULL,timeout=5,
+                                 creationflags=_SUBPROC_FLAGS); return True
     except: return False
 
+# Worker signals always reach the UI as queued events, whichever thread (QThread or pool) emits them
+_QUEUED = Qt.ConnectionType.QueuedConnection
+
+def _pump_lines(stream, emit, stop=None, interval=0.05):
+    """Forward non-empty lines to emit at most once per interval (latest line wins, last one always sent).
+    Returns False if stop() asked to abort."""
+    last = 0.0; pending = None
+    for line in stream:
+        if stop and stop(): return False
+        line = line.strip()
+        if not line: continue
+        now = _t.monotonic()
+        if now - last >= interval: emit(line); last = now; pending = None
+        else: pending = line
+    if pending: emit(pending)
+    return True
+
 class WingetInstallWorker(QThread):
     sig_line = pyqtSignal(str); sig_done = pyqtSignal(str, bool)
     def __init__(self, pkg_id, name): super().__init__(); self.pkg_id = pkg_id; self.name = name
     def run(self):
         try:
             proc = subprocess.Popen(["winget","install","--id",self.pkg_id,"--accept-package-agreements",
-                "--accept-source-agreements","--silent"],stdout=subprocess.PIPE,stderr=subprocess.STDOUT,
-                text=True,creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=="win32" else 0)
-            for line in proc.stdout:
-                line = line.strip()
-                if line: self.sig_line.emit(line)
+                "--accept-source-agreements","--silent"], **_POPEN_KW)
+            _pump_lines(proc.stdout, self.sig_line.emit, interval=0.1)  # ~10 Hz is plenty for a one-line log
             proc.wait()
             self.sig_done.emit(self.name, proc.returncode == 0)
         except FileNotFoundError: self.sig_done.emit("winget not found", False)
         except Exception as e: self.sig_done.emit(str(e), False)
 
+class HWDetectWorker(QThread):
+    """Run HardwareInfo and SoftwareDetector probes off the UI thread, side by side; emits the hw instance when both finish."""
+    sig_done = pyqtSignal(object)
+    def __init__(self, hw, sw): super().__init__(); self.hw = hw; self.sw = sw
+    def run(self):
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            sw_f = ex.submit(self.sw._detect_all)
+            try: self.hw._detect_all()
+            except Exception: pass
+            try: sw_f.result()
+            except Exception: pass
+        self.sig_done.emit(self.hw)
+
+# hf_hub_download runs in a child interpreter: its transfer backends (hf_xet's Rust bridge) swallow exceptions
+# raised from progress callbacks, so killing the process is the only cancel that actually stops the transfer
+_HF_DL_CHILD = ("import sys\nfrom huggingface_hub import hf_hub_download\n"
+                "print(hf_hub_download(repo_id=sys.argv[1], filename=sys.argv[2], local_dir=sys.argv[3]))")
+
+def _hf_partials(dest, fn):
+    """hf_hub_download's resumable leftovers for fn under local_dir (.cache/huggingface/download/<fn>.<etag>.incomplete)."""
+    d = (Path(dest) / ".cache" / "huggingface" / "download" / fn).parent
+    return list(d.glob(Path(fn).name + ".*.incomplete")) if d.is_dir() else []
+
 class DownloadWorker(QThread):
     sig_progress = pyqtSignal(int, int)  # downloaded_bytes, total_bytes
     sig_status = pyqtSignal(str)
@@ -600,10 +913,23 @@ class DownloadWorker(QThread):
     def run(self):
         try:
             self.sig_status.emit(f"Downloading {self.fn}...")
-            path = hf_hub_download(repo_id=self.repo, filename=self.fn, local_dir=self.dest, resume_download=True)
-            if self._cancel: return
-            self.sig_done.emit(str(path))
-        except Exception as e: self.sig_err.emit(str(e))
+            proc = subprocess.Popen([sys.executable, "-c", _HF_DL_CHILD, self.repo, self.fn, str(self.dest)],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, creationflags=_SUBPROC_FLAGS,
+                                    env={**os.environ, "HF_HUB_DISABLE_PROGRESS_BARS": "1"})
+            while True:
+                try: out, err = proc.communicate(timeout=0.25); break
+                except subprocess.TimeoutExpired:
+                    if self._cancel: proc.kill(); proc.communicate(); out = ""; break
+            if self._cancel:
+                # Cancelled: nothing of this download is kept, finished or not
+                for f in _hf_partials(self.dest, self.fn) + ([Path(out.strip().splitlines()[-1])] if out.strip() else []):
+                    try: f.unlink()
+                    except OSError: pass
+                return
+            if proc.returncode: raise RuntimeError((err.strip().splitlines() or ["download failed"])[-1])
+            self.sig_done.emit(out.strip().splitlines()[-1])
+        except Exception as e:
+            if not self._cancel: self.sig_err.emit(str(e))
 
 class OllamaPullWorker(QThread):
     """Pull a model via 'ollama pull' — handles sharded models natively."""
@@ -612,58 +938,87 @@ class OllamaPullWorker(QThread):
     def cancel(self): self._cancel = True
     def run(self):
         try:
-            proc = subprocess.Popen(["ollama","pull",self.model_tag],
-                stdout=subprocess.PIPE,stderr=subprocess.STDOUT,text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform=="win32" else 0)
-            for line in proc.stdout:
-                if self._cancel: proc.terminate(); return
-                line = line.strip()
-                if line: self.sig_line.emit(line)
+            proc = subprocess.Popen(["ollama","pull",self.model_tag], **_POPEN_KW)
+            if not _pump_lines(proc.stdout, self.sig_line.emit, lambda: self._cancel): proc.terminate(); return
             proc.wait()
             self.sig_done.emit(self.model_tag, proc.returncode == 0)
         except FileNotFoundError: self.sig_done.emit("Ollama not installed", False)
         except Exception as e: self.sig_done.emit(str(e), False)
 
-class HFFileSizeWorker(QThread):
-    """Check actual file size on HuggingFace before downloading."""
-    sig_result = pyqtSignal(str, int)  # filename, size_bytes
-    sig_err = pyqtSignal(str)
-    def __init__(self, repo, filename): super().__init__(); self.repo = repo; self.fn = filename
-    def run(self):
-        try:
-            from huggingface_hub import HfApi
-            api = HfApi()
-            info = api.model_info(self.repo, files_metadata=True)
-            for f in info.siblings or []:
-                if f.rfilename == self.fn:
-                    self.sig_result.emit(self.fn, f.size or 0); return
-            self.sig_result.emit(self.fn, 0)
-        except Exception as e: self.sig_err.emit(str(e))
-
-class HFSearchWorker(QThread):
+@functools.lru_cache(maxsize=1)
+def _hf_api():
+    """Shared HfApi client so every HF worker reuses one session / connection pool."""
+    return HfApi()
+
+@functools.lru_cache(maxsize=32)
+def _hf_repo_info(repo):
+    """model_info with file metadata, fetched once per repo per session (failures are not cached)."""
+    return _hf_api().model_info(repo, files_metadata=True)
+
+_POOL = QThreadPool(); _POOL.setMaxThreadCount(4)  # private: the global pool's size is left alone
+_LIVE_WORKERS = {}  # token -> running _PooledWorker; callers may drop their reference mid-run
+_REAPER = None
+
+class _WorkerReaper(QObject):
+    """Releases finished pooled workers on the GUI thread, so a worker is never destroyed on a pool thread."""
+    sig_done = pyqtSignal(int)
+    def __init__(self): super().__init__(); self.sig_done.connect(self._drop, _QUEUED)
+    @pyqtSlot(int)
+    def _drop(self, key): _LIVE_WORKERS.pop(key, None)
+
+def _run_pooled(key):
+    w = _LIVE_WORKERS.get(key)
+    if w is not None:
+        try: w.run()
+        except Exception: pass
+    del w  # the pool thread lets go first; only the token travels back
+    _REAPER.sig_done.emit(key)
+
+class _PooledWorker(QObject):
+    """Worker with the QThread-style signals + start() API whose run() executes on the shared thread pool;
+    for short HF lookups fired per click, so they reuse pool threads instead of creating one each."""
+    _cancelled = False
+    def start(self):
+        global _REAPER
+        if _REAPER is None: _REAPER = _WorkerReaper()
+        key = id(self); _LIVE_WORKERS[key] = self
+        _POOL.start(functools.partial(_run_pooled, key))
+    def cancel(self): self._cancelled = True  # run() stops at its next check and emits nothing
+
+_SEARCH_CACHE = {}  # (query, limit) -> (monotonic stamp, results)
+_SEARCH_TTL = 60
+def _search_cached(query, limit):
+    hit = _SEARCH_CACHE.get((query, limit))
+    return hit[1] if hit and _t.monotonic() - hit[0] < _SEARCH_TTL else None
+
+class HFSearchWorker(_PooledWorker):
     sig_results = pyqtSignal(list); sig_err = pyqtSignal(str)
     def __init__(self, query, limit=20): super().__init__(); self.query = query; self.limit = limit
     def run(self):
         try:
-            from huggingface_hub import HfApi
-            api = HfApi()
-            models = list(api.list_models(search=self.query, library="gguf", sort="downloads", direction=-1, limit=self.limit))
+            api = _hf_api()
             results = []
-            for m in models:
+            # list_models pages lazily, so a superseded search stops between pages instead of finishing
+            for m in api.list_models(search=self.query, library="gguf", sort="downloads", direction=-1, limit=self.limit):
+                if self._cancelled: return
                 tags = list(m.tags) if m.tags else []
                 results.append({"id": m.id, "downloads": m.downloads or 0, "likes": m.likes or 0,
                     "tags": tags[:6], "last_modified": str(m.last_modified)[:10] if m.last_modified else "?"})
-            self.sig_results.emit(results)
-        except Exception as e: self.sig_err.emit(str(e))
+            _SEARCH_CACHE[(self.query, self.limit)] = (_t.monotonic(), results)
+            if not self._cancelled: self.sig_results.emit(results)
+        except Exception as e:
+            if not self._cancelled: self.sig_err.emit(str(e))
+
+# Longest tokens first so q5_k_m wins over shorter prefixes; leftmost match means iq*/bf16 beat q*/f16
+_QUANT_RE = re.compile(r"(iq4_xs|iq4_nl|q5_k_m|q5_k_s|q4_k_m|q4_k_s|q3_k_m|q3_k_s|iq3_m|iq3_s|iq2_m|iq1_s|q8_0|q6_k|q4_0|q2_k|bf16|f16)", re.I)
 
-class HFFilesWorker(QThread):
+class HFFilesWorker(_PooledWorker):
     sig_files = pyqtSignal(str, list); sig_err = pyqtSignal(str)
     def __init__(self, repo_id): super().__init__(); self.repo_id = repo_id
     def run(self):
         try:
-            from huggingface_hub import HfApi
-            api = HfApi(); files = api.list_repo_files(self.repo_id)
-            info = api.model_info(self.repo_id, files_metadata=True)
+            api = _hf_api(); files = api.list_repo_files(self.repo_id)
+            info = _hf_repo_info(self.repo_id)
             size_map = {f.rfilename: f.size for f in (info.siblings or []) if f.size}
             sha_map = {}
             for f in (info.siblings or []):
@@ -674,29 +1029,40 @@ class HFFilesWorker(QThread):
             gguf_files = []
             for f in files:
                 if f.endswith(".gguf"):
-                    fl = f.lower(); quant = "unknown"
-                    for q in ["q8_0","q6_k","q5_k_m","q5_k_s","q4_k_m","q4_k_s","q4_0","q3_k_m","q3_k_s","q2_k",
-                              "iq4_xs","iq4_nl","iq3_m","iq3_s","iq2_m","iq1_s","f16","bf16"]:
-                        if q in fl: quant = q.upper(); break
+                    m = _QUANT_RE.search(f); quant = m.group(1).upper() if m else "unknown"
                     sz = size_map.get(f, 0)
                     sha = sha_map.get(f, "")
                     gguf_files.append({"name": f, "quant": quant, "size": sz, "sha256": sha})
             self.sig_files.emit(self.repo_id, gguf_files)
         except Exception as e: self.sig_err.emit(str(e))
 
+class FileIOWorker(_PooledWorker):
+    """Run fn() (JSON import/export file I/O) on the pool; sig_done carries its return value."""
+    sig_done = pyqtSignal(object); sig_err = pyqtSignal(str)
+    def __init__(self, fn): super().__init__(); self.fn = fn
+    def run(self):
+        try: self.sig_done.emit(self.fn())
+        except Exception as e: self.sig_err.emit(str(e))
+
+class OllamaTagsWorker(_PooledWorker):
+    """Ollama status / installed models off the UI thread."""
+    sig_done = pyqtSignal(str, list)
+    def run(self): self.sig_done.emit(*_ollama_tags())
+
 def _gpu_power_watts():
     """Read current GPU power draw in watts via nvidia-smi."""
-    for p in ["nvidia-smi", r"C:\Windows\System32\nvidia-smi.exe",
-              r"C:\Program Files\NVIDIA Corporation\NVSMI\nvidia-smi.exe"]:
+    for p in HardwareInfo.NVSMI_PATHS:
         try:
             out = subprocess.check_output([p,"--query-gpu=power.draw","--format=csv,noheader,nounits"],
-                text=True, stderr=subprocess.DEVNULL, timeout=5)
+                text=True, stderr=subprocess.DEVNULL, timeout=HardwareInfo.NVSMI_TIMEOUT,
+                creationflags=_SUBPROC_FLAGS)
             return round(float(out.strip().split("\n")[0].strip()), 1)
         except: continue
     return 0
 
 class BenchWorker(QThread):
     sig_done = pyqtSignal(dict); sig_err = pyqtSignal(str)
+    sig_partial = pyqtSignal(float)  # live tok/s estimate while streaming
     def __init__(self, model_path, backend, prompt):
         super().__init__(); self.model_path = model_path; self.backend = backend; self.prompt = prompt
     def run(self):
@@ -704,12 +1070,22 @@ class BenchWorker(QThread):
             # Sample GPU power before and during inference
             power_start = _gpu_power_watts()
             start = _t.time()
-            resp = requests.post("http://localhost:11434/api/generate",
-                json={"model": self.model_path, "prompt": self.prompt, "stream": False}, timeout=120)
+            # Stream NDJSON chunks (~1 token each); final chunk (done=true) carries the eval counters
+            data = {}; n = 0; first = last_emit = 0.0
+            with requests.post("http://localhost:11434/api/generate", stream=True, timeout=120,
+                    json={"model": self.model_path, "prompt": self.prompt, "stream": True}) as resp:
+                for line in resp.iter_lines():
+                    if not line: continue
+                    data = _loads(line)
+                    if data.get("error"): raise RuntimeError(data["error"])
+                    if data.get("done"): break
+                    n += 1; now = _t.monotonic()
+                    if not first: first = now
+                    elif now - last_emit >= 0.2:
+                        self.sig_partial.emit(round((n - 1) / (now - first), 1)); last_emit = now
             elapsed = _t.time() - start
             power_end = _gpu_power_watts()
             avg_watts = round((power_start + power_end) / 2, 1) if power_start > 0 else 0
-            data = resp.json()
             total_tokens = data.get("eval_count", 0)
             eval_dur = data.get("eval_duration", 0) / 1e9
             toks = round(total_tokens / eval_dur, 1) if eval_dur > 0 else 0
@@ -740,7 +1116,8 @@ class DownloadQueue(QObject):
     sig_queue_changed = pyqtSignal()     # queue updated
 
     def __init__(self):
-        super().__init__(); self._queue = []; self._active = None; self._worker = None
+        super().__init__(); self._queue = deque(); self._active = None; self._worker = None
+        self._retired = set()  # cancelled workers kept alive until their thread actually exits
 
     @property
     def queue(self): return list(self._queue)
@@ -755,25 +1132,27 @@ class DownloadQueue(QObject):
         if not self._active: self._next()
 
     def cancel_active(self):
-        if self._worker:
-            self._worker.cancel()
-            try: self._worker.terminate()
-            except: pass
+        w = self._worker
+        if w:
+            # Cooperative stop: terminate() can kill the thread mid-write and leave a stale .incomplete / lock
+            w.cancel(); w.sig_done.disconnect(); w.sig_err.disconnect()
+            if w.isRunning(): self._retired.add(w); w.finished.connect(lambda: self._retired.discard(w))
+            self._worker = None
         self._active = None; self.sig_queue_changed.emit()
         self._next()
 
     def remove_queued(self, idx):
         if 0 <= idx < len(self._queue):
-            self._queue.pop(idx); self.sig_queue_changed.emit()
+            del self._queue[idx]; self.sig_queue_changed.emit()
 
     def _next(self):
         if not self._queue: self._active = None; self.sig_queue_changed.emit(); return
-        item = self._queue.pop(0); m = item["model"]; dest = item["dest"]
+        item = self._queue.popleft(); m = item["model"]; dest = item["dest"]
         self._active = m; self.sig_started.emit(m)
         self._worker = DownloadWorker(m["repo"], m.get("file",""), dest)
-        self._worker.sig_status.connect(lambda s: None)
-        self._worker.sig_done.connect(lambda p: self._on_done(p))
-        self._worker.sig_err.connect(lambda e: self._on_err(e))
+        self._worker.sig_status.connect(lambda s: None, _QUEUED)
+        self._worker.sig_done.connect(lambda p: self._on_done(p), _QUEUED)
+        self._worker.sig_err.connect(lambda e: self._on_err(e), _QUEUED)
         self._worker.start(); self.sig_queue_changed.emit()
 
     def _on_done(self, path):
@@ -789,49 +1168,102 @@ class DownloadQueue(QObject):
 # ═══════════════════════════════════════════════════════════════════════════════
 # UI COMPONENTS
 # ═══════════════════════════════════════════════════════════════════════════════
+def _set_text(lbl, text):
+    """setText only when the text actually changes (an identical setText still relayouts the label)."""
+    if lbl.text() != text: lbl.setText(text)
+
+def _reveal(path):
+    """Show a file in the system file manager without blocking (argv list, no shell quoting of the path)."""
+    if sys.platform == "win32": QProcess.startDetached("explorer", ["/select,", str(path)])
+    else: QDesktopServices.openUrl(QUrl.fromLocalFile(str(Path(path).parent)))
+
+def _set_cell(tbl, row, col, text, fg=None):
+    """Write a table cell, reusing its QTableWidgetItem when there is one (reloads mostly keep the row count)."""
+    it = tbl.item(row, col)
+    if it is None: it = QTableWidgetItem(); tbl.setItem(row, col, it)
+    it.setText(text); it.setData(Qt.ItemDataRole.ForegroundRole, fg)
+
+@contextlib.contextmanager
+def _updates_off(w):
+    """Suspend repaints of w while a block rebuilds its children; one repaint afterwards."""
+    w.setUpdatesEnabled(False)
+    try: yield
+    finally: w.setUpdatesEnabled(True)
+
+def _swap_body(host, old, margins=(0,0,6,0)):
+    """Replace container old (inside a QScrollArea or layout host) with a fresh empty one; a single
+    deleteLater tears the old subtree down in C++ instead of a takeAt() loop per child."""
+    w = QWidget(); lo = QVBoxLayout(w); lo.setSpacing(6); lo.setContentsMargins(*margins)
+    if isinstance(host, QScrollArea): host.takeWidget(); host.setWidget(w)
+    else: host.replaceWidget(old, w)
+    old.deleteLater(); return w, lo
+
+def _batched_list(lw, batch=50, uniform=True):
+    """Lay out QListWidget items in batches (keeps the event loop responsive on long lists). uniform=True lets Qt
+    size every row like the first and skip per-item measuring; only for lists whose rows are all single-line."""
+    lw.setLayoutMode(QListView.LayoutMode.Batched); lw.setBatchSize(batch); lw.setUniformItemSizes(uniform)
+    return lw
+
 class ScoreBar(QWidget):
+    _PIX = {}  # (score, w, h, theme, dpr) -> pre-rendered QPixmap shared by all bars
     def __init__(self, score, w=90, h=12):
         super().__init__(); self._s = score; self.setFixedSize(w + 30, h + 4)
         self._w = w; self._h = h
-    def paintEvent(self, e):
-        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        t = T(); p.setPen(Qt.PenStyle.NoPen)
-        p.setBrush(QColor(t['bg3'])); p.drawRoundedRect(0, 2, self._w, self._h, 4, 4)
+    def set_score(self, score):
+        if score != self._s: self._s = score; self.update()
+    def _render(self, dpr):
+        pix = QPixmap(int(self.width() * dpr), int(self.height() * dpr)); pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pix); p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        t = THEME; p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(_qcolor(t['bg3'])); p.drawRoundedRect(0, 2, self._w, self._h, 4, 4)
         ratio = self._s / 100; c = t['gn'] if self._s >= 85 else t['og'] if self._s >= 70 else t['rd']
-        p.setBrush(QColor(c)); p.drawRoundedRect(0, 2, int(self._w * ratio), self._h, 4, 4)
-        p.setPen(QColor(t['tx'])); f = p.font(); f.setPixelSize(10); f.setBold(True); p.setFont(f)
+        p.setBrush(_qcolor(c)); p.drawRoundedRect(0, 2, int(self._w * ratio), self._h, 4, 4)
+        p.setPen(_qcolor(t['tx'])); f = QFont(self.font()); f.setPixelSize(10); f.setBold(True); p.setFont(f)
         p.drawText(self._w + 4, self._h, str(self._s)); p.end()
+        return pix
+    def paintEvent(self, e):
+        dpr = self.devicePixelRatioF(); key = (self._s, self._w, self._h, current_theme, dpr)
+        pix = ScoreBar._PIX.get(key)
+        if pix is None: pix = ScoreBar._PIX[key] = self._render(dpr)
+        p = QPainter(self); p.drawPixmap(0, 0, pix); p.end()
 
 class BenchChart(QWidget):
     """Simple horizontal bar chart for benchmark history."""
     def __init__(self, data, parent=None):
-        super().__init__(parent); self._data = data  # list of {"model":..., "tok_s":...}
-        self.setMinimumHeight(max(40, len(data) * 32 + 20))
+        super().__init__(parent); self.set_data(data)
+    def set_data(self, data):
+        """Swap in new history (list of {"model":..., "tok_s":...}) and repaint; the widget itself is kept."""
+        if getattr(self, "_data", None) == data: return  # e.g. baseline pin/clear reloads history with the same runs
+        self._data = data
+        # Rows are precomputed per data set: (label, ratio, theme colour key, value text)
+        mx = max((d["tok_s"] for d in data), default=0) or 1
+        self._rows = [(d["model"][:18] + ("..." if len(d["model"]) > 18 else ""), d["tok_s"] / mx,
+                       'gn' if d["tok_s"] >= 20 else 'og' if d["tok_s"] >= 10 else 'rd', f"{d['tok_s']} t/s") for d in data]
+        self.setMinimumHeight(max(40, len(data) * 32 + 20)); self.update()
     def paintEvent(self, e):
-        if not self._data: return
-        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing); t = T()
-        w = self.width(); h = self.height(); n = len(self._data)
-        max_tok = max(d["tok_s"] for d in self._data) or 1; bar_h = min(24, (h - 10) // max(n, 1))
-        for i, d in enumerate(self._data):
-            y = 5 + i * (bar_h + 6); ratio = d["tok_s"] / max_tok
-            label_w = 140; bar_w = int((w - label_w - 70) * ratio)
+        if not self._rows: return
+        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing); t = THEME
+        w = self.width(); h = self.height(); n = len(self._rows)
+        bar_h = min(24, (h - 10) // max(n, 1)); label_w = 140; span = w - label_w - 70
+        right = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter; left = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        for i, (label, ratio, ck, val) in enumerate(self._rows):
+            y = 5 + i * (bar_h + 6); bar_w = int(span * ratio)
             # Label
-            p.setPen(QColor(t['tx2'])); f = p.font(); f.setPixelSize(11); p.setFont(f)
-            model_short = d["model"][:18] + ("..." if len(d["model"]) > 18 else "")
-            p.drawText(0, y, label_w, bar_h, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, model_short)
+            p.setPen(_qcolor(t['tx2'])); f = p.font(); f.setPixelSize(11); p.setFont(f)
+            p.drawText(0, y, label_w, bar_h, right, label)
             # Bar
             p.setPen(Qt.PenStyle.NoPen)
-            c = t['gn'] if d["tok_s"] >= 20 else t['og'] if d["tok_s"] >= 10 else t['rd']
-            p.setBrush(QColor(c)); p.drawRoundedRect(label_w + 8, y, max(4, bar_w), bar_h, 4, 4)
+            p.setBrush(_qcolor(t[ck])); p.drawRoundedRect(label_w + 8, y, max(4, bar_w), bar_h, 4, 4)
             # Value
-            p.setPen(QColor(t['tx'])); f.setBold(True); p.setFont(f)
-            p.drawText(label_w + bar_w + 14, y, 60, bar_h, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, f"{d['tok_s']} t/s")
+            p.setPen(_qcolor(t['tx'])); f.setBold(True); p.setFont(f)
+            p.drawText(label_w + bar_w + 14, y, 60, bar_h, left, val)
         p.end()
 
 class CompareWidget(QFrame):
     def __init__(self, models, hw):
         super().__init__(); t = T()
-        self.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['ac']};border-radius:12px;padding:14px;}}")
+        self.setStyleSheet(_ss_frame(current_theme, "ac", 12, 14))
         lo = QVBoxLayout(self); lo.setSpacing(8)
         lo.addWidget(QLabel(f"<span style='color:{t['ac']};font-size:15px;font-weight:bold'>📊 Side-by-Side Comparison</span>"))
         # Four-axis scoring: Quality, Speed, Fit, Context
@@ -839,7 +1271,7 @@ class CompareWidget(QFrame):
         axis_data = []
         for m in models:
             active_gb = _parse_active_gb(m.get("p",""), m["gb"])
-            toks = hw.estimate_toks(m["gb"], active_gb); lbl, clr = hw.speed_label(toks)
+            toks = hw.estimate_toks(m["gb"], active_gb)
             fits = m.get("gb",0) <= mx
             # Normalize axes: Quality (0-100 score), Speed (tok/s, capped at 60), Fit (bool=100 or 0), Context (K tokens, capped at 256)
             axis_data.append({
@@ -856,47 +1288,110 @@ class CompareWidget(QFrame):
         tbl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         tbl.verticalHeader().setStyleSheet(f"color:{t['tx2']};font-size:12px;")
         tbl.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers); tbl.setMaximumHeight(200)
+        tbl.setUpdatesEnabled(False); tbl.blockSignals(True)  # one repaint after all cells are placed
         for j, d in enumerate(axis_data):
             # Row 0: Quality (0-100)
             qual_norm = min(1.0, d["quality"] / 100.0); qual_bar = "#" * int(qual_norm * 10) + "-" * (10 - int(qual_norm * 10))
-            item = QTableWidgetItem(f"{qual_bar} {d['quality']}"); item.setForeground(QColor(t['ac'])); tbl.setItem(0, j, item)
+            item = QTableWidgetItem(f"{qual_bar} {d['quality']}"); item.setForeground(_qcolor(t['ac'])); tbl.setItem(0, j, item)
             # Row 1: Speed (tok/s, bar)
             speed_norm = d["speed"] / 60.0; speed_bar = "#" * int(speed_norm * 10) + "-" * (10 - int(speed_norm * 10))
             clr = t['gn'] if d["speed"] >= 20 else t['og'] if d["speed"] >= 10 else t['rd']
-            item = QTableWidgetItem(f"{speed_bar} {d['speed']}"); item.setForeground(QColor(clr)); tbl.setItem(1, j, item)
+            item = QTableWidgetItem(f"{speed_bar} {d['speed']}"); item.setForeground(_qcolor(clr)); tbl.setItem(1, j, item)
             # Row 2: Fits (yes/no)
             fits_txt = "Y" if d["fit"] > 0 else "N"
-            item = QTableWidgetItem(fits_txt); item.setForeground(QColor(t['gn'] if d["fit"] > 0 else t['rd'])); tbl.setItem(2, j, item)
+            item = QTableWidgetItem(fits_txt); item.setForeground(_qcolor(t['gn'] if d["fit"] > 0 else t['rd'])); tbl.setItem(2, j, item)
             # Row 3: Context
             ctx_norm = min(1.0, d["context"] / 256.0); ctx_bar = "#" * int(ctx_norm * 10) + "-" * (10 - int(ctx_norm * 10))
-            item = QTableWidgetItem(f"{ctx_bar} {d['context']}K"); item.setForeground(QColor(t['tl'])); tbl.setItem(3, j, item)
+            item = QTableWidgetItem(f"{ctx_bar} {d['context']}K"); item.setForeground(_qcolor(t['tl'])); tbl.setItem(3, j, item)
+        tbl.blockSignals(False); tbl.setUpdatesEnabled(True)
         lo.addWidget(tbl)
 
+@functools.lru_cache(maxsize=8)
+def _card_spec_tmpl(theme):
+    """Model-card spec line with the theme colour baked in once; cards only substitute their fields."""
+    return string.Template(f"$p<span style='color:{THEMES[theme]['tx2']}'> · $q ≈ $gb GB · Ctx: $ctx · $lic</span>")
+
+_CARD_QSS = {  # ModelCard stylesheets per role; $keys are theme colours
+    # Card labels are styled by object name from the frame's sheet instead of one sheet per label
+    "frame": "QFrame{background:$bg1;border:1px solid $bd;border-radius:10px;padding:12px;}"
+             "QLabel#cardName{font-size:14px;font-weight:bold;color:$ac;}"
+             "QLabel#cardCat{background:$bg3;color:$tx2;padding:2px 8px;border-radius:10px;font-size:11px;}"
+             "QLabel#cardDesc{color:$tx;font-size:12px;}"
+             "QLabel#cardTag{background:$bg3;color:$tx;padding:2px 8px;border-radius:10px;font-size:10px;}"
+             "QLabel#cardBf{color:$gn;font-size:11px;font-style:italic;}",
+    "star_on": "QPushButton{background:transparent;color:$og;font-size:16px;border:none;}QPushButton:hover{color:$og;}",
+    "star_off": "QPushButton{background:transparent;color:$tx3;font-size:16px;border:none;}QPushButton:hover{color:$og;}",
+    "note": "QPushButton{background:transparent;font-size:14px;border:none;}QPushButton:hover{background:$bg3;border-radius:4px;}",
+    "dl": "QPushButton{background:$gn;color:$bg0;font-size:11px;padding:3px 12px;border-radius:6px;font-weight:bold;}QPushButton:hover{background:$tl;}",
+    "ollama": "QPushButton{background:#76b900;color:#000;font-size:11px;padding:3px 12px;border-radius:6px;font-weight:bold;}QPushButton:hover{background:#88cc00;}",
+}
+@functools.lru_cache(maxsize=64)
+def _card_qss(theme, role):
+    """Formatted ModelCard stylesheet for (theme, role); every card shares the same string object."""
+    return string.Template(_CARD_QSS[role]).substitute(THEMES[theme])
+@functools.lru_cache(maxsize=64)
+def _ss_frame(theme, border="bd", radius=10, pad=12, bw=1, tx=False):
+    """Panel QFrame stylesheet; identical panels share one string, so Qt's parsed-sheet cache hits too."""
+    t = THEMES[theme]
+    return (f"QFrame{{background:{t['bg1']};" + (f"color:{t['tx']};" if tx else "")
+            + f"border:{bw}px solid {t[border]};border-radius:{radius}px;padding:{pad}px;}}")
+
+# Sharded/large models that download through "ollama pull" instead of a single GGUF
+_OLLAMA_TAGS = {"Qwen3-235B-A22B":"qwen3:235b","Llama-4-Scout":"llama4-scout","DeepSeek-V3":"deepseek-v3","Mistral-Large-2":"mistral-large"}
+
 class ModelCard(QFrame):
     sig_dl = pyqtSignal(dict); sig_compare = pyqtSignal(dict, bool)
     def __init__(self, m, hw=None, show_speed=True, show_compare=False):
-        super().__init__(); self._m = m; t = T()
-        self.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:10px;padding:12px;}}")
+        super().__init__(); self._hw = hw; self._show_speed = show_speed; self._th = None
         lo = QVBoxLayout(self); lo.setSpacing(4); lo.setContentsMargins(12,10,12,8)
         r1 = QHBoxLayout(); r1.setSpacing(6)
-        is_fav = FavoritesManager.is_fav(m["n"])
-        self._star = QPushButton("★" if is_fav else "☆"); self._star.setFixedSize(26,26); self._star.setCursor(Qt.CursorShape.PointingHandCursor)
-        sc = t['og'] if is_fav else t['tx3']
-        self._star.setStyleSheet(f"QPushButton{{background:transparent;color:{sc};font-size:16px;border:none;}}QPushButton:hover{{color:{t['og']};}}")
-        self._star.setToolTip("Unfavorite" if is_fav else "Add to Favorites")
+        self._star = QPushButton(); self._star.setFixedSize(26,26); self._star.setCursor(Qt.CursorShape.PointingHandCursor)
         self._star.clicked.connect(self._toggle_fav); r1.addWidget(self._star)
-        nm = QLabel(m["n"]); nm.setStyleSheet(f"font-size:14px;font-weight:bold;color:{t['ac']};"); r1.addWidget(nm)
-        cat = QLabel(m["cat"]); cat.setStyleSheet(f"background:{t['bg3']};color:{t['tx2']};padding:2px 8px;border-radius:10px;font-size:11px;"); r1.addWidget(cat)
-        note = FavoritesManager.get_note(m["n"])
-        self._note_btn = QPushButton("📝" if note else "📋"); self._note_btn.setFixedSize(26,26); self._note_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self._note_btn.setStyleSheet(f"QPushButton{{background:transparent;font-size:14px;border:none;}}QPushButton:hover{{background:{t['bg3']};border-radius:4px;}}")
-        self._note_btn.setToolTip(f"Note: {note}" if note else "Add a note")
+        self._nm = QLabel(); self._nm.setObjectName("cardName"); r1.addWidget(self._nm)
+        self._cat = QLabel(); self._cat.setObjectName("cardCat"); r1.addWidget(self._cat)
+        self._note_btn = QPushButton(); self._note_btn.setFixedSize(26,26); self._note_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self._note_btn.clicked.connect(self._edit_note); r1.addWidget(self._note_btn)
-        r1.addStretch(); r1.addWidget(ScoreBar(m["sc"])); lo.addLayout(r1)
+        self._score = ScoreBar(0); r1.addStretch(); r1.addWidget(self._score); lo.addLayout(r1)
         # Specs + speed + fit + VRAM warning
-        sp_parts = [f"{m['p']}", f"{m['q']} ≈ {m['gb']} GB", f"Ctx: {m['ctx']}", m['lic']]
-        sp_html = f"<span style='color:{t['tx2']}'> · ".join(sp_parts) + "</span>"
-        if hw and show_speed:
+        self._sp = QLabel(); self._sp.setTextFormat(Qt.TextFormat.RichText); self._sp.setWordWrap(True); self._sp.setStyleSheet("font-size:12px;"); lo.addWidget(self._sp)
+        self._d = QLabel(); self._d.setWordWrap(True); self._d.setObjectName("cardDesc"); lo.addWidget(self._d)
+        r4 = QHBoxLayout(); r4.setSpacing(4); self._tags = []
+        for _ in range(4):
+            lb = QLabel(); lb.setObjectName("cardTag"); lb.setFixedHeight(18); r4.addWidget(lb); self._tags.append(lb)
+        r4.addStretch()
+        self._bf = QLabel(); self._bf.setObjectName("cardBf"); r4.addWidget(self._bf)
+        self._cb = None
+        if show_compare:
+            self._cb = QCheckBox("Compare"); self._cb.stateChanged.connect(lambda s: self.sig_compare.emit(self._m, s == Qt.CheckState.Checked.value))
+            r4.addWidget(self._cb)
+        self._dl_btn = QPushButton("⬇ Download"); self._dl_btn.setFixedHeight(26); self._dl_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._dl_btn.clicked.connect(lambda: self.sig_dl.emit(self._m)); r4.addWidget(self._dl_btn)
+        self._pull_btn = QPushButton("🟢 ollama pull"); self._pull_btn.setFixedHeight(26); self._pull_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._pull_btn.clicked.connect(lambda: self.sig_dl.emit({"_ollama_pull": _OLLAMA_TAGS[self._m["n"]], "n": self._m["n"]})); r4.addWidget(self._pull_btn)
+        lo.addLayout(r4)
+        self.rebind(m)
+
+    def _apply_theme(self, th):
+        self._th = th; self.setStyleSheet(_card_qss(th, "frame")); self._note_btn.setStyleSheet(_card_qss(th, "note"))
+        self._dl_btn.setStyleSheet(_card_qss(th, "dl")); self._pull_btn.setStyleSheet(_card_qss(th, "ollama"))
+
+    def _set_star(self, on):
+        self._star.setText("★" if on else "☆")
+        self._star.setStyleSheet(_card_qss(current_theme, "star_on" if on else "star_off"))
+        self._star.setToolTip("Unfavorite" if on else "Add to Favorites")
+
+    def _set_note(self, note):
+        self._note_btn.setText("📝" if note else "📋")
+        self._note_btn.setToolTip(f"Note: {note}" if note else "Add a note")
+
+    def rebind(self, m):
+        """Show model m in this card, updating the existing widgets in place (lets pages recycle cards)."""
+        self._m = m; t = THEME; hw = self._hw
+        if self._th != current_theme: self._apply_theme(current_theme)
+        self._set_star(FavoritesManager.is_fav(m["n"])); self._set_note(FavoritesManager.get_note(m["n"]))
+        self._nm.setText(m["n"]); self._cat.setText(m["cat"]); self._score.set_score(m["sc"])
+        sp_html = _card_spec_tmpl(self._th).substitute(p=m['p'], q=m['q'], gb=m['gb'], ctx=m['ctx'], lic=m['lic'])
+        if hw and self._show_speed:
             active_gb = _parse_active_gb(m.get("p",""), m["gb"])
             toks = hw.estimate_toks(m["gb"], active_gb); lbl, clr = hw.speed_label(toks)
             moe_tag = f" <span style='color:{t['tl']};font-size:11px'>(MoE)</span>" if active_gb is not None else ""
@@ -921,42 +1416,23 @@ class ModelCard(QFrame):
                 best_q = _best_quant_for_hw(m, mx)
                 if best_q:
                     fit += f" <span style='color:{t['og']}'>↓ {best_q[0]} ({best_q[1]}GB) fits</span>"
-        sp = QLabel(sp_html + fit); sp.setTextFormat(Qt.TextFormat.RichText); sp.setWordWrap(True); sp.setStyleSheet("font-size:12px;"); lo.addWidget(sp)
-        d = QLabel(m["d"]); d.setWordWrap(True); d.setStyleSheet(f"color:{t['tx']};font-size:12px;"); lo.addWidget(d)
-        r4 = QHBoxLayout(); r4.setSpacing(4)
-        for tg in m.get("tags",[])[:4]:
-            lb = QLabel(tg); lb.setStyleSheet(f"background:{t['bg3']};color:{t['tx']};padding:2px 8px;border-radius:10px;font-size:10px;"); lb.setFixedHeight(18); r4.addWidget(lb)
-        r4.addStretch()
-        bf = QLabel(m.get("bf","")); bf.setStyleSheet(f"color:{t['gn']};font-size:11px;font-style:italic;"); r4.addWidget(bf)
-        if show_compare:
-            cb = QCheckBox("Compare"); cb.stateChanged.connect(lambda s: self.sig_compare.emit(m, s == Qt.CheckState.Checked.value))
-            r4.addWidget(cb)
-        if m.get("repo"):
-            btn = QPushButton("⬇ Download"); btn.setFixedHeight(26); btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(f"QPushButton{{background:{t['gn']};color:{t['bg0']};font-size:11px;padding:3px 12px;border-radius:6px;font-weight:bold;}}QPushButton:hover{{background:{t['tl']};}}")
-            btn.clicked.connect(lambda: self.sig_dl.emit(m)); r4.addWidget(btn)
-        elif m.get("n") in ("Qwen3-235B-A22B","Llama-4-Scout","DeepSeek-V3","Mistral-Large-2"):
-            # Ollama pull button for sharded/large models
-            _ollama_tags = {"Qwen3-235B-A22B":"qwen3:235b","Llama-4-Scout":"llama4-scout","DeepSeek-V3":"deepseek-v3","Mistral-Large-2":"mistral-large"}
-            tag = _ollama_tags.get(m["n"], m["n"].lower())
-            btn = QPushButton(f"🟢 ollama pull"); btn.setFixedHeight(26); btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet(f"QPushButton{{background:#76b900;color:#000;font-size:11px;padding:3px 12px;border-radius:6px;font-weight:bold;}}QPushButton:hover{{background:#88cc00;}}")
-            btn.clicked.connect(lambda _, t=tag: self.sig_dl.emit({"_ollama_pull": t, "n": m["n"]})); r4.addWidget(btn)
-        lo.addLayout(r4)
+        self._sp.setText(sp_html + fit); self._d.setText(m["d"])
+        tags = m.get("tags",[])[:4]
+        for i, lb in enumerate(self._tags):
+            if i < len(tags): lb.setText(tags[i])
+            lb.setVisible(i < len(tags))
+        self._bf.setText(m.get("bf",""))
+        if self._cb: self._cb.blockSignals(True); self._cb.setChecked(False); self._cb.blockSignals(False)
+        self._dl_btn.setVisible(bool(m.get("repo"))); self._pull_btn.setVisible(not m.get("repo") and m.get("n") in _OLLAMA_TAGS)
 
     def _toggle_fav(self):
-        t = T(); now = FavoritesManager.toggle_fav(self._m["n"])
-        self._star.setText("★" if now else "☆"); sc = t['og'] if now else t['tx3']
-        self._star.setStyleSheet(f"QPushButton{{background:transparent;color:{sc};font-size:16px;border:none;}}QPushButton:hover{{color:{t['og']};}}")
-        self._star.setToolTip("Unfavorite" if now else "Add to Favorites")
+        self._set_star(FavoritesManager.toggle_fav(self._m["n"]))
 
     def _edit_note(self):
         cur = FavoritesManager.get_note(self._m["n"])
         text, ok = QInputDialog.getText(self, f"Note — {self._m['n']}", "Your note:", text=cur)
         if ok:
-            FavoritesManager.set_note(self._m["n"], text)
-            self._note_btn.setText("📝" if text else "📋")
-            self._note_btn.setToolTip(f"Note: {text}" if text else "Add a note")
+            FavoritesManager.set_note(self._m["n"], text); self._set_note(text)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FIRST-RUN WIZARD
@@ -973,13 +1449,13 @@ class WizardDialog(QDialog):
         p0l.addWidget(QLabel(f"<div style='text-align:center;font-size:22px;font-weight:bold;color:{t['ac']}'>Welcome to {APP}</div>"))
         p0l.addWidget(QLabel(f"<div style='text-align:center;color:{t['tx2']}'>Let's find the perfect AI models for your computer.</div>"))
         p0l.addSpacing(16)
-        hw_box = QFrame(); hw_box.setStyleSheet(f"QFrame{{background:{t['bg1']};color:{t['tx']};border:1px solid {t['gn']};border-radius:12px;padding:16px;}}")
+        hw_box = QFrame(); hw_box.setStyleSheet(_ss_frame(current_theme, "gn", 12, 16, 1, True))
         hbl = QVBoxLayout(hw_box)
         hbl.addWidget(QLabel(f"<span style='color:{t['gn']};font-weight:bold;font-size:14px'>🖥️ Hardware Detected</span>"))
         gpu_c = {"nvidia":"#76b900","amd":"#ED1C24","intel":"#0071C5"}.get(hw.gpu_vendor, t['tx2'])
         vr = f"{hw.vram_gb} GB VRAM" if hw.vram_gb > 0 else "N/A"
-        hbl.addWidget(QLabel(f"<b>CPU:</b> {html_mod.escape(hw.cpu_name)} ({hw.cpu_cores}C/{hw.cpu_threads}T)<br>"
-            f"<b>RAM:</b> {hw.ram_gb} GB<br><b>GPU:</b> <span style='color:{gpu_c}'>{html_mod.escape(hw.gpu_name)}</span><br>"
+        hbl.addWidget(QLabel(f"<b>CPU:</b> {hw.cpu_name_html} ({hw.cpu_cores}C/{hw.cpu_threads}T)<br>"
+            f"<b>RAM:</b> {hw.ram_gb} GB<br><b>GPU:</b> <span style='color:{gpu_c}'>{hw.gpu_name_html}</span><br>"
             f"<b>VRAM:</b> <span style='color:{t['ac']}'>{vr}</span><br>"
             f"<b>Tier:</b> <span style='color:{t['gn']};font-weight:bold'>{hw.tier_label}</span> · Max GGUF: ~{hw.max_model_gb()} GB"))
         p0l.addWidget(hw_box); self._stack.addWidget(p0)
@@ -995,13 +1471,14 @@ class WizardDialog(QDialog):
         self._uc_btns = []
         for i, (icon, title, desc) in enumerate(uc_data):
             btn = QPushButton(f"{icon}\n{title}"); btn.setCheckable(True); btn.setFixedSize(145, 90)
-            btn.setStyleSheet(f"QPushButton{{background:{t['bg1']};border:2px solid {t['bd']};border-radius:12px;font-size:13px;font-weight:bold;color:{t['tx']};}}QPushButton:checked{{border-color:{t['ac']};background:{t['acs']};}}QPushButton:hover{{border-color:{t['ac2']};}}")
+            btn.setProperty("class", "uc")
             btn.setToolTip(desc); grid.addWidget(btn, i//4, i%4); self._uc_btns.append((btn, title))
         p1l.addLayout(grid); p1l.addStretch(); self._stack.addWidget(p1)
         # Page 2: Results
         p2 = QWidget(); self._p2l = QVBoxLayout(p2)
         self._p2l.addWidget(QLabel(f"<span style='font-size:18px;font-weight:bold;color:{t['ac']}'>⭐ Your Starter Pack</span>"))
-        self._rec_area = QVBoxLayout(); self._p2l.addLayout(self._rec_area); self._p2l.addStretch()
+        self._rec_w = QWidget(); self._rec_area = QVBoxLayout(self._rec_w); self._rec_area.setContentsMargins(0,0,0,0)
+        self._p2l.addWidget(self._rec_w); self._p2l.addStretch()
         self._stack.addWidget(p2)
         nav = QHBoxLayout()
         self._back = QPushButton("← Back"); self._back.setProperty("class","ghost"); self._back.clicked.connect(self._go_back); self._back.setVisible(False)
@@ -1021,34 +1498,40 @@ class WizardDialog(QDialog):
         self._back.setVisible(self._step > 0); self._next.setText("Next →")
     def _build_rec(self):
         t = T()
-        while self._rec_area.count():
-            it = self._rec_area.takeAt(0)
-            if it.widget(): it.widget().deleteLater()
-        sel = [title for btn, title in self._uc_btns if btn.isChecked()]
-        cat_map = {"Chat & Writing":["General Purpose","Small / Efficient"],"Coding":["Coding"],
-                   "Roleplay":["Roleplay","Uncensored"],"Uncensored":["Uncensored"],
-                   "Research":["General Purpose","Long Context"],"AI Agents":["Agents","Coding"]}
-        cats = set()
-        for s in sel: cats.update(cat_map.get(s, []))
-        mx = self._hw.max_model_gb()
-        cands = [m for m in MODEL_DB if m["cat"] in cats and m.get("gb",0) <= mx]
-        if not cands: cands = [m for m in MODEL_DB if m.get("gb",0) <= mx]
-        cands.sort(key=lambda m: m["sc"], reverse=True); top = cands[:3]; self._picks = [m["n"] for m in top]
-        if not top:
-            self._rec_area.addWidget(QLabel(f"<span style='color:{t['og']}'>No models fit. Check Models after setup.</span>"))
-        for i, m in enumerate(top):
-            toks = self._hw.estimate_toks(m["gb"], _parse_active_gb(m.get("p",""), m["gb"])); lbl, clr = self._hw.speed_label(toks)
-            frm = QFrame(); frm.setStyleSheet(f"QFrame{{background:{t['bg1']};color:{t['tx']};border:1px solid {t['gn'] if i==0 else t['bd']};border-radius:10px;padding:12px;}}")
-            fl = QVBoxLayout(frm); prefix = "⭐ TOP PICK — " if i == 0 else ""
-            fl.addWidget(QLabel(f"<span style='color:{t['ac']};font-size:14px;font-weight:bold'>{prefix}{m['n']}</span>"))
-            fl.addWidget(QLabel(f"<span style='color:{t['tx2']}'>{m['p']} · {m['gb']} GB · {m['ctx']} ctx</span>"
-                f"  <span style='color:{t[clr]};font-weight:bold'>~{toks} tok/s ({lbl})</span>"))
-            fl.addWidget(QLabel(f"<span style='color:{t['tx']}'>{html_mod.escape(m['d'])}</span>"))
-            self._rec_area.addWidget(frm)
+        with _updates_off(self._stack):
+            self._rec_w, self._rec_area = _swap_body(self._p2l, self._rec_w, (0,0,0,0))
+            sel = [title for btn, title in self._uc_btns if btn.isChecked()]
+            cats = _cats_for(frozenset(sel), "wiz")
+            mx = self._hw.max_model_gb()
+            cands = _select_models(mx, cats, by_score=True, limit=3)
+            if not cands: cands = _select_models(mx, by_score=True, limit=3)
+            top = cands[:3]; self._picks = [m["n"] for m in top]
+            if not top:
+                self._rec_area.addWidget(QLabel(f"<span style='color:{t['og']}'>No models fit. Check Models after setup.</span>"))
+            for i, m in enumerate(top):
+                toks = self._hw.estimate_toks(m["gb"], _parse_active_gb(m.get("p",""), m["gb"])); lbl, clr = self._hw.speed_label(toks)
+                frm = QFrame(); frm.setStyleSheet(_ss_frame(current_theme, "gn" if i==0 else "bd", 10, 12, 1, True))
+                fl = QVBoxLayout(frm); prefix = "⭐ TOP PICK — " if i == 0 else ""
+                fl.addWidget(QLabel(f"<span style='color:{t['ac']};font-size:14px;font-weight:bold'>{prefix}{m['n']}</span>"))
+                fl.addWidget(QLabel(f"<span style='color:{t['tx2']}'>{m['p']} · {m['gb']} GB · {m['ctx']} ctx</span>"
+                    f"  <span style='color:{t[clr]};font-weight:bold'>~{toks} tok/s ({lbl})</span>"))
+                fl.addWidget(QLabel(f"<span style='color:{t['tx']}'>{_DESC_HTML[m['n']]}</span>"))
+                self._rec_area.addWidget(frm)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PAGES
 # ═══════════════════════════════════════════════════════════════════════════════
+@functools.lru_cache(maxsize=8)
+def _sw_card_html(theme, state):
+    """Home Software card body for (theme, SoftwareDetector.state()); reopening the page reuses the string."""
+    t = THEMES[theme]; rows = []
+    # One rich-text label per card; <p> margins stand in for the layout spacing between rows
+    for k, ok, ver in state:
+        ic = f"<span style='color:{t['gn']}'>✓</span>" if ok else f"<span style='color:{t['tx3']}'>✗</span>"
+        ver_str = f" <span style='color:{t['tx3']};font-size:11px'>v{_esc(ver)}</span>" if ver else ""
+        rows.append(f"<p style='margin:0 0 6px 0'>{ic} <b>{SoftwareDetector.TOOLS[k]['name']}</b>{ver_str} <span style='color:{t['gn'] if ok else t['tx3']};font-size:12px'>{'Installed' if ok else 'Not found'}</span></p>")
+    return "".join(rows)
+
 class HomePage(QWidget):
     def __init__(self, hw, sw):
         super().__init__(); t = T()
@@ -1057,50 +1540,56 @@ class HomePage(QWidget):
         lo.addWidget(QLabel(f"<div style='text-align:center;color:{t['tx2']}'>Discover, download, and run local AI — tailored to your hardware</div>"))
         row = QHBoxLayout(); row.setSpacing(16)
         # HW card
-        hwc = QFrame(); hwc.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:12px;padding:18px;}}")
+        hwc = QFrame(); hwc.setStyleSheet(_ss_frame(current_theme, "bd", 12, 18))
         hl = QVBoxLayout(hwc)
         hl.addWidget(QLabel(f"<span style='font-size:15px;font-weight:bold;color:{t['ac']}'>🖥️ Your Hardware</span>"))
-        gc = {"nvidia":"#76b900","amd":"#ED1C24","intel":"#0071C5"}.get(hw.gpu_vendor, t['tx2'])
-        vr = f"{hw.vram_gb} GB" if hw.vram_gb > 0 else "N/A"
-        multi_row = ""
-        if hw.multi_gpu:
-            gpu_list = "<br>".join(f"  {html_mod.escape(g['name'])} ({g['vram_gb']}GB)" for g in hw.gpus)
-            multi_row = (f"<tr><td style='color:{t['tx2']}'>GPUs</td><td style='color:{t['pu']};font-weight:bold'>{hw.gpu_count}x — {hw.total_vram_gb} GB total</td></tr>"
-                         f"<tr><td></td><td style='color:{t['tx2']};font-size:11px'>{gpu_list}</td></tr>"
-                         f"<tr><td style='color:{t['tx2']}'>Multi-GPU Max</td><td style='color:{t['tl']};font-weight:bold'>~{hw.max_model_gb_multi()} GB</td></tr>")
-        hl.addWidget(QLabel(f"<table width='100%'><tr><td style='color:{t['tx2']};width:80px'>CPU</td><td>{html_mod.escape(hw.cpu_name)}</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>RAM</td><td>{hw.ram_gb} GB</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>GPU</td><td style='color:{gc};font-weight:bold'>{html_mod.escape(hw.gpu_name)}</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>VRAM</td><td style='color:{t['ac']};font-weight:bold'>{vr}</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>Tier</td><td style='color:{t['gn']};font-weight:bold'>{hw.tier_label}</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>Bandwidth</td><td>{hw.mem_bw} GB/s</td></tr>{multi_row}</table>"))
+        # One small label per field so a refresh only touches the values that changed
+        hg = QGridLayout(); hg.setColumnMinimumWidth(0, 80); hg.setColumnStretch(1, 1); self._hv = {}
+        for i, (key, cap) in enumerate((("cpu","CPU"),("ram","RAM"),("gpu","GPU"),("vram","VRAM"),("tier","Tier"),("bw","Bandwidth"),("multi",""))):
+            if cap: hg.addWidget(QLabel(f"<span style='color:{t['tx2']}'>{cap}</span>"), i, 0)
+            self._hv[key] = QLabel(); hg.addWidget(self._hv[key], i, 0 if key == "multi" else 1, 1, 2 if key == "multi" else 1)
+        hl.addLayout(hg); self._hw = hw; self.update_hw()
         # Refresh + Export buttons
         br = QHBoxLayout()
         rb = QPushButton("🔄 Refresh"); rb.setProperty("class","ghost"); rb.setFixedHeight(28)
-        rb.clicked.connect(lambda: (hw.refresh(), toast(f"Hardware refreshed: {hw.gpu_name} · {hw.vram_gb}GB")))
+        rb.clicked.connect(self._refresh_hw)
         br.addWidget(rb)
         eb = QPushButton("📋 Copy Profile"); eb.setProperty("class","ghost"); eb.setFixedHeight(28)
         eb.clicked.connect(lambda: (QApplication.clipboard().setText(hw.export_profile()), toast("System profile copied to clipboard!")))
         br.addWidget(eb); br.addStretch()
         hl.addLayout(br); hl.addStretch(); row.addWidget(hwc)
         # SW card
-        swc = QFrame(); swc.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:12px;padding:18px;}}")
+        swc = QFrame(); swc.setStyleSheet(_ss_frame(current_theme, "bd", 12, 18))
         sl = QVBoxLayout(swc)
         sl.addWidget(QLabel(f"<span style='font-size:15px;font-weight:bold;color:{t['ac']}'>⚙️ Software</span>"))
-        for k, info in SoftwareDetector.TOOLS.items():
-            ok = sw.is_installed(k); ver = sw.get_version(k)
-            ic = f"<span style='color:{t['gn']}'>✓</span>" if ok else f"<span style='color:{t['tx3']}'>✗</span>"
-            ver_str = f" <span style='color:{t['tx3']};font-size:11px'>v{ver}</span>" if ver else ""
-            sl.addWidget(QLabel(f"{ic} <b>{info['name']}</b>{ver_str} <span style='color:{t['gn'] if ok else t['tx3']};font-size:12px'>{'Installed' if ok else 'Not found'}</span>"))
-        sl.addStretch(); row.addWidget(swc)
+        sl.addWidget(QLabel(_sw_card_html(current_theme, sw.state()))); sl.addStretch(); row.addWidget(swc)
         # Quick start card
-        qc = QFrame(); qc.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:12px;padding:18px;}}")
+        qc = QFrame(); qc.setStyleSheet(_ss_frame(current_theme, "bd", 12, 18))
         ql = QVBoxLayout(qc)
         ql.addWidget(QLabel(f"<span style='font-size:15px;font-weight:bold;color:{t['ac']}'>🚀 Quick Start</span>"))
-        for n, title, desc in [("1","<b>🎯 Recommend</b>","HW detected — pick use case"),("2","<b>⬇ Download</b>","GGUF from HuggingFace"),("3","<b>Open in software</b>","Auto-integrates with Ollama/LM Studio")]:
-            ql.addWidget(QLabel(f"<span style='color:{t['ac']};font-size:18px;font-weight:bold'>{n}.</span> {title}<br><span style='color:{t['tx2']};font-size:12px'>{desc}</span>"))
+        ql.addWidget(QLabel("".join(f"<p style='margin:0 0 8px 0'><span style='color:{t['ac']};font-size:18px;font-weight:bold'>{n}.</span> {title}<br><span style='color:{t['tx2']};font-size:12px'>{desc}</span></p>"
+            for n, title, desc in [("1","<b>🎯 Recommend</b>","HW detected — pick use case"),("2","<b>⬇ Download</b>","GGUF from HuggingFace"),("3","<b>Open in software</b>","Auto-integrates with Ollama/LM Studio")])))
         ql.addStretch(); row.addWidget(qc)
         lo.addLayout(row, 1)
+    def _refresh_hw(self):
+        if not self._hw.refresh(): toast("Hardware info is already up to date"); return
+        self.update_hw(); toast(f"Hardware refreshed: {self._hw.gpu_name} · {self._hw.vram_gb}GB")
+    def update_hw(self):
+        hw = self._hw; t = T(); v = self._hv
+        gc = {"nvidia":"#76b900","amd":"#ED1C24","intel":"#0071C5"}.get(hw.gpu_vendor, t['tx2'])
+        vr = f"{hw.vram_gb} GB" if hw.vram_gb > 0 else "N/A"
+        _set_text(v["cpu"], hw.cpu_name_html); _set_text(v["ram"], f"{hw.ram_gb} GB")
+        _set_text(v["gpu"], f"<span style='color:{gc};font-weight:bold'>{hw.gpu_name_html}</span>")
+        _set_text(v["vram"], f"<span style='color:{t['ac']};font-weight:bold'>{vr}</span>")
+        _set_text(v["tier"], f"<span style='color:{t['gn']};font-weight:bold'>{hw.tier_label}</span>")
+        _set_text(v["bw"], f"{hw.mem_bw} GB/s")
+        multi = ""
+        if hw.multi_gpu:
+            gpu_list = "<br>".join(f"  {_esc(g['name'])} ({g['vram_gb']}GB)" for g in hw.gpus)
+            multi = (f"<table width='100%'><tr><td style='color:{t['tx2']};width:80px'>GPUs</td><td style='color:{t['pu']};font-weight:bold'>{hw.gpu_count}x — {hw.total_vram_gb} GB total</td></tr>"
+                     f"<tr><td></td><td style='color:{t['tx2']};font-size:11px'>{gpu_list}</td></tr>"
+                     f"<tr><td style='color:{t['tx2']}'>Multi-GPU Max</td><td style='color:{t['tl']};font-weight:bold'>~{hw.max_model_gb_multi()} GB</td></tr></table>")
+        _set_text(v["multi"], multi); v["multi"].setVisible(bool(multi))
 
 class LearnPage(QWidget):
     def __init__(self):
@@ -1109,18 +1598,19 @@ class LearnPage(QWidget):
         sb = QWidget(); sb.setFixedWidth(200); sb.setStyleSheet(f"background:{t['bg1']};border-right:1px solid {t['bd']};")
         sbl = QVBoxLayout(sb); sbl.setContentsMargins(8,14,8,8)
         sbl.addWidget(QLabel(f"<span style='font-weight:bold;color:{t['ac']}'>📖 Topics</span>"))
-        self._tp = _topics(t); self._ls = QListWidget()
+        self._tp = _topics(current_theme); self._ls = _batched_list(QListWidget())
         for k in self._tp: self._ls.addItem(k)
         sbl.addWidget(self._ls); lo.addWidget(sb)
         self._br = QTextBrowser(); self._br.setOpenExternalLinks(True)
         self._br.setStyleSheet(f"QTextBrowser{{background:{t['bg1']};border:none;padding:18px;}}"); lo.addWidget(self._br, 1)
-        self._ls.currentRowChanged.connect(lambda r: self._br.setHtml(list(self._tp.values())[r]) if r>=0 else None)
+        builders = list(self._tp.values())
+        self._ls.currentRowChanged.connect(lambda r: self._br.setHtml(builders[r]()) if r>=0 else None)
         self._ls.setCurrentRow(0)
 
 class ModelsPage(QWidget):
     sig_dl = pyqtSignal(dict)
     def __init__(self, hw):
-        super().__init__(); self._hw = hw; self._compare_set = []; t = T()
+        super().__init__(); self._hw = hw; self._compare_set = []; self._gen = 0; self._pool = []; t = T()
         lo = QVBoxLayout(self); lo.setContentsMargins(16,12,16,8); lo.setSpacing(8)
         hdr = QHBoxLayout()
         hdr.addWidget(QLabel(f"<span style='font-size:18px;font-weight:bold;color:{t['ac']}'>🗄️ Model Database</span>"))
@@ -1141,15 +1631,18 @@ class ModelsPage(QWidget):
         self._cmp_frame = None; self._cmp_lo = QVBoxLayout(); lo.addLayout(self._cmp_lo)
         sa = QScrollArea(); sa.setWidgetResizable(True); sa.setStyleSheet("QScrollArea{border:none;background:transparent;}")
         self._sw = QWidget(); self._sl = QVBoxLayout(self._sw); self._sl.setSpacing(6); self._sl.setContentsMargins(0,0,6,0)
-        sa.setWidget(self._sw); lo.addWidget(sa, 1)
-        for sig in [self._se.textChanged, self._cf.currentIndexChanged, self._sf.currentIndexChanged]:
+        self._sl.addStretch(); sa.setWidget(self._sw); lo.addWidget(sa, 1)
+        # Typing bursts collapse into one refresh; combo/toggle changes still apply immediately
+        self._refresh_timer = QTimer(self); self._refresh_timer.setSingleShot(True); self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._refresh); self._se.textChanged.connect(lambda _: self._refresh_timer.start())
+        for sig in [self._cf.currentIndexChanged, self._sf.currentIndexChanged]:
             sig.connect(self._refresh)
         self._ff.clicked.connect(self._refresh)
         self._refresh()
 
     def _on_compare(self, m, add):
         if add:
-            if len(self._compare_set) < 3 and m not in self._compare_set: self._compare_set.append(m)
+            if len(self._compare_set) < 3 and all(x["n"] != m["n"] for x in self._compare_set): self._compare_set.append(m)
         else: self._compare_set = [x for x in self._compare_set if x["n"] != m["n"]]
         self._cmp_btn.setText(f"📊 Compare ({len(self._compare_set)})")
     def _show_compare(self):
@@ -1157,23 +1650,27 @@ class ModelsPage(QWidget):
         if len(self._compare_set) >= 2:
             self._cmp_frame = CompareWidget(self._compare_set, self._hw); self._cmp_lo.addWidget(self._cmp_frame)
     def _refresh(self):
-        while self._sl.count():
-            it = self._sl.takeAt(0)
-            if it.widget(): it.widget().deleteLater()
-        q = self._se.text().lower(); cat = self._cf.currentText(); fl = MODEL_DB[:]
-        if q: fl = [m for m in fl if q in m["n"].lower() or q in m["d"].lower() or q in m["cat"].lower() or any(q in tg.lower() for tg in m.get("tags",[]))]
-        if cat != "All": fl = [m for m in fl if m["cat"]==cat]
-        if self._ff.isChecked(): mx = self._hw.max_model_gb(); fl = [m for m in fl if m.get("gb",0)<=mx]
-        si = self._sf.currentIndex()
-        if si==0: fl.sort(key=lambda m:m["sc"],reverse=True)
-        elif si==1: fl.sort(key=lambda m:m["sc"])
-        elif si==2: fl.sort(key=lambda m:m["n"].lower())
-        elif si==3: fl.sort(key=lambda m:m.get("gb",0))
-        elif si==4: fl.sort(key=lambda m:m.get("gb",0),reverse=True)
-        for m in fl:
-            c = ModelCard(m, self._hw, show_compare=True); c.sig_dl.connect(self.sig_dl.emit); c.sig_compare.connect(self._on_compare)
-            self._sl.addWidget(c)
-        self._sl.addStretch(); self._cnt.setText(f"{len(fl)}/{len(MODEL_DB)}")
+        q = self._se.text().lower(); cat = self._cf.currentText(); si = self._sf.currentIndex()
+        fl = _select_models(self._hw.max_model_gb() if self._ff.isChecked() else None, None if cat == "All" else (cat,),
+                            q=q, sort=("sc", "sc_asc", "name", "gb", "gb_desc")[si])
+        _set_text(self._cnt, f"{len(fl)}/{len(MODEL_DB)}")
+        # Recycle pooled cards in place; only the overflow beyond the pool is built (in batches)
+        n = min(len(fl), len(self._pool))
+        with _updates_off(self._sw):
+            for c, m in zip(self._pool, fl): c.rebind(m); c.setVisible(True)
+            for c in self._pool[n:]: c.setVisible(False)
+        self._gen += 1; self._fill(fl, n, self._gen)
+
+    _BATCH = 12  # cards built per event-loop turn; the first batch fills the viewport
+    def _fill(self, fl, start, gen):
+        """Materialise cards in batches so the first screenful paints before the rest are built."""
+        if gen != self._gen: return  # superseded by a newer _refresh
+        end = start + self._BATCH
+        with _updates_off(self._sw):
+            for m in fl[start:end]:
+                c = ModelCard(m, self._hw, show_compare=True); c.sig_dl.connect(self.sig_dl.emit); c.sig_compare.connect(self._on_compare)
+                self._sl.insertWidget(self._sl.count() - 1, c); self._pool.append(c)
+        if end < len(fl): QTimer.singleShot(0, lambda: self._fill(fl, end, gen))
 
 class RecommendPage(QWidget):
     sig_dl = pyqtSignal(dict)
@@ -1181,7 +1678,7 @@ class RecommendPage(QWidget):
         super().__init__(); self._hw = hw; t = T()
         lo = QHBoxLayout(self); lo.setContentsMargins(16,12,16,8); lo.setSpacing(16)
         left = QWidget(); left.setFixedWidth(320); ll = QVBoxLayout(left); ll.setContentsMargins(0,0,0,0); ll.setSpacing(10)
-        hf = QFrame(); hf.setStyleSheet(f"QFrame{{background:{t['bg1']};border:2px solid {t['gn']};border-radius:10px;padding:12px;}}")
+        hf = QFrame(); hf.setStyleSheet(_ss_frame(current_theme, "gn", 10, 12, 2))
         hfl = QVBoxLayout(hf)
         gs = hw.gpu_name if hw.vram_gb>0 else "CPU Only"; vs = f"({hw.vram_gb}GB)" if hw.vram_gb>0 else f"({hw.ram_gb}GB RAM)"
         hfl.addWidget(QLabel(f"<span style='color:{t['gn']};font-weight:bold'>🖥️ {html_mod.escape(gs)} {vs}</span><br>"
@@ -1197,37 +1694,47 @@ class RecommendPage(QWidget):
         self._rl = QLabel(f"<span style='font-size:17px;font-weight:bold;color:{t['ac']}'>📋 Results</span>"); rl.addWidget(self._rl)
         sa = QScrollArea(); sa.setWidgetResizable(True); sa.setStyleSheet("QScrollArea{border:none;background:transparent;}")
         self._sw = QWidget(); self._sl = QVBoxLayout(self._sw); self._sl.setSpacing(6); self._sl.setContentsMargins(0,0,6,0)
-        sa.setWidget(self._sw); rl.addWidget(sa, 1); lo.addWidget(right, 1)
+        sa.setWidget(self._sw); rl.addWidget(sa, 1); lo.addWidget(right, 1); self._sa = sa
         self._sl.addWidget(QLabel(f"<span style='color:{t['tx2']};padding:40px;font-size:14px'>Select use cases → Find</span>")); self._sl.addStretch()
     def _find(self):
         t = T()
-        while self._sl.count():
-            it = self._sl.takeAt(0)
-            if it.widget(): it.widget().deleteLater()
-        sel = [n for n, cb in self._ucs.items() if cb.isChecked()]
-        if not sel: self._sl.addWidget(QLabel(f"<span style='color:{t['og']}'>Select at least one use case.</span>")); self._sl.addStretch(); return
-        cats = set()
-        for n in sel: cats.update(USE_CASES[n]["cats"])
-        mx = self._hw.max_model_gb()
-        cands = sorted([m for m in MODEL_DB if m["cat"] in cats and m.get("gb",0)<=mx], key=lambda m:m["sc"], reverse=True)
-        gs = f"{self._hw.gpu_name} ({self._hw.vram_gb}GB)" if self._hw.vram_gb>0 else f"CPU ({self._hw.ram_gb}GB RAM)"
-        self._sl.addWidget(QLabel(f"<div style='background:{t['bg2']};border:1px solid {t['bd']};border-radius:10px;padding:12px'>"
-            f"<b style='color:{t['ac']}'>{html_mod.escape(gs)}</b> · {', '.join(sel)}<br>"
-            f"<span style='color:{t['gn']};font-weight:bold'>{len(cands)} models fit</span></div>"))
-        if cands:
-            tf = QFrame(); tf.setStyleSheet(f"QFrame{{background:{t['bg1']};border:2px solid {t['gn']};border-radius:12px;padding:4px;}}")
-            tfl = QVBoxLayout(tf); tfl.addWidget(QLabel(f"<span style='color:{t['gn']};font-size:13px;font-weight:bold'>⭐ TOP PICK</span>"))
-            c = ModelCard(cands[0], self._hw); c.sig_dl.connect(self.sig_dl.emit); tfl.addWidget(c); self._sl.addWidget(tf)
-            for m in cands[1:]: c = ModelCard(m, self._hw); c.sig_dl.connect(self.sig_dl.emit); self._sl.addWidget(c)
-        self._sl.addStretch(); self._rl.setText(f"<span style='font-size:17px;font-weight:bold;color:{t['ac']}'>📋 {len(cands)} Results</span>")
+        with _updates_off(self._sa):
+            self._sw, self._sl = _swap_body(self._sa, self._sw)
+            sel = [n for n, cb in self._ucs.items() if cb.isChecked()]
+            if not sel: self._sl.addWidget(QLabel(f"<span style='color:{t['og']}'>Select at least one use case.</span>")); self._sl.addStretch(); return
+            cats = _cats_for(frozenset(sel))
+            mx = self._hw.max_model_gb()
+            cands = _select_models(mx, cats, by_score=True)
+            gs = f"{self._hw.gpu_name} ({self._hw.vram_gb}GB)" if self._hw.vram_gb>0 else f"CPU ({self._hw.ram_gb}GB RAM)"
+            self._sl.addWidget(QLabel(f"<div style='background:{t['bg2']};border:1px solid {t['bd']};border-radius:10px;padding:12px'>"
+                f"<b style='color:{t['ac']}'>{html_mod.escape(gs)}</b> · {', '.join(sel)}<br>"
+                f"<span style='color:{t['gn']};font-weight:bold'>{len(cands)} models fit</span></div>"))
+            if cands:
+                tf = QFrame(); tf.setStyleSheet(_ss_frame(current_theme, "gn", 12, 4, 2))
+                tfl = QVBoxLayout(tf); tfl.addWidget(QLabel(f"<span style='color:{t['gn']};font-size:13px;font-weight:bold'>⭐ TOP PICK</span>"))
+                c = ModelCard(cands[0], self._hw); c.sig_dl.connect(self.sig_dl.emit); tfl.addWidget(c); self._sl.addWidget(tf)
+                for m in cands[1:]: c = ModelCard(m, self._hw); c.sig_dl.connect(self.sig_dl.emit); self._sl.addWidget(c)
+            self._sl.addStretch(); self._rl.setText(f"<span style='font-size:17px;font-weight:bold;color:{t['ac']}'>📋 {len(cands)} Results</span>")
+
+_BPW_TABLE = (3.0, 3.89, 4.83, 5.67, 6.57, 8.50, 16.0)  # bits/weight, same order as the VRAM calculator quant combo
+
+@functools.lru_cache(maxsize=8)
+def _vram_result_tmpl(theme):
+    """VRAM calculator result table with theme colours baked in; _calc only fills the numbers."""
+    t = THEMES[theme]
+    return string.Template(f"<table width='100%'><tr><td style='color:{t['tx2']}'>Model weights</td><td style='font-weight:bold'>$model_gb GB</td></tr>"
+        f"<tr><td style='color:{t['tx2']}'>KV cache (${{ctx}}K)</td><td>$kv_gb GB</td></tr>"
+        f"<tr><td style='color:{t['tx2']}'>Overhead</td><td>~0.5 GB</td></tr>"
+        f"<tr><td style='color:{t['ac']};font-weight:bold'>Total</td><td style='color:$fc;font-weight:bold;font-size:16px'>$total / $avail GB</td></tr>"
+        "<tr><td></td><td style='color:$fc;font-weight:bold'>$fl</td></tr></table>")
 
 class VRAMCalcPage(QWidget):
     def __init__(self, hw):
-        super().__init__(); self._hw = hw; t = T()
+        super().__init__(); self._hw = hw; self._last_calc = None; t = T()
         lo = QVBoxLayout(self); lo.setContentsMargins(24,16,24,12); lo.setSpacing(16)
         lo.addWidget(QLabel(f"<span style='font-size:18px;font-weight:bold;color:{t['ac']}'>📐 VRAM Calculator</span>"))
         lo.addWidget(QLabel(f"<span style='color:{t['tx2']}'>See exactly how a model fits your hardware. Drag the sliders.</span>"))
-        hw_lbl = QLabel(f"<b>Your GPU:</b> <span style='color:{t['gn']}'>{html_mod.escape(hw.gpu_name)}</span> — "
+        hw_lbl = QLabel(f"<b>Your GPU:</b> <span style='color:{t['gn']}'>{hw.gpu_name_html}</span> — "
             f"<span style='color:{t['ac']};font-weight:bold'>{hw.vram_gb} GB VRAM</span>" if hw.vram_gb > 0 else
             f"<b>CPU Only</b> — <span style='color:{t['ac']}'>{hw.ram_gb} GB RAM</span>")
         lo.addWidget(hw_lbl)
@@ -1243,7 +1750,7 @@ class VRAMCalcPage(QWidget):
         self._cs = QSlider(Qt.Orientation.Horizontal); self._cs.setRange(1, 128); self._cs.setValue(8)
         fl.addWidget(self._cs, 2, 1); self._cl = QLabel("8K"); fl.addWidget(self._cl, 2, 2)
         lo.addWidget(fg)
-        self._rb = QFrame(); self._rb.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:12px;padding:18px;}}")
+        self._rb = QFrame(); self._rb.setStyleSheet(_ss_frame(current_theme, "bd", 12, 18))
         self._rl = QVBoxLayout(self._rb); lo.addWidget(self._rb)
         self._result = QLabel(); self._result.setWordWrap(True); self._result.setTextFormat(Qt.TextFormat.RichText); self._rl.addWidget(self._result)
         self._bar_frame = QFrame(); self._bar_frame.setFixedHeight(40); self._rl.addWidget(self._bar_frame)
@@ -1253,9 +1760,9 @@ class VRAMCalcPage(QWidget):
         self._calc()
 
     def _calc(self):
-        t = T(); params = self._ps.value(); self._pl.setText(f"{params}B")
-        ctx = self._cs.value(); self._cl.setText(f"{ctx}K")
-        bpw = [3.0, 3.89, 4.83, 5.67, 6.57, 8.50, 16.0][self._qs.currentIndex()]
+        t = T(); params = self._ps.value(); _set_text(self._pl, f"{params}B")
+        ctx = self._cs.value(); _set_text(self._cl, f"{ctx}K")
+        bpw = _BPW_TABLE[self._qs.currentIndex()]
         model_gb = round(params * bpw / 8, 1); kv_gb = round(ctx * 0.5 / 1024 * 8, 1)
         total = round(model_gb + kv_gb + 0.5, 1)
         avail = self._hw.vram_gb if self._hw.vram_gb > 0 else self._hw.ram_gb
@@ -1263,11 +1770,10 @@ class VRAMCalcPage(QWidget):
         if ratio < 0.75: fc, fl = t['gn'], "✓ Comfortable fit"
         elif ratio < 0.95: fc, fl = t['og'], "⚠ Tight fit"
         else: fc, fl = t['rd'], "❌ Won't fit — offloading needed"
-        self._result.setText(f"<table width='100%'><tr><td style='color:{t['tx2']}'>Model weights</td><td style='font-weight:bold'>{model_gb} GB</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>KV cache ({ctx}K)</td><td>{kv_gb} GB</td></tr>"
-            f"<tr><td style='color:{t['tx2']}'>Overhead</td><td>~0.5 GB</td></tr>"
-            f"<tr><td style='color:{t['ac']};font-weight:bold'>Total</td><td style='color:{fc};font-weight:bold;font-size:16px'>{total} / {avail} GB</td></tr>"
-            f"<tr><td></td><td style='color:{fc};font-weight:bold'>{fl}</td></tr></table>")
+        key = (model_gb, ctx, avail, current_theme)
+        if key == self._last_calc: return  # slider moved within the same rounding step
+        self._last_calc = key
+        self._result.setText(_vram_result_tmpl(current_theme).substitute(model_gb=model_gb, ctx=ctx, kv_gb=kv_gb, total=total, avail=avail, fc=fc, fl=fl))
         toks = self._hw.estimate_toks(model_gb); lbl, clr = self._hw.speed_label(toks)
         self._speed.setText(f"<span style='color:{t[clr]};font-size:15px;font-weight:bold'>~{toks} tok/s ({lbl})</span>")
         self._bar_frame.update()
@@ -1285,11 +1791,11 @@ class DownloadsPage(QWidget):
         ob = QPushButton("Open"); ob.setProperty("class","ghost"); ob.clicked.connect(self._opendir); dr.addWidget(ob)
         lo.addLayout(dr)
         # Active download frame
-        self._df = QFrame(); self._df.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:10px;padding:14px;}}")
+        self._df = QFrame(); self._df.setStyleSheet(_ss_frame(current_theme, "bd", 10, 14))
         dfl = QVBoxLayout(self._df)
         self._dn = QLabel("No active download"); self._dn.setStyleSheet("font-size:14px;font-weight:bold;"); dfl.addWidget(self._dn)
         self._ds = QLabel("Select a model and click Download"); self._ds.setWordWrap(True); self._ds.setStyleSheet(f"color:{t['tx2']};"); dfl.addWidget(self._ds)
-        self._dp = QProgressBar(); self._dp.setRange(0,0); self._dp.setVisible(False); dfl.addWidget(self._dp)
+        self._dp = QProgressBar(); self._dp.setRange(0,0); self._dp.setVisible(False); dfl.addWidget(self._dp); self._busy_gen = 0
         br = QHBoxLayout()
         self._cb = QPushButton("Cancel"); self._cb.setProperty("class","sec"); self._cb.setVisible(False)
         self._cb.clicked.connect(self._cancel); br.addWidget(self._cb); br.addStretch()
@@ -1301,12 +1807,12 @@ class DownloadsPage(QWidget):
         dfl.addLayout(br); lo.addWidget(self._df)
         # Queue display
         self._queue_lbl = QLabel(f"<span style='font-size:14px;font-weight:bold;color:{t['ac']}'>Queue</span>"); lo.addWidget(self._queue_lbl)
-        self._queue_list = QListWidget(); self._queue_list.setMaximumHeight(100)
+        self._queue_list = _batched_list(QListWidget()); self._queue_list.setMaximumHeight(100)
         self._queue_list.setStyleSheet(f"QListWidget{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:8px;}}QListWidget::item{{padding:6px;border-bottom:1px solid {t['bd']};}}")
         lo.addWidget(self._queue_list)
         # History
         lo.addWidget(QLabel(f"<span style='font-size:14px;font-weight:bold;color:{t['ac']}'>History</span>"))
-        self._hist = QListWidget(); self._hist.setMaximumHeight(150)
+        self._hist = _batched_list(QListWidget(), uniform=False); self._hist.setMaximumHeight(150)  # two-line rows
         self._hist.setStyleSheet(f"QListWidget{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:8px;}}QListWidget::item{{padding:8px;border-bottom:1px solid {t['bd']};}}")
         self._hist.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self._hist.customContextMenuRequested.connect(self._hist_ctx)
@@ -1359,15 +1865,14 @@ class DownloadsPage(QWidget):
         dl_queue.sig_finished.connect(self._on_q_finished)
         dl_queue.sig_error.connect(self._on_q_error)
         dl_queue.sig_queue_changed.connect(self._update_queue_display)
-        self._load_hist()
+        self._hist_data = deque(self._get_hist(), maxlen=50); self._load_hist()
 
     def _browse(self):
         d = QFileDialog.getExistingDirectory(self,"Folder",self._dir.text())
         if d: self._dir.setText(d)
     def _opendir(self):
         d=self._dir.text(); Path(d).mkdir(parents=True,exist_ok=True)
-        if sys.platform=="win32": os.startfile(d)
-        else: subprocess.Popen(["xdg-open",d])
+        QDesktopServices.openUrl(QUrl.fromLocalFile(d))
 
     def start_download(self, m):
         """Entry point — called from model cards across the app."""
@@ -1384,16 +1889,22 @@ class DownloadsPage(QWidget):
         self._q.add(m, dest)
         toast(f"⬇ {m['n']} added to download queue ({self._q.count} in queue)")
 
+    def _show_busy(self, secs=3):
+        """Flash the indeterminate bar, then hide it: its animation repaints continuously for the whole
+        download, and there is no byte progress to show; the _ds status line carries on from there."""
+        self._busy_gen += 1; gen = self._busy_gen
+        self._dp.setRange(0,0); self._dp.setVisible(True)
+        QTimer.singleShot(secs * 1000, lambda: gen == self._busy_gen and self._dp.setVisible(False))
     def _start_ollama_pull(self, tag, name):
         t = T()
         if not self._sw.is_installed("ollama"):
             toast("❌ Ollama not installed. Install it first.", t['rd']); return
         self._dn.setText(f"🟢 Pulling {name} via Ollama...")
-        self._ds.setText(f"ollama pull {tag}"); self._dp.setVisible(True); self._dp.setRange(0,0)
+        self._ds.setText(f"ollama pull {tag}"); self._show_busy()
         self._cb.setVisible(True)
         self._ollama_wk = OllamaPullWorker(tag)
-        self._ollama_wk.sig_line.connect(lambda l: self._ds.setText(l[:120]))
-        self._ollama_wk.sig_done.connect(lambda msg, ok: self._ollama_done(msg, ok, name))
+        self._ollama_wk.sig_line.connect(lambda l: _set_text(self._ds, l[:120]), _QUEUED)
+        self._ollama_wk.sig_done.connect(lambda msg, ok: self._ollama_done(msg, ok, name), _QUEUED)
         self._ollama_wk.start()
 
     def _ollama_done(self, msg, ok, name):
@@ -1408,7 +1919,7 @@ class DownloadsPage(QWidget):
     def _on_q_started(self, m):
         t = T()
         self._dn.setText(f"⬇️ {m['n']} ({m.get('gb','?')} GB)")
-        self._ds.setText(f"Downloading {m.get('file','')}..."); self._dp.setVisible(True); self._dp.setRange(0,0)
+        self._ds.setText(f"Downloading {m.get('file','')}..."); self._show_busy()
         self._cb.setVisible(True); self._int_ollama.setVisible(False); self._int_lm.setVisible(False); self._oex.setVisible(False)
 
     def _on_q_finished(self, m, path):
@@ -1417,7 +1928,7 @@ class DownloadsPage(QWidget):
         self._oex.setVisible(True)
         try: self._oex.clicked.disconnect()
         except: pass
-        self._oex.clicked.connect(lambda: (subprocess.Popen(f'explorer /select,"{path}"') if sys.platform=="win32" else None))
+        self._oex.clicked.connect(lambda: _reveal(path))
         if self._sw.is_installed("ollama"):
             self._int_ollama.setVisible(True)
             try: self._int_ollama.clicked.disconnect()
@@ -1430,10 +1941,7 @@ class DownloadsPage(QWidget):
             except: pass
             self._int_lm.clicked.connect(lambda: self._do_lm(path))
         toast(f"✅ {m['n']} downloaded!", t['gn'])
-        # Tray notification
-        if hasattr(QApplication.instance(), '_tray') and QApplication.instance()._tray:
-            QApplication.instance()._tray.showMessage(APP, f"✅ {m['n']} downloaded!", QSystemTrayIcon.MessageIcon.Information, 5000)
-        h = self._get_hist(); h.append({"n":m["n"],"p":path,"gb":m.get("gb","?"),"t":time.strftime("%Y-%m-%d %H:%M")}); self._save_hist(h); self._load_hist()
+        self._add_hist({"n":m["n"],"p":path,"gb":m.get("gb","?"),"t":time.strftime("%Y-%m-%d %H:%M")})
         UpdateTrackerPage.register_download(m["n"], m.get("repo",""))
 
     def _on_q_error(self, m, err):
@@ -1442,12 +1950,11 @@ class DownloadsPage(QWidget):
         toast(f"❌ Download failed: {err[:80]}", t['rd'])
 
     def _update_queue_display(self):
-        self._queue_list.clear(); t = T()
-        active = self._q.active
-        if active: self._queue_list.addItem(f"⬇️ {active['n']} — downloading...")
-        for i, item in enumerate(self._q.queue):
-            self._queue_list.addItem(f"⏳ {item['model']['n']} — queued")
-        self._queue_lbl.setText(f"<span style='font-size:14px;font-weight:bold;color:{t['ac']}'>Queue ({self._q.count})</span>")
+        t = T(); active = self._q.active
+        rows = ([f"⬇️ {active['n']} — downloading..."] if active else []) + [f"⏳ {item['model']['n']} — queued" for item in self._q.queue]
+        blk = QSignalBlocker(self._queue_list)
+        self._queue_list.clear(); self._queue_list.addItems(rows); blk.unblock()
+        _set_text(self._queue_lbl, f"<span style='font-size:14px;font-weight:bold;color:{t['ac']}'>Queue ({self._q.count})</span>")
 
     def _do_ollama(self, path, name):
         ok, msg = self._sw.integrate_ollama(path, name); self._ds.setText(f"Ollama: {msg}")
@@ -1461,13 +1968,20 @@ class DownloadsPage(QWidget):
         self._q.cancel_active()
         self._dn.setText("⏹️ Cancelled"); self._dp.setVisible(False); self._cb.setVisible(False)
     def _get_hist(self):
-        try: return json.loads(HIST_FILE.read_text())
+        try: return _loads(HIST_FILE.read_text(encoding="utf-8"))
         except: return []
-    def _save_hist(self, h): HIST_FILE.write_text(json.dumps(h[-50:],indent=2))
+    def _save_hist(self):
+        """History lives in the bounded self._hist_data deque; disk is only written behind it (never re-read)."""
+        _write_later(HIST_FILE, lambda: _dumps(list(self._hist_data)))
+    @staticmethod
+    def _hist_row(e): return f"{e.get('n','')} · {e.get('gb','')}GB · {e.get('t','')}\n{e.get('p','')}"
     def _load_hist(self):
-        self._hist.clear()
-        for e in reversed(self._get_hist()):
-            self._hist.addItem(f"{e.get('n','')} · {e.get('gb','')}GB · {e.get('t','')}\n{e.get('p','')}")
+        blk = QSignalBlocker(self._hist)
+        with _updates_off(self._hist): self._hist.clear(); self._hist.addItems([self._hist_row(e) for e in reversed(self._hist_data)])
+        blk.unblock()
+    def _add_hist(self, e):
+        self._hist_data.append(e); self._save_hist(); self._hist.insertItem(0, self._hist_row(e))
+        while self._hist.count() > len(self._hist_data): self._hist.takeItem(self._hist.count() - 1)
     def _hist_ctx(self, pos):
         """Right-click context menu on history: delete downloaded file."""
         item = self._hist.itemAt(pos)
@@ -1477,15 +1991,15 @@ class DownloadsPage(QWidget):
         act_del = menu.addAction("🗑️ Delete downloaded file")
         act_open = menu.addAction("📁 Open in Explorer")
         action = menu.exec(self._hist.mapToGlobal(pos))
-        idx = self._hist.row(item); h = self._get_hist(); rev_idx = len(h) - 1 - idx
+        idx = self._hist.row(item); h = self._hist_data; rev_idx = len(h) - 1 - idx
         if 0 <= rev_idx < len(h):
             entry = h[rev_idx]; path = entry.get("p","")
             if action == act_del and path and Path(path).exists():
                 Path(path).unlink()
-                h.pop(rev_idx); self._save_hist(h); self._load_hist()
+                del h[rev_idx]; self._save_hist(); self._hist.takeItem(idx)
                 toast(f"🗑️ Deleted {Path(path).name}", T()['og'])
             elif action == act_open and path:
-                if sys.platform=="win32": subprocess.Popen(f'explorer /select,"{path}"')
+                _reveal(path)
 
     def _winget_install(self, key, pkg_id, name):
         t = T(); btn = self._install_btns.get(key)
@@ -1493,8 +2007,8 @@ class DownloadsPage(QWidget):
         self._install_log.setVisible(True)
         self._install_log.setText(f"<span style='color:{t['og']}'>⏳ Installing {name} via winget...</span>")
         worker = WingetInstallWorker(pkg_id, name)
-        worker.sig_line.connect(lambda line: self._install_log.setText(f"<span style='color:{t['tx2']};font-size:11px'>{html_mod.escape(line[:120])}</span>"))
-        worker.sig_done.connect(lambda msg, ok: self._winget_done(key, msg, ok))
+        worker.sig_line.connect(lambda line: _set_text(self._install_log, f"<span style='color:{t['tx2']};font-size:11px'>{html_mod.escape(line[:120])}</span>"), _QUEUED)
+        worker.sig_done.connect(lambda msg, ok: self._winget_done(key, msg, ok), _QUEUED)
         self._install_workers[key] = worker; worker.start()
     def _winget_done(self, key, msg, ok):
         t = T(); btn = self._install_btns.get(key); info = SoftwareDetector.TOOLS.get(key, {})
@@ -1524,94 +2038,141 @@ class DownloadsPage(QWidget):
         else:
             toast(f"❌ {msg}", T()['rd'])
 
+_HF_STATS = "⬇ {downloads:,}  ❤ {likes:,}  📅 {last_modified}"
+_STATS_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class HFResultsModel(QAbstractListModel):
+    """HF search results as a flat list model; a new search is one reset instead of a widget rebuild.
+    Each row's stats line is formatted once here, not on every repaint (hover repaints rows constantly)."""
+    def __init__(self): super().__init__(); self._rows = []; self._stats = []
+    def set_results(self, rows):
+        self.beginResetModel(); self._rows = list(rows); self._stats = [_HF_STATS.format_map(r) for r in self._rows]; self.endResetModel()
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._rows)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        r = self._rows[index.row()]
+        if role == Qt.ItemDataRole.UserRole: return r
+        if role == _STATS_ROLE: return self._stats[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole): return r["id"]
+        return None
+
+class HFResultDelegate(QStyledItemDelegate):
+    """Paints one HF result card (name, stats, tags, Show Files/Open buttons); only visible rows are drawn."""
+    sig_action = pyqtSignal(str, str)  # ("files"|"open", repo_id)
+    H = 84
+    BTNS = (("open", "🌐 Open", 78), ("files", "📂 Show Files", 112))
+    def _btn_rects(self, rect):
+        x = rect.right() - 12; y = rect.bottom() - 34; out = {}
+        for key, _, w in self.BTNS: x -= w; out[key] = QRect(x, y, w, 26); x -= 6
+        return out
+    def sizeHint(self, option, index): return QSize(option.rect.width(), self.H)
+    def paint(self, p, option, index):
+        r = index.data(Qt.ItemDataRole.UserRole); t = THEME
+        rc = option.rect.adjusted(0, 3, -6, -3)
+        p.save(); p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        hover = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        p.setPen(_qcolor(t['ac'] if hover else t['bd'])); p.setBrush(_qcolor(t['bg1'])); p.drawRoundedRect(QRectF(rc).adjusted(.5,.5,-.5,-.5), 10, 10)
+        f = QFont(option.font); f.setPixelSize(12); p.setFont(f); fm = QFontMetrics(f)
+        stats = index.data(_STATS_ROLE); sw = fm.horizontalAdvance(stats)
+        p.setPen(_qcolor(t['tx2'])); p.drawText(QRect(rc.right() - 12 - sw, rc.top() + 10, sw, 22), Qt.AlignmentFlag.AlignVCenter, stats)
+        f.setPixelSize(14); f.setBold(True); p.setFont(f); nw = rc.width() - sw - 36
+        p.setPen(_qcolor(t['ac'])); p.drawText(QRect(rc.left() + 12, rc.top() + 10, nw, 22), Qt.AlignmentFlag.AlignVCenter,
+                                              QFontMetrics(f).elidedText(r["id"], Qt.TextElideMode.ElideRight, nw))
+        btns = self._btn_rects(rc); f.setBold(False); f.setPixelSize(10); p.setFont(f); fm = QFontMetrics(f)
+        x = rc.left() + 12; y = rc.bottom() - 30; lim = min(b.left() for b in btns.values()) - 8
+        for tg in r.get("tags", [])[:5]:
+            w = fm.horizontalAdvance(tg) + 12
+            if x + w > lim: break
+            p.setPen(Qt.PenStyle.NoPen); p.setBrush(_qcolor(t['bg3'])); p.drawRoundedRect(QRectF(x, y, w, 18), 8, 8)
+            p.setPen(_qcolor(t['tx2'])); p.drawText(QRect(x, y, w, 18), Qt.AlignmentFlag.AlignCenter, tg); x += w + 4
+        f.setPixelSize(12); p.setFont(f)
+        for key, label, _ in self.BTNS:
+            b = btns[key]; p.setPen(_qcolor(t['bd'])); p.setBrush(_qcolor(t['bg2'])); p.drawRoundedRect(QRectF(b).adjusted(.5,.5,-.5,-.5), 6, 6)
+            p.setPen(_qcolor(t['tx'])); p.drawText(b, Qt.AlignmentFlag.AlignCenter, label)
+        p.restore()
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position().toPoint()
+            for key, b in self._btn_rects(option.rect.adjusted(0, 3, -6, -3)).items():
+                if b.contains(pos): self.sig_action.emit(key, index.data(Qt.ItemDataRole.UserRole)["id"]); return True
+        return False
+
 class HFSearchPage(QWidget):
     sig_dl = pyqtSignal(dict)
     def __init__(self, hw):
-        super().__init__(); self._hw = hw; self._worker = None; self._fw = None; t = T()
+        super().__init__(); self._hw = hw; self._worker = None; self._fw = None; self._files_repo = None; t = T()
         lo = QVBoxLayout(self); lo.setContentsMargins(16,12,16,8); lo.setSpacing(10)
         lo.addWidget(QLabel(f"<span style='font-size:18px;font-weight:bold;color:{t['ac']}'>🔍 HuggingFace Live Search</span>"))
         lo.addWidget(QLabel(f"<span style='color:{t['tx2']}'>Search 800K+ models. Results filtered to GGUF, sorted by downloads.</span>"))
         sr = QHBoxLayout(); sr.setSpacing(8)
         self._se = QLineEdit(); self._se.setPlaceholderText("Search models (e.g., 'qwen3', 'dolphin', 'coding')..."); self._se.setFixedHeight(40)
         self._se.returnPressed.connect(self._search); sr.addWidget(self._se, 1)
+        # Typing searches on its own after a 300 ms pause; Enter / the button still search at once
+        self._debounce = QTimer(self); self._debounce.setSingleShot(True); self._debounce.setInterval(300)
+        self._debounce.timeout.connect(self._search)
+        self._se.textChanged.connect(lambda q: self._debounce.start() if len(q.strip()) >= 2 else self._debounce.stop())
         self._sb = QPushButton("🔍 Search"); self._sb.setFixedHeight(40); self._sb.clicked.connect(self._search); sr.addWidget(self._sb)
         lo.addLayout(sr)
         self._status = QLabel(""); self._status.setStyleSheet(f"color:{t['tx2']};"); lo.addWidget(self._status)
-        sa = QScrollArea(); sa.setWidgetResizable(True); sa.setStyleSheet("QScrollArea{border:none;background:transparent;}")
-        self._sw = QWidget(); self._sl = QVBoxLayout(self._sw); self._sl.setSpacing(6); self._sl.setContentsMargins(0,0,6,0)
-        sa.setWidget(self._sw); lo.addWidget(sa, 1)
+        # Results are painted by a delegate; the files of the picked repo go in a small panel underneath
+        self._model = HFResultsModel(); self._dlg = HFResultDelegate(self)
+        self._dlg.sig_action.connect(lambda act, rid: self._load_files(rid) if act == "files" else QDesktopServices.openUrl(QUrl(f"https://huggingface.co/{rid}")))
+        self._view = QListView(); self._view.setModel(self._model); self._view.setItemDelegate(self._dlg)
+        self._view.setUniformItemSizes(True); self._view.setMouseTracking(True); self._view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel); self._view.setStyleSheet("QListView{border:none;background:transparent;}")
+        lo.addWidget(self._view, 1)
+        self._files_hdr = QLabel(); self._files_hdr.setVisible(False); lo.addWidget(self._files_hdr)
+        self._fsa = QScrollArea(); self._fsa.setWidgetResizable(True); self._fsa.setMaximumHeight(220); self._fsa.setVisible(False)
+        self._fsa.setStyleSheet("QScrollArea{border:none;background:transparent;}")
+        self._files = []; self._files_src = None; self._repo_files = {}  # repo id -> GGUF file list, fetched once
+        self._files_lbl = QLabel(); self._files_lbl.setTextFormat(Qt.TextFormat.RichText)
+        self._files_lbl.setAlignment(Qt.AlignmentFlag.AlignTop); self._files_lbl.setContentsMargins(12,4,0,0)
+        self._files_lbl.linkActivated.connect(self._on_file_link); self._fsa.setWidget(self._files_lbl); lo.addWidget(self._fsa)
     def _search(self):
-        q = self._se.text().strip()
+        self._debounce.stop(); q = self._se.text().strip()
         if not q: return
+        if self._worker: self._worker.cancel(); self._worker = None
         t = T(); self._status.setText(f"<span style='color:{t['og']}'>Searching HuggingFace for '{q}'...</span>"); self._sb.setEnabled(False)
-        self._worker = HFSearchWorker(q, 30); self._worker.sig_results.connect(self._show_results)
-        self._worker.sig_err.connect(self._show_err); self._worker.start()
+        hit = _search_cached(q, 30)
+        if hit is not None: QTimer.singleShot(0, lambda: self._show_results(hit)); return
+        self._worker = HFSearchWorker(q, 30); self._worker.sig_results.connect(self._show_results, _QUEUED)
+        self._worker.sig_err.connect(self._show_err, _QUEUED); self._worker.start()
     def _show_results(self, results):
         t = T(); self._sb.setEnabled(True)
-        while self._sl.count():
-            it = self._sl.takeAt(0)
-            if it.widget(): it.widget().deleteLater()
         self._status.setText(f"<span style='color:{t['gn']}'>{len(results)} GGUF repositories found</span>")
-        for r in results:
-            frm = QFrame(); frm.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:10px;padding:12px;}}")
-            fl = QVBoxLayout(frm); fl.setSpacing(4)
-            r1 = QHBoxLayout()
-            nm = QLabel(f"<span style='color:{t['ac']};font-size:14px;font-weight:bold'>{html_mod.escape(r['id'])}</span>")
-            nm.setTextFormat(Qt.TextFormat.RichText); r1.addWidget(nm); r1.addStretch()
-            r1.addWidget(QLabel(f"<span style='color:{t['tx2']};font-size:12px'>⬇ {r['downloads']:,}  ❤ {r['likes']:,}  📅 {r['last_modified']}</span>"))
-            fl.addLayout(r1)
-            tr = QHBoxLayout(); tr.setSpacing(4)
-            for tg in r.get("tags",[])[:5]:
-                lb = QLabel(tg); lb.setStyleSheet(f"background:{t['bg3']};color:{t['tx2']};padding:2px 6px;border-radius:8px;font-size:10px;"); lb.setFixedHeight(18); tr.addWidget(lb)
-            tr.addStretch()
-            btn = QPushButton("📂 Show Files"); btn.setFixedHeight(26); btn.setProperty("class","ghost")
-            repo_id = r["id"]; btn.clicked.connect(lambda _, rid=repo_id: self._load_files(rid)); tr.addWidget(btn)
-            hf_btn = QPushButton("🌐 Open"); hf_btn.setFixedHeight(26); hf_btn.setProperty("class","ghost")
-            hf_btn.clicked.connect(lambda _, rid=repo_id: QDesktopServices.openUrl(QUrl(f"https://huggingface.co/{rid}"))); tr.addWidget(hf_btn)
-            fl.addLayout(tr)
-            files_w = QWidget(); files_w.setVisible(False)
-            files_lo = QVBoxLayout(files_w); files_lo.setContentsMargins(12,4,0,0); files_lo.setSpacing(2)
-            frm._files_w = files_w; frm._files_lo = files_lo; frm._repo = r["id"]
-            fl.addWidget(files_w); self._sl.addWidget(frm)
-        self._sl.addStretch()
+        self._model.set_results(results); self._view.scrollToTop()
+        self._files_repo = None; self._files_hdr.setVisible(False); self._fsa.setVisible(False)
     def _load_files(self, repo_id):
-        for i in range(self._sl.count()):
-            w = self._sl.itemAt(i).widget()
-            if w and hasattr(w, '_repo') and w._repo == repo_id:
-                if w._files_w.isVisible(): w._files_w.setVisible(False); return
-                self._fw = HFFilesWorker(repo_id); self._fw.sig_files.connect(lambda rid, files: self._show_files(rid, files))
-                self._fw.sig_err.connect(self._show_err); self._fw.start(); return
+        if self._files_repo == repo_id and self._fsa.isVisible():
+            self._files_hdr.setVisible(False); self._fsa.setVisible(False); return
+        self._files_repo = repo_id
+        if repo_id in self._repo_files: self._show_files(repo_id, self._repo_files[repo_id]); return
+        self._fw = HFFilesWorker(repo_id); self._fw.sig_files.connect(lambda rid, files: self._show_files(rid, files), _QUEUED)
+        self._fw.sig_err.connect(self._show_err, _QUEUED); self._fw.start()
     def _show_files(self, repo_id, files):
-        t = T()
-        for i in range(self._sl.count()):
-            w = self._sl.itemAt(i).widget()
-            if w and hasattr(w, '_repo') and w._repo == repo_id:
-                while w._files_lo.count():
-                    it = w._files_lo.takeAt(0)
-                    if it.widget(): it.widget().deleteLater()
-                if not files: w._files_lo.addWidget(QLabel(f"<span style='color:{t['tx2']}'>No .gguf files found</span>"))
-                else:
-                    for f in files:
-                        fr = QHBoxLayout(); ql = f["quant"]
-                        qc = t['gn'] if ql in ("Q4_K_M","Q5_K_M","Q6_K") else t['og'] if "Q3" in ql or "Q4" in ql else t['tx2']
-                        sz_str = f" ({f['size']/(1024**3):.1f} GB)" if f.get('size') else ""
-                        sha = f.get("sha256", "")
-                        sha_short = f"  <span style='color:{t['tx3']};font-size:9px'>sha256:{sha[:12]}...</span>" if sha else ""
-                        fr.addWidget(QLabel(f"<span style='color:{qc};font-weight:bold;font-size:11px'>{ql}</span> "
-                            f"<span style='color:{t['tx2']};font-size:11px'>{html_mod.escape(f['name'])}{sz_str}</span>{sha_short}"))
-                        fr.addStretch()
-                        if sha:
-                            cpb = QPushButton("#"); cpb.setFixedSize(22, 22); cpb.setToolTip(f"Copy SHA256: {sha}")
-                            cpb.setStyleSheet(f"QPushButton{{background:{t['bg3']};color:{t['tx2']};font-size:9px;border-radius:4px;padding:0;}}QPushButton:hover{{background:{t['bg4']};}}")
-                            sha_val = sha
-                            cpb.clicked.connect(lambda _, s=sha_val: (QApplication.clipboard().setText(s), toast(f"SHA256 copied: {s[:20]}...")))
-                            fr.addWidget(cpb)
-                        db = QPushButton("⬇"); db.setFixedSize(30, 22)
-                        db.setStyleSheet(f"QPushButton{{background:{t['gn']};color:{t['bg0']};font-size:10px;border-radius:4px;font-weight:bold;padding:0;}}")
-                        fn = f["name"]; rid = repo_id
-                        db.clicked.connect(lambda _, r=rid, ff=fn: self.sig_dl.emit({"n":ff.split("/")[-1].replace(".gguf",""),"repo":r,"file":ff,"gb":0,"q":"","p":"","ctx":"","sc":0,"cat":"","lic":"","d":"HF download","tags":[]}))
-                        fr.addWidget(db); rw = QWidget(); rw.setLayout(fr); w._files_lo.addWidget(rw)
-                w._files_w.setVisible(True); return
+        self._repo_files[repo_id] = files
+        if repo_id != self._files_repo: return
+        t = T(); self._files = files; self._files_src = repo_id
+        self._files_hdr.setText(f"<span style='color:{t['ac']};font-weight:bold'>📂 {html_mod.escape(repo_id)}</span>")
+        # The whole file list is one rich-text label; ⬇ / # are links dispatched by _on_file_link
+        rows = []
+        for i, f in enumerate(files):
+            ql = f["quant"]
+            qc = t['gn'] if ql in ("Q4_K_M","Q5_K_M","Q6_K") else t['og'] if "Q3" in ql or "Q4" in ql else t['tx2']
+            sz_str = f" ({f['size']/(1024**3):.1f} GB)" if f.get('size') else ""
+            sha = f.get("sha256", "")
+            sha_cell = (f"<span style='color:{t['tx3']};font-size:9px'>sha256:{sha[:12]}...</span> "
+                        f"<a href='sha:{i}' style='color:{t['tx2']};text-decoration:none' title='Copy SHA256'>#</a>") if sha else ""
+            rows.append(f"<tr><td style='color:{qc};font-weight:bold;font-size:11px'>{ql}</td>"
+                        f"<td style='color:{t['tx2']};font-size:11px'>{html_mod.escape(f['name'])}{sz_str}</td><td>{sha_cell}</td>"
+                        f"<td><a href='dl:{i}' style='color:{t['gn']};font-weight:bold;text-decoration:none'>⬇</a></td></tr>")
+        self._files_lbl.setText(f"<table cellspacing='4'>{''.join(rows)}</table>" if rows
+                                else f"<span style='color:{t['tx2']}'>No .gguf files found</span>")
+        self._files_hdr.setVisible(True); self._fsa.setVisible(True)
+    def _on_file_link(self, href):
+        kind, _, i = href.partition(":"); f = self._files[int(i)]
+        if kind == "sha": QApplication.clipboard().setText(f["sha256"]); toast(f"SHA256 copied: {f['sha256'][:20]}..."); return
+        ff = f["name"]; self.sig_dl.emit({"n":ff.split("/")[-1].replace(".gguf",""),"repo":self._files_src,"file":ff,"gb":0,"q":"","p":"","ctx":"","sc":0,"cat":"","lic":"","d":"HF download","tags":[]})
     def _show_err(self, e):
         t = T(); self._sb.setEnabled(True); self._status.setText(f"<span style='color:{t['rd']}'>Error: {html_mod.escape(str(e)[:200])}</span>")
 
@@ -1635,7 +2196,7 @@ class BenchmarkPage(QWidget):
         self._prompt = QLineEdit("Write a detailed comparison of Python and JavaScript covering syntax, performance, and use cases.")
         self._prompt.setFixedHeight(36); lo.addWidget(self._prompt)
         # Result
-        self._result_frame = QFrame(); self._result_frame.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:10px;padding:16px;}}")
+        self._result_frame = QFrame(); self._result_frame.setStyleSheet(_ss_frame(current_theme, "bd", 10, 16))
         rfl = QVBoxLayout(self._result_frame)
         self._result_lbl = QLabel("Run a benchmark to see results."); self._result_lbl.setWordWrap(True)
         self._result_lbl.setTextFormat(Qt.TextFormat.RichText); rfl.addWidget(self._result_lbl)
@@ -1663,20 +2224,19 @@ class BenchmarkPage(QWidget):
         self._hist_tbl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self._hist_tbl.verticalHeader().setVisible(False); self._hist_tbl.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self._hist_tbl.setMaximumHeight(220); split.addWidget(self._hist_tbl, 1)
+        self._hist_data = deque(self._get_hist(), maxlen=30)
         lo.addLayout(split); lo.addStretch(); self._load_hist()
 
     def _check_ollama(self):
+        self._tags_wk = OllamaTagsWorker(); self._tags_wk.sig_done.connect(self._on_ollama_tags, _QUEUED); self._tags_wk.start()
+    def _on_ollama_tags(self, status, models):
         t = T()
-        try:
-            resp = requests.get("http://localhost:11434/api/tags", timeout=3)
-            if resp.ok:
-                data = resp.json(); models = [m["name"] for m in data.get("models",[])]
-                if models:
-                    self._ollama_status.setText(f"<span style='color:{t['gn']}'>✓ Ollama running. Models: {', '.join(models[:5])}</span>")
-                    if not self._model.text(): self._model.setText(models[0])
-                else: self._ollama_status.setText(f"<span style='color:{t['og']}'>⚠ Ollama running but no models. Run: ollama pull qwen3:8b</span>")
-            else: self._ollama_status.setText(f"<span style='color:{t['rd']}'>✗ Ollama not responding</span>")
-        except: self._ollama_status.setText(f"<span style='color:{t['rd']}'>✗ Ollama not running. Start with: ollama serve</span>")
+        if status == "ok" and models:
+            self._ollama_status.setText(f"<span style='color:{t['gn']}'>✓ Ollama running. Models: {html_mod.escape(', '.join(models[:5]))}</span>")
+            if not self._model.text(): self._model.setText(models[0])
+        elif status == "ok": self._ollama_status.setText(f"<span style='color:{t['og']}'>⚠ Ollama running but no models. Run: ollama pull qwen3:8b</span>")
+        elif status == "bad": self._ollama_status.setText(f"<span style='color:{t['rd']}'>✗ Ollama not responding</span>")
+        else: self._ollama_status.setText(f"<span style='color:{t['rd']}'>✗ Ollama not running. Start with: ollama serve</span>")
 
     def _run(self):
         t = T(); model = self._model.text().strip()
@@ -1684,7 +2244,8 @@ class BenchmarkPage(QWidget):
         self._run_btn.setEnabled(False); self._run_btn.setText("Running...")
         self._result_lbl.setText(f"<span style='color:{t['og']}'>⏳ Benchmarking {html_mod.escape(model)}... 10-30 seconds.</span>")
         self._worker = BenchWorker(model, "ollama", self._prompt.text())
-        self._worker.sig_done.connect(self._on_done); self._worker.sig_err.connect(self._on_err); self._worker.start()
+        self._worker.sig_partial.connect(lambda v: _set_text(self._run_btn, f"Running... {v} tok/s"), _QUEUED)
+        self._worker.sig_done.connect(self._on_done, _QUEUED); self._worker.sig_err.connect(self._on_err, _QUEUED); self._worker.start()
 
     def _pin_baseline(self):
         if self._last_result:
@@ -1727,9 +2288,8 @@ class BenchmarkPage(QWidget):
             f"<tr><td style='color:{t['tx2']}'>Total</td><td>{r['elapsed']}s</td></tr>"
             + (f"<tr><td style='color:{t['tx2']}'>GPU Power</td><td>{r.get('avg_watts',0)}W · {r.get('watts_per_1m',0):.0f}W per 1M tokens</td></tr>" if r.get('avg_watts',0) > 0 else "")
             + f"{cmp_html}</table>")
-        h = self._get_hist()
-        h.append({"model":r["model"],"tok_s":toks,"prefill_tok_s":prefill,"ttft":r["ttft"],"tokens":r["tokens"],"date":time.strftime("%Y-%m-%d %H:%M")})
-        self._save_hist(h); self._load_hist()
+        self._hist_data.append({"model":r["model"],"tok_s":toks,"prefill_tok_s":prefill,"ttft":r["ttft"],"tokens":r["tokens"],"date":time.strftime("%Y-%m-%d %H:%M")})
+        self._save_hist(); self._load_hist()
         toast(f"⚡ {r['model']}: {toks} tok/s ({lbl})", t[clr])
 
     def _on_err(self, e):
@@ -1737,38 +2297,34 @@ class BenchmarkPage(QWidget):
         self._result_lbl.setText(f"<span style='color:{t['rd']}'>❌ {html_mod.escape(str(e)[:300])}</span>")
     def _bench_file(self): return CFG_DIR / "benchmarks.json"
     def _get_hist(self):
-        try: return json.loads(self._bench_file().read_text())
+        try: return _loads(self._bench_file().read_text(encoding="utf-8"))
         except: return []
-    def _save_hist(self, h): self._bench_file().write_text(json.dumps(h[-30:], indent=2))
+    def _save_hist(self): _write_later(self._bench_file(), lambda: _dumps(list(self._hist_data)))
     def _load_hist(self):
-        t = T(); h = self._get_hist()
+        t = T(); h = list(self._hist_data); tbl = self._hist_tbl; hh = tbl.horizontalHeader()
+        # Fill with signals/updates off and Stretch suspended, so columns are sized once rather than per setItem
+        blk = QSignalBlocker(tbl); tbl.setUpdatesEnabled(False); hh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        try: self._fill_hist(t, h)
+        finally: hh.setSectionResizeMode(QHeaderView.ResizeMode.Stretch); tbl.setUpdatesEnabled(True); blk.unblock()
+        self._chart.set_data([{"model": e.get("model",""), "tok_s": e.get("tok_s",0)} for e in h[-8:]])
+    def _fill_hist(self, t, h):
         self._hist_tbl.setRowCount(len(h))
         base_toks = self._baseline["tok_s"] if self._baseline else 0
+        tbl = self._hist_tbl
         for i, e in enumerate(reversed(h)):
             toks = e.get("tok_s", 0); _, clr = self._hw.speed_label(toks)
             prefill = e.get("prefill_tok_s", 0)
-            self._hist_tbl.setItem(i, 0, QTableWidgetItem(e.get("model","")))
-            ti = QTableWidgetItem(f"{toks}"); ti.setForeground(QColor(t[clr])); self._hist_tbl.setItem(i, 1, ti)
-            pi = QTableWidgetItem(f"{prefill}" if prefill else "-"); pi.setForeground(QColor(t['tl'])); self._hist_tbl.setItem(i, 2, pi)
-            self._hist_tbl.setItem(i, 3, QTableWidgetItem(f"{e.get('ttft',0)}s"))
-            self._hist_tbl.setItem(i, 4, QTableWidgetItem(str(e.get("tokens",0))))
+            _set_cell(tbl, i, 0, e.get("model",""))
+            _set_cell(tbl, i, 1, f"{toks}", _qcolor(t[clr]))
+            _set_cell(tbl, i, 2, f"{prefill}" if prefill else "-", _qcolor(t['tl']))
+            _set_cell(tbl, i, 3, f"{e.get('ttft',0)}s")
+            _set_cell(tbl, i, 4, str(e.get("tokens",0)))
             # Compare vs baseline
             if base_toks > 0 and toks > 0:
                 diff = toks - base_toks; pct = round((diff / base_toks) * 100, 1); sign = "+" if diff >= 0 else ""
-                ci = QTableWidgetItem(f"{sign}{pct}%"); ci.setForeground(QColor(t['gn'] if diff >= 0 else t['rd']))
-                self._hist_tbl.setItem(i, 5, ci)
-            else:
-                self._hist_tbl.setItem(i, 5, QTableWidgetItem("-"))
-            self._hist_tbl.setItem(i, 6, QTableWidgetItem(e.get("date","")))
-        # Update chart
-        chart_data = [{"model": e.get("model",""), "tok_s": e.get("tok_s",0)} for e in h[-8:]]
-        lo = self._chart.parent().layout() if self._chart.parent() else None
-        old_chart = self._chart
-        self._chart = BenchChart(chart_data)
-        if lo:
-            for i in range(lo.count()):
-                if lo.itemAt(i).widget() == old_chart:
-                    lo.replaceWidget(old_chart, self._chart); old_chart.deleteLater(); break
+                _set_cell(tbl, i, 5, f"{sign}{pct}%", _qcolor(t['gn'] if diff >= 0 else t['rd']))
+            else: _set_cell(tbl, i, 5, "-")
+            _set_cell(tbl, i, 6, e.get("date",""))
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PRESETS PAGE
@@ -1805,26 +2361,33 @@ class PresetsPage(QWidget):
         sw = QWidget(); sl = QVBoxLayout(sw); sl.setSpacing(8); sl.setContentsMargins(0,0,6,0)
         mx = hw.max_model_gb()
         all_presets = dict(BUILTIN_PRESETS)
-        try: cp = json.loads((CFG_DIR / "custom_presets.json").read_text()); all_presets.update(cp)
+        try: cp = _loads((CFG_DIR / "custom_presets.json").read_text(encoding="utf-8")); all_presets.update(cp)
         except: pass
+        # Theme colours are baked into the per-row formats once; the loop only fills in the data
+        frm_css = _ss_frame(current_theme, "bd", 10, 14)
+        name_fmt = f"<span style='font-size:15px;font-weight:bold;color:{t['ac']}'>{{}}</span>"
+        desc_fmt = f"<span style='color:{t['tx2']}'>{{}}</span>"
+        sw_fmt = f"<span style='color:{t['tx2']};font-size:12px'>Software: <b>{{}}</b></span>"
+        miss_fmt = f"<span style='color:{t['tx3']}'>· {{}} (not in database)</span>"
+        row_fmt = f"<b>{{}}</b> <span style='color:{t['tx2']}'>{{}}GB · {{}}</span> <span style='color:{{}}'>~{{}} tok/s</span> {{}}"
+        fit_html = (f"<span style='color:{t['rd']}'>⚠ Too large</span>", f"<span style='color:{t['gn']}'>✓ Fits</span>")
+        db_css = f"QPushButton{{background:{t['gn']};color:{t['bg0']};font-size:11px;border-radius:4px;font-weight:bold;}}"
         for name, preset in all_presets.items():
-            frm = QFrame(); frm.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:10px;padding:14px;}}")
+            frm = QFrame(); frm.setStyleSheet(frm_css)
             fl = QVBoxLayout(frm); fl.setSpacing(6)
-            fl.addWidget(QLabel(f"<span style='font-size:15px;font-weight:bold;color:{t['ac']}'>{html_mod.escape(name)}</span>"))
-            fl.addWidget(QLabel(f"<span style='color:{t['tx2']}'>{html_mod.escape(preset['desc'])}</span>"))
-            fl.addWidget(QLabel(f"<span style='color:{t['tx2']};font-size:12px'>Software: <b>{html_mod.escape(preset['software'])}</b></span>"))
+            fl.addWidget(QLabel(name_fmt.format(_esc(name))))
+            fl.addWidget(QLabel(desc_fmt.format(_esc(preset['desc']))))
+            fl.addWidget(QLabel(sw_fmt.format(_esc(preset['software']))))
             for mn in preset["models"]:
-                m = next((x for x in MODEL_DB if x["n"] == mn), None)
-                if not m: fl.addWidget(QLabel(f"<span style='color:{t['tx3']}'>· {html_mod.escape(mn)} (not in database)</span>")); continue
+                m = _model_by_name(mn)
+                if not m: fl.addWidget(QLabel(miss_fmt.format(_esc(mn)))); continue
                 fits = m.get("gb",0) <= mx; toks = hw.estimate_toks(m["gb"], _parse_active_gb(m.get("p",""), m["gb"])); spd_lbl, spd_clr = hw.speed_label(toks)
-                fc = t['gn'] if fits else t['rd']; fi = "✓ Fits" if fits else "⚠ Too large"
                 row = QHBoxLayout()
-                row.addWidget(QLabel(f"<b>{html_mod.escape(m['n'])}</b> <span style='color:{t['tx2']}'>{m['gb']}GB · {m['p']}</span>"
-                    f" <span style='color:{t[spd_clr]}'>~{toks} tok/s</span> <span style='color:{fc}'>{fi}</span>"))
+                row.addWidget(QLabel(row_fmt.format(_esc(m['n']), m['gb'], m['p'], t[spd_clr], toks, fit_html[fits])))
                 row.addStretch()
                 if fits and m.get("repo"):
                     db = QPushButton("⬇"); db.setFixedSize(30,24)
-                    db.setStyleSheet(f"QPushButton{{background:{t['gn']};color:{t['bg0']};font-size:11px;border-radius:4px;font-weight:bold;}}")
+                    db.setStyleSheet(db_css)
                     db.clicked.connect(lambda _, md=m: self.sig_dl.emit(md)); row.addWidget(db)
                 rw = QWidget(); rw.setLayout(row); fl.addWidget(rw)
             sl.addWidget(frm)
@@ -1832,19 +2395,24 @@ class PresetsPage(QWidget):
     def _import(self):
         path, _ = QFileDialog.getOpenFileName(self, "Import Preset Pack", "", "JSON (*.json)")
         if not path: return
-        try:
-            data = json.loads(Path(path).read_text()); cp = {}
-            try: cp = json.loads((CFG_DIR / "custom_presets.json").read_text())
-            except: pass
-            cp.update(data); (CFG_DIR / "custom_presets.json").write_text(json.dumps(cp, indent=2))
-            toast(f"📥 Imported {len(data)} preset(s). Restart to see them.")
-        except Exception as e: toast(f"❌ Import failed: {e}", T()['rd'])
+        self._io = FileIOWorker(lambda: self._merge_pack(Path(path)))
+        self._io.sig_done.connect(lambda n: toast(f"📥 Imported {n} preset(s). Restart to see them."), _QUEUED)
+        self._io.sig_err.connect(lambda e: toast(f"❌ Import failed: {e}", T()['rd']), _QUEUED); self._io.start()
+    @staticmethod
+    def _merge_pack(path):
+        """Merge an exported pack into custom_presets.json (runs on the pool); returns the preset count."""
+        data = _loads(path.read_text(encoding="utf-8")); cp = {}
+        try: cp = _loads((CFG_DIR / "custom_presets.json").read_text(encoding="utf-8"))
+        except: pass
+        cp.update(data); (CFG_DIR / "custom_presets.json").write_text(_dumps(cp), encoding="utf-8")
+        return len(data)
     def _export(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export Custom Pack", "my_ai_pack.json", "JSON (*.json)")
         if not path: return
         pack = {"🔧 My Custom Pack": {"desc":"Custom model collection","models":[m["n"] for m in MODEL_DB[:3]],"software":"Any"}}
-        Path(path).write_text(json.dumps(pack, indent=2))
-        toast(f"📤 Exported to {Path(path).name}")
+        self._io = FileIOWorker(lambda: Path(path).write_text(_dumps(pack), encoding="utf-8"))
+        self._io.sig_done.connect(lambda _: toast(f"📤 Exported to {Path(path).name}"), _QUEUED)
+        self._io.sig_err.connect(lambda e: toast(f"❌ Export failed: {e}", T()['rd']), _QUEUED); self._io.start()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # FAVORITES PAGE
@@ -1870,33 +2438,38 @@ class FavoritesPage(QWidget):
         lo.addLayout(fl)
         sa = QScrollArea(); sa.setWidgetResizable(True); sa.setStyleSheet("QScrollArea{border:none;background:transparent;}")
         self._sw = QWidget(); self._sl = QVBoxLayout(self._sw); self._sl.setSpacing(6); self._sl.setContentsMargins(0,0,6,0)
-        sa.setWidget(self._sw); lo.addWidget(sa, 1)
+        sa.setWidget(self._sw); lo.addWidget(sa, 1); self._sa = sa
         self._refresh()
-    def showEvent(self, e): super().showEvent(e); self._refresh()
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self._shown != self._shown_key() or self._shown_db is not MODEL_DB: self._refresh()
+    def _shown_key(self):
+        """What the cards depend on: favorites/notes, theme, and the hardware behind their speed and fit lines."""
+        hw = self._hw
+        return (FavoritesManager._version, current_theme, hw.vram_gb, hw.total_vram_gb, hw.ram_gb, hw.mem_bw)
     def _refresh(self):
-        t = T()
-        while self._sl.count():
-            it = self._sl.takeAt(0)
-            if it.widget(): it.widget().deleteLater()
+        t = T(); self._shown = self._shown_key(); self._shown_db = MODEL_DB
+        self._sw, self._sl = _swap_body(self._sa, self._sw)
         favs = FavoritesManager.all_favs(); notes = FavoritesManager.all_notes()
         show_f = self._show_favs.isChecked(); show_n = self._show_notes.isChecked()
         names = set()
         if show_f: names.update(favs.keys())
         if show_n: names.update(notes.keys())
         if not show_f and not show_n: names = set(favs.keys()) | set(notes.keys())
-        models = sorted([m for m in MODEL_DB if m["n"] in names], key=lambda m: m["sc"], reverse=True)
+        models = [MODEL_DB[i] for i in sorted((_IDX_BY_NAME[n] for n in names if n in _IDX_BY_NAME), key=_SC_RANK.__getitem__)]
         self._cnt.setText(f"{len(models)} items")
         if not models:
             self._sl.addWidget(QLabel(f"<div style='text-align:center;padding:40px;color:{t['tx2']};font-size:14px'>"
                 f"No favorites yet. Click ☆ on any model card.</div>"))
+        wrap_css = _ss_frame(current_theme, "bd", 10, 4); note_fmt = f"<span style='color:{t['og']};font-size:12px'>📝 {{}}</span>"
         for m in models:
-            note = FavoritesManager.get_note(m["n"])
+            note = notes.get(m["n"])
             c = ModelCard(m, self._hw, show_speed=True); c.sig_dl.connect(self.sig_dl.emit)
             if note:
-                wrapper = QFrame(); wrapper.setStyleSheet(f"QFrame{{background:{t['bg1']};border:1px solid {t['bd']};border-radius:10px;padding:4px;}}")
+                wrapper = QFrame(); wrapper.setStyleSheet(wrap_css)
                 wl = QVBoxLayout(wrapper); wl.setContentsMargins(0,0,0,4); wl.setSpacing(2)
                 wl.addWidget(c)
-                nl = QLabel(f"<span style='color:{t['og']};font-size:12px'>📝 {html_mod.escape(note)}</span>")
+                nl = QLabel(note_fmt.format(html_mod.escape(note)))
                 nl.setStyleSheet(f"padding:4px 12px;"); wl.addWidget(nl)
                 self._sl.addWidget(wrapper)
             else: self._sl.addWidget(c)
@@ -1905,14 +2478,16 @@ class FavoritesPage(QWidget):
         path, _ = QFileDialog.getSaveFileName(self, "Export Favorites", "favorites.json", "JSON (*.json)")
         if not path: return
         data = {"favorites": list(FavoritesManager.all_favs().keys()), "notes": FavoritesManager.all_notes()}
-        Path(path).write_text(json.dumps(data, indent=2))
-        toast(f"📤 Exported favorites to {Path(path).name}")
+        self._io = FileIOWorker(lambda: Path(path).write_text(_dumps(data), encoding="utf-8"))
+        self._io.sig_done.connect(lambda _: toast(f"📤 Exported favorites to {Path(path).name}"), _QUEUED)
+        self._io.sig_err.connect(lambda e: toast(f"❌ Export failed: {e}", T()['rd']), _QUEUED); self._io.start()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # UPDATE TRACKER PAGE
 # ═══════════════════════════════════════════════════════════════════════════════
 class UpdateTrackerPage(QWidget):
     MANIFEST_FILE = CFG_DIR / "update_manifest.json"
+    _manifest = None  # name -> {repo, date, status}; read once, written behind
     def __init__(self):
         super().__init__(); t = T()
         lo = QVBoxLayout(self); lo.setContentsMargins(16,12,16,8); lo.setSpacing(10)
@@ -1925,103 +2500,140 @@ class UpdateTrackerPage(QWidget):
         self._tbl.verticalHeader().setVisible(False); self._tbl.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         lo.addWidget(self._tbl, 1); self._load()
     @classmethod
+    def _get_manifest(cls):
+        if cls._manifest is None:
+            try: cls._manifest = _loads(cls.MANIFEST_FILE.read_text(encoding="utf-8"))
+            except: cls._manifest = {}
+        return cls._manifest
+    @classmethod
     def register_download(cls, name, repo):
-        try: m = json.loads(cls.MANIFEST_FILE.read_text())
-        except: m = {}
+        m = cls._get_manifest()
         m[name] = {"repo": repo, "date": time.strftime("%Y-%m-%d %H:%M"), "status": "current"}
-        cls.MANIFEST_FILE.write_text(json.dumps(m, indent=2))
+        _write_later(cls.MANIFEST_FILE, lambda: _dumps(cls._manifest))
     def _load(self):
-        t = T()
-        try: m = json.loads(self.MANIFEST_FILE.read_text())
-        except: m = {}
-        self._tbl.setRowCount(len(m))
-        for i, (name, info) in enumerate(m.items()):
-            self._tbl.setItem(i, 0, QTableWidgetItem(name))
-            self._tbl.setItem(i, 1, QTableWidgetItem(info.get("repo","")))
-            self._tbl.setItem(i, 2, QTableWidgetItem(info.get("date","")))
-            si = QTableWidgetItem(info.get("status","current")); si.setForeground(QColor(t['gn'])); self._tbl.setItem(i, 3, si)
+        t = T(); m = self._get_manifest(); tbl = self._tbl; gn = _qcolor(t['gn'])
+        blk = QSignalBlocker(tbl)
+        with _updates_off(tbl):
+            tbl.setRowCount(len(m))
+            for i, (name, info) in enumerate(m.items()):
+                _set_cell(tbl, i, 0, name); _set_cell(tbl, i, 1, info.get("repo","")); _set_cell(tbl, i, 2, info.get("date",""))
+                _set_cell(tbl, i, 3, info.get("status","current"), gn)
+        blk.unblock()
     def _check_all(self):
         toast("🔄 Update checking — comparing against HuggingFace..."); self._load()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SOFTWARE PAGE
 # ═══════════════════════════════════════════════════════════════════════════════
+_TOOL_TABLE = [("Ollama","CLI+API","GGUF","CUDA/ROCm/Vulkan","⭐⭐⭐⭐⭐","Developers"),
+               ("LM Studio","GUI","GGUF/MLX","CUDA/AMD/Vulkan","⭐⭐⭐⭐⭐","Beginners"),
+               ("KoboldCpp",".exe","GGUF+SD+Whisper","CUDA/Vulkan","⭐⭐⭐⭐⭐","All-in-one"),
+               ("GPT4All","GUI","GGUF","CUDA/Vulkan","⭐⭐⭐⭐⭐","Non-tech"),
+               ("Jan","GUI","GGUF","CUDA/Vulkan","⭐⭐⭐⭐","ChatGPT-style"),
+               ("text-gen-webui","Web","All formats","CUDA/Vulkan","⭐⭐⭐⭐","Power users"),
+               ("Open WebUI","Web","Via Ollama","Via backend","⭐⭐⭐⭐","Multi-user"),
+               ("vLLM","API","safetensors/GPTQ","NVIDIA/AMD","⭐⭐⭐","Production"),
+               ("ComfyUI","Nodes","safetensors/GGUF","NVIDIA/AMD","⭐⭐⭐","Image gen"),
+               ("Fooocus","Web","SDXL","NVIDIA","⭐⭐⭐⭐⭐","Simple img"),
+               ("Stability Matrix","Pkg Mgr","All","N/A","⭐⭐⭐⭐⭐","Install all"),
+               ("Kokoro TTS","Lib","ONNX","CPU+GPU","⭐⭐⭐⭐","TTS"),
+               ("Whisper.cpp","CLI","GGML","CPU+CUDA","⭐⭐⭐⭐","STT"),
+               ("SillyTavern","Web","Via backend","Via backend","⭐⭐⭐⭐","Roleplay"),
+               ("Docker Model Runner","CLI+API","OCI/GGUF","CUDA/CPU","⭐⭐⭐","Containers"),
+               ("llama-server","CLI+API","GGUF","CUDA/Vulkan/CPU","⭐⭐⭐","OpenAI-compat")]
+
+class ToolTableModel(QAbstractTableModel):
+    """Software comparison table; cells are produced on demand, tool status comes from one detector snapshot."""
+    HEADERS = ("Tool","Type","Formats","GPU","Ease","Best For")
+    WIDTHS = (230, 80, 140, 150, 100)  # all but "Best For", which stretches
+    def __init__(self, rows, sw, parent=None):
+        super().__init__(parent); self._rows = rows
+        status = {k: ver for k, ok, ver in sw.state() if ok}
+        self._inst = {v: status[k] for v, *_ in rows if (k := SoftwareDetector.key_for(v)) in status}
+    def rowCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self._rows)
+    def columnCount(self, parent=QModelIndex()): return 0 if parent.isValid() else len(self.HEADERS)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        v = self._rows[index.row()][index.column()]; inst = index.column() == 0 and v in self._inst
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"✓ {v}" + (f" ({self._inst[v]})" if self._inst[v] else "") if inst else v
+        if role == Qt.ItemDataRole.ForegroundRole and inst: return _qcolor(THEME["gn"])
+        return None
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal: return self.HEADERS[section]
+        return None
+
 class SoftwarePage(QWidget):
     def __init__(self, sw):
         super().__init__(); t = T()
         lo = QVBoxLayout(self); lo.setContentsMargins(16,12,16,8)
         lo.addWidget(QLabel(f"<span style='font-size:18px;font-weight:bold;color:{t['ac']}'>⚙️ Software</span>"))
-        tbl = QTableWidget(); tbl.setColumnCount(6)
-        tbl.setHorizontalHeaderLabels(["Tool","Type","Formats","GPU","Ease","Best For"])
-        tbl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        tbl.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        tbl.verticalHeader().setVisible(False); tbl.setAlternatingRowColors(True)
-        tbl.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        data = [("Ollama","CLI+API","GGUF","CUDA/ROCm/Vulkan","⭐⭐⭐⭐⭐","Developers"),
-            ("LM Studio","GUI","GGUF/MLX","CUDA/AMD/Vulkan","⭐⭐⭐⭐⭐","Beginners"),
-            ("KoboldCpp",".exe","GGUF+SD+Whisper","CUDA/Vulkan","⭐⭐⭐⭐⭐","All-in-one"),
-            ("GPT4All","GUI","GGUF","CUDA/Vulkan","⭐⭐⭐⭐⭐","Non-tech"),
-            ("Jan","GUI","GGUF","CUDA/Vulkan","⭐⭐⭐⭐","ChatGPT-style"),
-            ("text-gen-webui","Web","All formats","CUDA/Vulkan","⭐⭐⭐⭐","Power users"),
-            ("Open WebUI","Web","Via Ollama","Via backend","⭐⭐⭐⭐","Multi-user"),
-            ("vLLM","API","safetensors/GPTQ","NVIDIA/AMD","⭐⭐⭐","Production"),
-            ("ComfyUI","Nodes","safetensors/GGUF","NVIDIA/AMD","⭐⭐⭐","Image gen"),
-            ("Fooocus","Web","SDXL","NVIDIA","⭐⭐⭐⭐⭐","Simple img"),
-            ("Stability Matrix","Pkg Mgr","All","N/A","⭐⭐⭐⭐⭐","Install all"),
-            ("Kokoro TTS","Lib","ONNX","CPU+GPU","⭐⭐⭐⭐","TTS"),
-            ("Whisper.cpp","CLI","GGML","CPU+CUDA","⭐⭐⭐⭐","STT"),
-            ("SillyTavern","Web","Via backend","Via backend","⭐⭐⭐⭐","Roleplay"),
-            ("Docker Model Runner","CLI+API","OCI/GGUF","CUDA/CPU","⭐⭐⭐","Containers"),
-            ("llama-server","CLI+API","GGUF","CUDA/Vulkan/CPU","⭐⭐⭐","OpenAI-compat")]
-        tbl.setRowCount(len(data))
-        for i, row in enumerate(data):
-            for j, v in enumerate(row):
-                item = QTableWidgetItem(v)
-                if j==0:
-                    for k,inf in SoftwareDetector.TOOLS.items():
-                        if inf["name"]==v and sw.is_installed(k):
-                            ver = sw.get_version(k)
-                            item.setForeground(QColor(t["gn"]))
-                            item.setText(f"✓ {v}" + (f" ({ver})" if ver else ""))
-                tbl.setItem(i,j,item)
-            tbl.setRowHeight(i,36)
+        tbl = QTableView(); self._model = ToolTableModel(_TOOL_TABLE, sw, self); tbl.setModel(self._model)
+        # Fixed widths (last column takes the rest): the header never measures cell contents
+        hh = tbl.horizontalHeader(); hh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed); hh.setStretchLastSection(True)
+        for col, w in enumerate(ToolTableModel.WIDTHS): tbl.setColumnWidth(col, w)
+        tbl.verticalHeader().setVisible(False); tbl.verticalHeader().setDefaultSectionSize(36); tbl.setAlternatingRowColors(True)
+        tbl.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         lo.addWidget(tbl, 1)
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # GLOSSARY PAGE
 # ═══════════════════════════════════════════════════════════════════════════════
+_GLOSS_QSS = "QLabel#glossCard{{background:{bg2};border:1px solid {bd};border-radius:10px;padding:10px 14px;color:{tx};}}"
+_GLOSS_ROW = "<span style='color:{ac};font-weight:bold;font-size:14px'>{{term}}</span><br><span style='font-size:13px'>{{d}}</span>"
+
+_GLOSSARY = sorted([("GGUF","Standard single-file format for local LLMs."),("Quantization","Reducing precision (16→4 bit) to shrink size."),
+    ("Q4_K_M","Community default: ~4.83 bits, ~99% quality."),("Parameters","Weights in billions. 7B=7 billion."),
+    ("Context Window","Max text processed. 128K≈96K words."),("Token","~0.75 words."),("VRAM","GPU memory. Primary bottleneck."),
+    ("Inference","Generating output. tok/s=speed."),("MoE","Mixture of Experts. Subset activates per token."),
+    ("LoRA","Small adapter files to specialize models."),("Abliteration","Removing safety refusals from weights."),
+    ("Safetensors","Secure model format. No code execution."),("GPTQ","GPU-only quantization. Fast NVIDIA."),
+    ("AWQ","Better than GPTQ at 4-bit. GPU-only."),("EXL2","Fastest NVIDIA format. Arbitrary bpw."),
+    ("Stable Diffusion","Open image generation family."),("Flux","SOTA open image generation."),
+    ("HuggingFace","GitHub of AI. 800K+ models."),("Ollama","Docker-like CLI for LLMs."),
+    ("llama.cpp","Foundation library. Defines GGUF."),("Whisper","OpenAI STT. 99 languages."),
+    ("RAG","Feed documents into an LLM."),("SillyTavern","Popular RP/chat frontend."),
+    ("Chatbot Arena","6M+ human votes. Trusted ranking."),("GPU Offloading","Split model between GPU+RAM."),
+    ("CivitAI","Largest SD model community."),("Tokens/sec","Speed. 20+=conversational. <5=slow."),
+    ("imatrix","Calibration for extreme quantization."),("Memory Bandwidth","GB/s — determines inference speed."),
+    ("KV Cache","Memory storing conversation context during inference."),
+], key=lambda x:x[0].lower())
+# Escaped HTML and the lowercased search haystack per term, built once per process
+_GLOSSARY_PREP = [(html_mod.escape(term), html_mod.escape(d), f"{term}\n{d}".lower()) for term, d in _GLOSSARY]
+
 class GlossaryPage(QWidget):
     def __init__(self):
         super().__init__(); t = T()
         lo = QVBoxLayout(self); lo.setContentsMargins(16,12,16,8)
         lo.addWidget(QLabel(f"<span style='font-size:18px;font-weight:bold;color:{t['ac']}'>📚 Glossary</span>"))
         self._se = QLineEdit(); self._se.setPlaceholderText("🔍 Search terms..."); self._se.setFixedHeight(36); lo.addWidget(self._se)
-        self._br = QTextBrowser(); lo.addWidget(self._br, 1)
-        self._terms = sorted([("GGUF","Standard single-file format for local LLMs."),("Quantization","Reducing precision (16→4 bit) to shrink size."),
-            ("Q4_K_M","Community default: ~4.83 bits, ~99% quality."),("Parameters","Weights in billions. 7B=7 billion."),
-            ("Context Window","Max text processed. 128K≈96K words."),("Token","~0.75 words."),("VRAM","GPU memory. Primary bottleneck."),
-            ("Inference","Generating output. tok/s=speed."),("MoE","Mixture of Experts. Subset activates per token."),
-            ("LoRA","Small adapter files to specialize models."),("Abliteration","Removing safety refusals from weights."),
-            ("Safetensors","Secure model format. No code execution."),("GPTQ","GPU-only quantization. Fast NVIDIA."),
-            ("AWQ","Better than GPTQ at 4-bit. GPU-only."),("EXL2","Fastest NVIDIA format. Arbitrary bpw."),
-            ("Stable Diffusion","Open image generation family."),("Flux","SOTA open image generation."),
-            ("HuggingFace","GitHub of AI. 800K+ models."),("Ollama","Docker-like CLI for LLMs."),
-            ("llama.cpp","Foundation library. Defines GGUF."),("Whisper","OpenAI STT. 99 languages."),
-            ("RAG","Feed documents into an LLM."),("SillyTavern","Popular RP/chat frontend."),
-            ("Chatbot Arena","6M+ human votes. Trusted ranking."),("GPU Offloading","Split model between GPU+RAM."),
-            ("CivitAI","Largest SD model community."),("Tokens/sec","Speed. 20+=conversational. <5=slow."),
-            ("imatrix","Calibration for extreme quantization."),("Memory Bandwidth","GB/s — determines inference speed."),
-            ("KV Cache","Memory storing conversation context during inference."),
-        ], key=lambda x:x[0].lower())
-        self._se.textChanged.connect(self._r); self._r()
+        self._cnt = QLabel(); lo.addWidget(self._cnt)
+        sa = QScrollArea(); sa.setWidgetResizable(True); sa.setStyleSheet("QScrollArea{border:none;background:transparent;}")
+        self._body = QWidget()
+        bl = QVBoxLayout(self._body); bl.setSpacing(10); bl.setContentsMargins(0,0,6,0)
+        sa.setWidget(self._body); lo.addWidget(sa, 1)
+        # One label per term is built up front; filtering only toggles visibility, nothing is re-parsed
+        self._cards = []
+        for th, dh, hay in _GLOSSARY_PREP:
+            c = QLabel(); c.setObjectName("glossCard"); c.setWordWrap(True)
+            bl.addWidget(c); self._cards.append((hay, c))
+        bl.addStretch()
+        self._debounce = QTimer(self); self._debounce.setSingleShot(True); self._debounce.setInterval(120)
+        self._debounce.timeout.connect(self._r)
+        self._se.textChanged.connect(lambda _: self._debounce.start()); self.refresh_theme()
+    def refresh_theme(self):
+        """Re-apply the card sheet and term colours for the current theme (terms are only re-parsed here)."""
+        t = T(); self._body.setStyleSheet(_GLOSS_QSS.format_map(t)); row = _GLOSS_ROW.format_map(t)
+        for (th, dh, _), (_, c) in zip(_GLOSSARY_PREP, self._cards): c.setText(row.format(term=th, d=dh))
+        self._r()  # count label colour
+    @pyqtSlot()
     def _r(self):
-        t=T(); q=self._se.text().lower(); ps=[]
-        for term,d in self._terms:
-            if q and q not in term.lower() and q not in d.lower(): continue
-            ps.append(f"<div style='background:{t['bg2']};border:1px solid {t['bd']};border-radius:10px;padding:10px 14px;margin:5px 0;'>"
-                f"<span style='color:{t['ac']};font-weight:bold;font-size:14px'>{html_mod.escape(term)}</span><br>"
-                f"<span style='font-size:13px'>{html_mod.escape(d)}</span></div>")
-        self._br.setHtml(_html(f"<p style='color:{t['tx2']}'>{len(ps)} terms</p>{''.join(ps)}", t))
+        q = self._se.text().lower(); n = 0
+        with _updates_off(self._body):
+            for hay, c in self._cards:
+                hit = not q or q in hay; n += hit
+                if c.isVisibleTo(self._body) != hit: c.setVisible(hit)
+        _set_text(self._cnt, f"<span style='color:{T()['tx2']}'>{n} terms</span>")
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # COMMAND PALETTE (Ctrl+K)
@@ -2083,9 +2695,9 @@ class CommandPalette(QDialog):
         for label, action in actions:
             self._items.append({"type": "action", "label": label, "detail": "Action", "action": action})
         # Models
-        mx = self._hw.max_model_gb()
-        for m in MODEL_DB:
-            fits = "Fits" if m.get("gb", 0) <= mx else "Too large"
+        fit = _fit_mask(self._hw.max_model_gb())
+        for i, m in enumerate(MODEL_DB):
+            fits = "Fits" if fit[i] else "Too large"
             self._items.append({"type": "model", "label": f"{m['n']}  ({m['gb']}GB, {m['q']})",
                                 "detail": f"{m['cat']} · {fits}", "model": m})
 
@@ -2143,36 +2755,48 @@ class SidebarNav(QWidget):
     ]
 
     def __init__(self):
-        super().__init__(); t = T()
+        super().__init__()
         self.setFixedWidth(200)
-        self.setStyleSheet(f"background:{t['bg1']};border-right:1px solid {t['bd']};")
         lo = QVBoxLayout(self); lo.setContentsMargins(8,14,8,8); lo.setSpacing(2)
-        self._btns = []
+        self._btns = {}; self._hdrs = []; self._active = None  # page index -> button
         for icon, group, children in self.SECTIONS:
             if not children:
                 # Top-level page (Home)
                 btn = QPushButton(f"  {icon}  {group}"); btn.setFixedHeight(38)
                 btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                btn.setStyleSheet(self._btn_style(t, False))
-                btn.clicked.connect(lambda _, idx=0: self._select(idx))
-                lo.addWidget(btn); self._btns.append((btn, 0))
+                btn.setProperty("page_idx", 0); btn.clicked.connect(self._on_btn)
+                lo.addWidget(btn); self._btns[0] = btn
             else:
                 # Group header
-                hdr = QLabel(f"<span style='color:{t['tx3']};font-size:11px;font-weight:bold;text-transform:uppercase'>{icon} {group}</span>")
-                hdr.setStyleSheet("padding:12px 8px 4px 8px;"); lo.addWidget(hdr)
+                hdr = QLabel(); hdr.setStyleSheet("padding:12px 8px 4px 8px;"); lo.addWidget(hdr); self._hdrs.append((hdr, f"{icon} {group}"))
                 for label, idx in children:
                     btn = QPushButton(f"  {label}"); btn.setFixedHeight(34)
                     btn.setCursor(Qt.CursorShape.PointingHandCursor)
-                    btn.setStyleSheet(self._btn_style(t, False))
-                    btn.clicked.connect(lambda _, i=idx: self._select(i))
-                    lo.addWidget(btn); self._btns.append((btn, idx))
+                    btn.setProperty("page_idx", idx); btn.clicked.connect(self._on_btn)
+                    lo.addWidget(btn); self._btns[idx] = btn
         lo.addStretch()
-
-    def _btn_style(self, t, active):
+        self.refresh_theme()
+
+    def refresh_theme(self):
+        """Re-format the sidebar sheets for the current theme; page switches reuse the two button sheets."""
+        t = T(); self.setStyleSheet(f"background:{t['bg1']};border-right:1px solid {t['bd']};")
+        self._ss_idle, self._ss_active = self._btn_style(t, False), self._btn_style(t, True)
+        for hdr, text in self._hdrs:
+            hdr.setText(f"<span style='color:{t['tx3']};font-size:11px;font-weight:bold;text-transform:uppercase'>{text}</span>")
+        for bidx, btn in self._btns.items(): btn.setStyleSheet(self._ss_active if bidx == self._active else self._ss_idle)
+
+    @staticmethod
+    def _btn_style(t, active):
         if active:
             return f"QPushButton{{background:{t['bg2']};color:{t['ac']};border:none;border-radius:8px;text-align:left;padding:0 12px;font-weight:bold;font-size:13px;}}QPushButton:hover{{background:{t['bg3']};}}"
         return f"QPushButton{{background:transparent;color:{t['tx2']};border:none;border-radius:8px;text-align:left;padding:0 12px;font-size:13px;}}QPushButton:hover{{background:{t['bg2']};color:{t['tx']};}}"
 
+    @pyqtSlot()
+    def _on_btn(self):
+        """Shared clicked slot: the page index travels on the button itself."""
+        self._select(self.sender().property("page_idx"))
+
+    @pyqtSlot(int)
     def _select(self, idx):
         """Called by button clicks — updates styles AND emits signal."""
         self._highlight(idx)
@@ -2180,85 +2804,68 @@ class SidebarNav(QWidget):
 
     def _highlight(self, idx):
         """Update button styles without emitting signal."""
-        t = T()
-        for btn, bidx in self._btns:
-            btn.setStyleSheet(self._btn_style(t, bidx == idx))
+        if idx == self._active: return
+        if self._active in self._btns: self._btns[self._active].setStyleSheet(self._ss_idle)
+        if idx in self._btns: self._btns[idx].setStyleSheet(self._ss_active)
+        self._active = idx
 
     def select(self, idx):
         """External call — highlight only, no signal (avoids recursion)."""
         self._highlight(idx)
 
 class MainWindow(QMainWindow):
+    sig_hw_ready = pyqtSignal()
     def __init__(self):
         super().__init__()
         self.setWindowTitle(f"{APP} v{VERSION}")
         self.setMinimumSize(1200,750); self.resize(1440,900)
-        self._hw = HardwareInfo(); self._sw = SoftwareDetector()
+        self._hw = HardwareInfo(detect=False); self._sw = SoftwareDetector(detect=False)
         self._dl_queue = DownloadQueue()
         t = T(); cw = QWidget(); self.setCentralWidget(cw)
         ml = QVBoxLayout(cw); ml.setContentsMargins(0,0,0,0); ml.setSpacing(0)
         # Title bar
         tb = QWidget(); tb.setFixedHeight(52); tb.setStyleSheet(f"background:{t['bg1']};border-bottom:1px solid {t['bd']};")
         tbl = QHBoxLayout(tb); tbl.setContentsMargins(20,0,20,0)
-        tbl.addWidget(QLabel("<span style='font-size:22px'>🧭</span>"))
-        tbl.addWidget(QLabel(f"<span style='font-size:17px;font-weight:bold'>{APP}</span>"))
-        tbl.addWidget(QLabel(f"<span style='color:{t['tx3']};font-size:11px'>v{VERSION}</span>"))
+        tbl.addWidget(QLabel(f"<span style='font-size:22px'>🧭</span>&nbsp; <span style='font-size:17px;font-weight:bold'>{APP}</span>"
+                             f"&nbsp; <span style='color:{t['tx3']};font-size:11px'>v{VERSION}</span>"))
         tbl.addStretch()
-        tbl.addWidget(QLabel(f"<span style='color:{t['tx2']};font-size:12px'>Theme:</span>"))
-        tc = QComboBox(); tc.addItems(THEMES.keys()); tc.setCurrentText(current_theme); tc.setFixedWidth(140)
+        tc = QComboBox(); tc.addItems(THEMES.keys()); tc.setCurrentText(current_theme); tc.setFixedWidth(140); tc.setToolTip("Theme")
         tc.currentTextChanged.connect(self._theme); tbl.addWidget(tc)
         # HW refresh button
         hw_ref = QPushButton("🔄"); hw_ref.setFixedSize(30,30); hw_ref.setToolTip("Refresh hardware detection")
         hw_ref.setStyleSheet(f"QPushButton{{background:transparent;border:none;font-size:14px;}}QPushButton:hover{{background:{t['bg3']};border-radius:4px;}}")
         hw_ref.clicked.connect(self._refresh_hw); tbl.addWidget(hw_ref)
-        vr = f"{self._hw.vram_gb}GB" if self._hw.vram_gb>0 else "CPU"
-        self._hw_lbl = QLabel(f"<span style='color:{t['tx2']};font-size:12px'>{html_mod.escape(self._hw.gpu_name)} · {vr} · {self._hw.ram_gb}GB RAM</span>")
-        tbl.addWidget(self._hw_lbl)
+        self._hw_lbl = QLabel(f"<span style='color:{t['tx3']};font-size:12px'>Detecting hardware…</span>")
+        tbl.addWidget(self._hw_lbl); self._hw_key = None
         # Export profile button
         exp_btn = QPushButton("📋"); exp_btn.setFixedSize(30,30); exp_btn.setToolTip("Copy system profile to clipboard")
         exp_btn.setStyleSheet(f"QPushButton{{background:transparent;border:none;font-size:14px;}}QPushButton:hover{{background:{t['bg3']};border-radius:4px;}}")
         exp_btn.clicked.connect(self._export_profile); tbl.addWidget(exp_btn)
+        # HWDetectWorker is still writing self._hw: no refresh or profile export until it reports back
+        self._hw_btns = (hw_ref, exp_btn)
+        for b in self._hw_btns: b.setEnabled(False)
         ml.addWidget(tb)
         # Body: Sidebar + Pages
         body = QHBoxLayout(); body.setContentsMargins(0,0,0,0); body.setSpacing(0)
         self._sidebar = SidebarNav(); body.addWidget(self._sidebar)
         self._stack = QStackedWidget(); body.addWidget(self._stack, 1)
         bw = QWidget(); bw.setLayout(body); ml.addWidget(bw, 1)
-        # Build pages (order matches SidebarNav indices)
-        self._pages = {}
-        self._pages[0] = HomePage(self._hw, self._sw)
-        self._pages[1] = ModelsPage(self._hw)
-        self._pages[2] = RecommendPage(self._hw)
-        self._pages[3] = PresetsPage(self._hw)
-        self._pages[4] = HFSearchPage(self._hw)
-        self._pages[5] = DownloadsPage(self._hw, self._sw, self._dl_queue)
-        self._pages[6] = FavoritesPage(self._hw)
-        self._pages[7] = UpdateTrackerPage()
-        self._pages[8] = VRAMCalcPage(self._hw)
-        self._pages[9] = BenchmarkPage(self._hw, self._sw)
-        self._pages[10] = SoftwarePage(self._sw)
-        self._pages[11] = LearnPage()
-        self._pages[12] = GlossaryPage()
-        for i in range(13):
-            self._stack.addWidget(self._pages[i])
+        # Pages depend on detected hardware — show a placeholder until the worker reports back
+        self._pages = {}; self._page_factories = {}
+        self._placeholder = QLabel(f"<div style='text-align:center;color:{t['tx2']};font-size:16px'>🔍 Detecting hardware…</div>")
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter); self._stack.addWidget(self._placeholder)
         self._sidebar.sig_page.connect(self._go_page)
         self._sidebar.select(0)
-        # Connect download signals
-        dt = self._pages[5]
-        for idx in [1,2,3,4,6]:
-            p = self._pages[idx]
-            if hasattr(p, 'sig_dl'):
-                p.sig_dl.connect(lambda m, d=dt: (self._go_page(5), d.start_download(m)))
         # Status bar
         sb = QWidget(); sb.setFixedHeight(26); sb.setStyleSheet(f"background:{t['bg1']};border-top:1px solid {t['bd']};")
         sbl = QHBoxLayout(sb); sbl.setContentsMargins(16,0,16,0)
         self._status_lbl = QLabel(f"<span style='color:{t['tx3']};font-size:11px'>{len(MODEL_DB)} models · {len(BUILTIN_PRESETS)} packs · HF search · Benchmarks · Favorites</span>")
         sbl.addWidget(self._status_lbl); sbl.addStretch()
         # Download queue indicator in status bar
-        self._q_status = QLabel(""); self._q_status.setStyleSheet(f"color:{t['og']};font-size:11px;")
+        self._q_status = QLabel(""); self._q_dirty = False; self._q_status.setStyleSheet(f"color:{t['og']};font-size:11px;")
         sbl.addWidget(self._q_status)
         self._dl_queue.sig_queue_changed.connect(self._update_q_status)
-        self._dl_queue.sig_finished.connect(lambda m, p: self._update_tray_dl(m))
+        self._dl_queue.sig_finished.connect(self._update_tray_dl)
         ml.addWidget(sb)
         # Toast parent
         ToastManager.inst().set_parent(cw)
@@ -2271,8 +2878,56 @@ class MainWindow(QMainWindow):
         sbl.addWidget(self._cmd_hint)
         # Background model database update
         self._model_updater = ModelUpdateWorker()
-        self._model_updater.sig_updated.connect(self._on_models_updated)
+        self._model_updater.sig_updated.connect(self._on_models_updated, _QUEUED)
         self._model_updater.start()
+        # Hardware and software detection (registry/NVML/subprocess probes) run off the UI thread
+        self._hw_worker = HWDetectWorker(self._hw, self._sw)
+        self._hw_worker.sig_done.connect(self._on_hw_ready, _QUEUED)
+        self._hw_worker.start()
+
+    def _on_hw_ready(self, hw):
+        for b in self._hw_btns: b.setEnabled(True)
+        self._set_hw_label(hw)
+        self._build_pages()
+        self.sig_hw_ready.emit()
+
+    def _set_hw_label(self, hw):
+        """Title-bar hardware summary; skipped when the probed values (and theme) are unchanged."""
+        key = (hw.gpu_name, hw.vram_gb, hw.ram_gb, current_theme)
+        if key == self._hw_key: return
+        self._hw_key = key; t = T(); vr = f"{hw.vram_gb}GB" if hw.vram_gb>0 else "CPU"
+        self._hw_lbl.setText(f"<span style='color:{t['tx2']};font-size:12px'>{hw.gpu_name_html} · {vr} · {hw.ram_gb}GB RAM</span>")
+
+    def _build_pages(self):
+        # Page factories (order matches SidebarNav indices); each page is built on first visit.
+        # Downloads is built up front: it owns the queue UI and the other pages hand it their downloads.
+        hw, sw = self._hw, self._sw
+        self._page_factories = {0: lambda: HomePage(hw, sw), 1: lambda: ModelsPage(hw), 2: lambda: RecommendPage(hw),
+            3: lambda: PresetsPage(hw), 4: lambda: HFSearchPage(hw), 5: lambda: DownloadsPage(hw, sw, self._dl_queue),
+            6: lambda: FavoritesPage(hw), 7: UpdateTrackerPage, 8: lambda: VRAMCalcPage(hw),
+            9: lambda: BenchmarkPage(hw, sw), 10: lambda: SoftwarePage(sw), 11: LearnPage, 12: GlossaryPage}
+        self._stack.removeWidget(self._placeholder); self._placeholder.deleteLater()
+        for i in range(len(self._page_factories)):
+            self._stack.addWidget(QWidget())  # stub until the page is first shown
+        self._ensure_page(5); self._go_page(0)
+
+    def _ensure_page(self, idx):
+        """Build page idx from its factory on first use and swap it in for its stub."""
+        p = self._pages.get(idx)
+        if p is None and idx in self._page_factories:
+            p = self._pages[idx] = self._page_factories.pop(idx)()
+            stub = self._stack.widget(idx); self._stack.insertWidget(idx, p)
+            self._stack.removeWidget(stub); stub.deleteLater()
+            self._wire_dl(p)
+        return p
+
+    def _wire_dl(self, p):
+        """Route a freshly built page's download requests through the Downloads page."""
+        if hasattr(p, "sig_dl"): p.sig_dl.connect(self._on_sig_dl)
+
+    @pyqtSlot(dict)
+    def _on_sig_dl(self, m):
+        self._go_page(5); self._ensure_page(5).start_download(m)
 
     def _show_command_palette(self):
         dlg = CommandPalette(self._hw, self)
@@ -2287,57 +2942,89 @@ class MainWindow(QMainWindow):
         elif action == "theme_catppuccin": self._theme("Catppuccin Mocha")
         elif action == "theme_oled": self._theme("OLED Black")
 
+    @pyqtSlot(int)
     def _go_page(self, idx):
+        self._ensure_page(idx)
         self._stack.setCurrentIndex(idx)
         self._sidebar.select(idx)
 
+    @pyqtSlot(str)
     def _theme(self, n):
-        global current_theme; current_theme = n
-        QApplication.instance().setStyleSheet(_qss(THEMES[n]))
+        _set_theme(n)
+        QApplication.instance().setStyleSheet(_qss(THEME))
+        self._sidebar.refresh_theme()
+        for p in self._pages.values():
+            if hasattr(p, "refresh_theme"): p.refresh_theme()
+        if _TRAY is not None: _TRAY.setIcon(_tray_icon(THEME["ac"]))
         cfg = _load_cfg(); cfg["theme"] = n; _save_cfg(cfg)
 
     def _on_models_updated(self, new_data):
         global MODEL_DB
-        MODEL_DB = new_data
+        MODEL_DB = new_data; _index_models(MODEL_DB)
         t = T()
         self._status_lbl.setText(f"<span style='color:{t['tx3']};font-size:11px'>{len(MODEL_DB)} models · {len(BUILTIN_PRESETS)} packs · HF search · Benchmarks · Favorites</span>")
         toast(f"Model list updated: {len(MODEL_DB)} models", T()['gn'])
 
+    @pyqtSlot()
     def _refresh_hw(self):
-        self._hw.__init__()
-        t = T(); vr = f"{self._hw.vram_gb}GB" if self._hw.vram_gb>0 else "CPU"
-        self._hw_lbl.setText(f"<span style='color:{t['tx2']};font-size:12px'>{html_mod.escape(self._hw.gpu_name)} · {vr} · {self._hw.ram_gb}GB RAM</span>")
+        if not self._pages: return  # initial detection still running (palette action)
+        if not self._hw.refresh(): toast("Hardware info is already up to date"); return
+        if isinstance(self._pages.get(0), HomePage): self._pages[0].update_hw()
+        self._set_hw_label(self._hw)
         toast("🔄 Hardware refreshed!", T()['gn'])
 
+    @pyqtSlot()
     def _export_profile(self):
+        if not self._pages: return
         QApplication.clipboard().setText(self._hw.export_profile())
         toast("📋 System profile copied to clipboard!")
 
+    @pyqtSlot()
     def _update_q_status(self):
-        n = self._dl_queue.count
-        if n > 0: self._q_status.setText(f"⬇ {n} download{'s' if n>1 else ''}")
-        else: self._q_status.setText("")
+        # Hidden in the tray: defer the label rewrite to the next showEvent
+        if not self.isVisible(): self._q_dirty = True; return
+        self._q_dirty = False; n = self._dl_queue.count
+        _set_text(self._q_status, f"⬇ {n} download{'s' if n>1 else ''}" if n > 0 else "")
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self._q_dirty: self._update_q_status()
 
-    def _update_tray_dl(self, m):
-        if hasattr(QApplication.instance(), '_tray') and QApplication.instance()._tray:
-            QApplication.instance()._tray.showMessage(APP, f"✅ {m['n']} downloaded!", QSystemTrayIcon.MessageIcon.Information, 5000)
-            tray = QApplication.instance()._tray
-            tray.setToolTip(f"{APP} v{VERSION}")
+    @pyqtSlot(dict, str)
+    def _update_tray_dl(self, m, _path):
+        if _TRAY is not None:
+            _TRAY.showMessage(APP, f"✅ {m['n']} downloaded!", QSystemTrayIcon.MessageIcon.Information, 5000)
+            _TRAY.setToolTip(f"{APP} v{VERSION}")
+
+    @pyqtSlot(QSystemTrayIcon.ActivationReason)
+    def _on_tray_activated(self, reason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger: self.show()
 
     def closeEvent(self, event):
-        if hasattr(QApplication.instance(), '_tray') and QApplication.instance()._tray:
+        if _TRAY is not None:
             event.ignore(); self.hide()
-            QApplication.instance()._tray.showMessage(APP, "Running in background. Downloads continue.", QSystemTrayIcon.MessageIcon.Information, 3000)
+            _TRAY.showMessage(APP, "Running in background. Downloads continue.", QSystemTrayIcon.MessageIcon.Information, 3000)
         else: event.accept()
 
 
+_TRAY = None  # the app's QSystemTrayIcon, set once by main()
+
+def _tray_icon(accent):
+    """Tray icon in the theme accent; the painted pixmap is kept in QPixmapCache so each accent is drawn once."""
+    key = f"tray:{accent}"; px = QPixmapCache.find(key)
+    if px is None or px.isNull():
+        px = QPixmap(32, 32); px.fill(_qcolor(accent))
+        p = QPainter(px); p.setPen(_qcolor("#fff")); f = p.font(); f.setPixelSize(20); f.setBold(True); p.setFont(f)
+        p.drawText(px.rect(), Qt.AlignmentFlag.AlignCenter, "🧭"); p.end()
+        QPixmapCache.insert(key, px)
+    return QIcon(px)
+
 def main():
-    global current_theme
     os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
     QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
     app = QApplication(sys.argv)
     cfg = _load_cfg()
-    if cfg.get("theme") and cfg["theme"] in THEMES: current_theme = cfg["theme"]
+    if cfg.get("theme") and cfg["theme"] in THEMES: _set_theme(cfg["theme"])
     app.setStyleSheet(_qss(T()))
     font = app.font(); font.setPointSize(10)
     for fam in ["Segoe UI Variable","Segoe UI","SF Pro Display"]:
@@ -2348,24 +3035,23 @@ def main():
 
     # System tray
     tray = QSystemTrayIcon()
-    px = QPixmap(32, 32); px.fill(QColor(T()["ac"]))
-    p = QPainter(px); p.setPen(QColor("#fff")); f = p.font(); f.setPixelSize(20); f.setBold(True); p.setFont(f)
-    p.drawText(px.rect(), Qt.AlignmentFlag.AlignCenter, "🧭"); p.end()
-    tray.setIcon(QIcon(px)); tray.setToolTip(f"{APP} v{VERSION}")
+    tray.setIcon(_tray_icon(T()["ac"])); tray.setToolTip(f"{APP} v{VERSION}")
     tray_menu = QMenu()
-    app._tray = tray
+    global _TRAY; _TRAY = tray
 
     w = MainWindow()
     tray_menu.addAction("Show", w.show)
-    tray_menu.addAction("Quit", lambda: (app._tray.hide(), app.quit()))
+    tray_menu.addAction("Quit", lambda: (tray.hide(), app.quit()))
     tray.setContextMenu(tray_menu)
-    tray.activated.connect(lambda r: w.show() if r == QSystemTrayIcon.ActivationReason.Trigger else None)
+    tray.activated.connect(w._on_tray_activated)
     tray.show()
 
-    # First-run wizard
-    if not cfg.get("wizard_done"):
+    # First-run wizard — needs detected hardware, so it opens once the window reports ready
+    def _first_run():
+        if _load_cfg().get("wizard_done"): return
         wiz = WizardDialog(w._hw, w); wiz.exec()
-        cfg = _load_cfg(); cfg["show_onboarding"] = True; _save_cfg(cfg)
+        c = _load_cfg(); c["show_onboarding"] = True; _save_cfg(c)
+    w.sig_hw_ready.connect(_first_run)
 
     w.show()
     sys.exit(app.exec())